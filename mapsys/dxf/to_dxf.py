@@ -15,20 +15,28 @@ from __future__ import annotations
 import logging
 import math
 import os
+import pickle
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import compress, repeat
+from operator import attrgetter
 from pathlib import Path
-from typing import TYPE_CHECKING, Iterable
+from typing import TYPE_CHECKING, Any, Iterable, Sequence, cast
 
 from attrs import define
-from ezdxf import zoom
+from ezdxf import bbox, zoom
 from ezdxf.document import Drawing
+from ezdxf.entities.lwpolyline import LWPolyline, LWPolylinePoints
 from ezdxf.layouts.layout import Layout
-from ezdxf.lldxf.const import VALID_DXF_LINEWEIGHTS
+from ezdxf.lldxf.const import DXF2000, VALID_DXF_LINEWEIGHTS, DXFVersionError
+from ezdxf.math import BoundingBox2d, Vec2, Vec3
 
 from mapsys.dxf.dxf_colors import set_layer_color_from_index
 from mapsys.parser.ar5_polys import Ar5Data
 from mapsys.parser.n05_points import No5Coord
 
 if TYPE_CHECKING:
+    from ezdxf.entities import Insert
     from ezdxf.sections.table import LayerTable
 
     from mapsys.parser.content import Content
@@ -39,12 +47,212 @@ BLOCK_SOURCE = "MapSys"
 BLOCK_ROTATION = 0.0
 ATTRIB_HEIGHT = 0.25
 
+# One ATTRIB of a point insert, relative to the insert point: tag, text
+# used when the tag is not filled, position in ``tags`` (or ``None``),
+# insert and align point offsets, and the remaining DXF attributes.
+AttribPrototype = tuple[str, str, "int | None", Vec3, "Vec3 | None", dict]
+
+# Uppercase block name -> ATTDEF tags of the block.
+AttdefTags = dict[str, frozenset[str]]
+
+# Write buffer used when saving DXF files.
+SAVE_BUFFER_SIZE = 1 << 20
+
+# Runs the saves started by ``Builder.to_dxf_async``, one at a time.
+_SAVE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dxf")
+
 LAYER_PREFIX = "MapSys"
 POINT_SUFFIX = "points"
 LINE_SUFFIX = "lines"
 TEXT_SUFFIX = "text"
 
 
+def _lineweight_table() -> tuple[int, ...]:
+    """Return the DXF lineweight constant of every MapSys weight.
+
+    Weights 0 and 1 map to the thinnest lineweight, 2 and 3 to two fixed
+    steps, and 4 to 255 are binned evenly over the remaining lineweights.
+
+    Returns:
+        The lineweights, indexed by MapSys weight in the [0, 255] range.
+    """
+    to_split = VALID_DXF_LINEWEIGHTS[9:]
+    n = len(to_split)
+    return (
+        VALID_DXF_LINEWEIGHTS[1],
+        VALID_DXF_LINEWEIGHTS[1],
+        VALID_DXF_LINEWEIGHTS[4],
+        VALID_DXF_LINEWEIGHTS[8],
+    ) + tuple(to_split[(value * n) // 253] for value in range(252))
+
+
+# DXF lineweight of each MapSys weight, indexed by the weight.
+_LINEWEIGHTS = _lineweight_table()
+
+
+def _simplify_vertices(
+    verts: list[tuple[float, float]], tolerance: float
+) -> list[tuple[float, float]]:
+    """Simplify a polyline with the Ramer-Douglas-Peucker algorithm.
+
+    Duplicate consecutive vertices are dropped first. The end points are
+    always kept, so closed polylines stay closed; rings that would collapse
+    to fewer than three distinct vertices are returned without the
+    tolerance step. A polyline whose vertices all coincide comes back as a
+    single vertex.
+
+    Args:
+        verts: The polyline vertices; at least two.
+        tolerance: Largest distance of a dropped vertex from the result.
+
+    Returns:
+        A new list with the kept vertices, in order.
+    """
+    unique = [verts[0]]
+    for vertex in verts[1:]:
+        if vertex != unique[-1]:
+            unique.append(vertex)
+    if len(unique) < 3:
+        return unique
+
+    # Iterative RDP: split every span at its farthest vertex while that
+    # vertex is farther than the tolerance from the span's chord.
+    keep = bytearray(len(unique))
+    keep[0] = keep[-1] = 1
+    spans = [(0, len(unique) - 1)]
+    while spans:
+        first, last = spans.pop()
+        x1, y1 = unique[first]
+        dx = unique[last][0] - x1
+        dy = unique[last][1] - y1
+        chord = math.hypot(dx, dy)
+        farthest, index = -1.0, first
+        for i in range(first + 1, last):
+            x, y = unique[i]
+            if chord:
+                dist = abs(dy * (x - x1) - dx * (y - y1)) / chord
+            else:
+                dist = math.hypot(x - x1, y - y1)
+            if dist > farthest:
+                farthest, index = dist, i
+        if farthest > tolerance:
+            keep[index] = 1
+            spans.append((first, index))
+            spans.append((index, last))
+
+    result = list(compress(unique, keep))
+    if unique[0] == unique[-1] and len(result) < 4:
+        return unique
+    return result
+
+
+def _add_lwpolyline(
+    msp: "Layout",
+    verts: list[tuple[float, float]],
+    closed: bool,
+    dxfattribs: dict[str, str],
+) -> LWPolyline:
+    """Add an LWPOLYLINE through ``verts`` to ``msp``.
+
+    Same as ``msp.add_lwpolyline(verts, format="xy", close=closed,
+    dxfattribs=dxfattribs)``, but the vertex array is built in one go;
+    ezdxf appends (and reallocates) it vertex by vertex.
+
+    Args:
+        msp: The layout to add the polyline to.
+        verts: The (x, y) vertices.
+        closed: Whether the polyline is closed.
+        dxfattribs: The DXF attributes; the dict is not kept.
+
+    Returns:
+        The new polyline.
+
+    Throws:
+        DXFVersionError: If the document is older than DXF R2000.
+    """
+    if msp.dxfversion < DXF2000:
+        raise DXFVersionError("LWPOLYLINE requires DXF R2000")
+    line = cast(LWPolyline, msp.new_entity("LWPOLYLINE", dxfattribs))
+    line.lwpoints = LWPolylinePoints([(x, y, 0.0, 0.0, 0.0) for x, y in verts])
+    line.closed = closed
+    return line
+
+
+def _attdef_tags(doc: Drawing) -> AttdefTags:
+    """Collect the ATTDEF tags of every block in ``doc``.
+
+    Args:
+        doc: The drawing to inspect.
+
+    Returns:
+        Uppercase block name -> tags of the block's ATTDEF entities.
+    """
+    return {
+        block.name.upper(): frozenset(
+            attdef.dxf.tag for attdef in block.query("ATTDEF")
+        )
+        for block in doc.blocks
+    }
+
+
+@lru_cache(maxsize=8)
+def _template_snapshot(
+    path: str, mtime_ns: int, size: int
+) -> tuple[bytes | None, AttdefTags]:
+    """Parse a DXF template once and keep it as a pickle.
+
+    The stamp arguments are only part of the cache key, so that an edited
+    template is parsed again. The result is shared; do not modify it.
+
+    Args:
+        path: Path of the template DXF file.
+        mtime_ns: Modification time of the file.
+        size: Size of the file in bytes.
+
+    Returns:
+        The pickled ``Drawing`` (``None`` if it can not be pickled) and the
+        ATTDEF tags of its blocks.
+    """
+    # Local import to appease linters
+    from ezdxf import recover as _recover
+
+    doc, _auditor = _recover.readfile(path)
+    tags = _attdef_tags(doc)
+    try:
+        return pickle.dumps(doc, protocol=pickle.HIGHEST_PROTOCOL), tags
+    except Exception as e:
+        logger.debug("DXF template %s can not be cached: %s", path, e)
+        return None, tags
+
+
+def _load_template(dxf_template: Path) -> tuple[Drawing, AttdefTags]:
+    """Load a DXF template, reusing an earlier parse of the same file.
+
+    Parsing a template is much slower than restoring it from a pickle, so
+    each template is parsed once per process (while its size and
+    modification time stay the same) and every call gets its own copy.
+
+    Args:
+        dxf_template: Path to the template DXF file.
+
+    Returns:
+        A new ``Drawing`` that the caller may modify, and the ATTDEF tags of
+        the template's blocks (shared; do not modify).
+    """
+    path = dxf_template.as_posix()
+    st = os.stat(path)
+    snapshot, tags = _template_snapshot(path, st.st_mtime_ns, st.st_size)
+    if snapshot is not None:
+        doc: Drawing = pickle.loads(snapshot)
+        return doc, tags
+
+    # Prefer recover.readfile() for robust loading of DXF files.
+    from ezdxf import recover as _recover
+
+    doc, _auditor = _recover.readfile(path)
+    return doc, tags
+
+
 @define
 class Builder:
     """Builds DXF documents from parsed MapSys content.
@@ -66,6 +274,9 @@ class Builder:
             instead of MapSys-defined colors.
         segregate_by_object_type: If True, suffix layer names with the
             object type (points/lines/text) to split content by type.
+        simplify_tolerance: If set, polylines drop duplicate consecutive
+            vertices and vertices closer than this distance to the
+            simplified line (Ramer-Douglas-Peucker).
     """
 
     mapsys: "Content"
@@ -77,6 +288,7 @@ class Builder:
     open_after_save: bool = False
     random_colors: bool = False
     segregate_by_object_type: bool = True
+    simplify_tolerance: float | None = None
 
     @classmethod
     def convert(
@@ -93,6 +305,7 @@ class Builder:
         open_after_save: bool = False,
         random_colors: bool = False,
         segregate_by_object_type: bool = True,
+        simplify_tolerance: float | None = None,
     ) -> Drawing:
         """Construct a Builder and run the conversion.
 
@@ -109,6 +322,8 @@ class Builder:
             random_colors: If True, assign random colors to layers.
             segregate_by_object_type: If True, suffix layer names with the
                 object type (``points``/``lines``/``text``).
+            simplify_tolerance: If set, simplify polylines with this
+                distance tolerance.
 
         Returns:
             The in-memory DXF document instance.
@@ -123,6 +338,7 @@ class Builder:
             open_after_save=open_after_save,
             random_colors=random_colors,
             segregate_by_object_type=segregate_by_object_type,
+            simplify_tolerance=simplify_tolerance,
         )
         return builder.to_dxf(
             dxf_template=dxf_template,
@@ -169,7 +385,8 @@ class Builder:
 
         If the target file exists, it is renamed to ``.bak1`` and older backups
         are shifted up (``.bak1`` -> ``.bak2`` etc.). The oldest backup
-        exceeding the limit is removed.
+        exceeding the limit is removed. The existing backups are found with
+        one directory scan, so only files that are present are touched.
 
         Args:
             dxf_path: The destination DXF path that may be overwritten.
@@ -183,10 +400,27 @@ class Builder:
 
             # Backups use the base file name without extension, e.g. out.bak1
             backup_base = dxf_path.with_name(dxf_path.stem)
+            prefix = os.path.normcase(backup_base.with_suffix(".bak").name)
+
+            # Collect the numbers of the backups that exist; names are
+            # compared the way the platform does (case-blind on Windows).
+            present: set[int] = set()
+            with os.scandir(dxf_path.parent) as entries:
+                for entry in entries:
+                    name = os.path.normcase(entry.name)
+                    suffix = name[len(prefix) :]
+                    if (
+                        name.startswith(prefix)
+                        and suffix.isascii()
+                        and suffix.isdigit()
+                        and not suffix.startswith("0")
+                        and int(suffix) <= max_backups
+                    ):
+                        present.add(int(suffix))
 
             # Delete the oldest backup if it exists to make room.
-            oldest = backup_base.with_suffix(f".bak{max_backups}")
-            if oldest.exists():
+            if max_backups in present:
+                oldest = backup_base.with_suffix(f".bak{max_backups}")
                 try:
                     oldest.unlink()
                 except Exception:
@@ -195,21 +429,20 @@ class Builder:
                     )
 
             # Shift backups in descending order to avoid overwriting.
-            for idx in range(max_backups - 1, 0, -1):
+            for idx in sorted(present - {max_backups}, reverse=True):
                 src = backup_base.with_suffix(f".bak{idx}")
                 dst = backup_base.with_suffix(f".bak{idx + 1}")
-                if src.exists():
-                    try:
-                        src.rename(dst)
-                    except Exception:
-                        logger.exception(
-                            "Failed rotating backup %s -> %s", src, dst
-                        )
+                try:
+                    os.replace(src, dst)
+                except Exception:
+                    logger.exception(
+                        "Failed rotating backup %s -> %s", src, dst
+                    )
 
             # Finally rename the current file to first backup
             # (e.g. out -> out.bak1).
             try:
-                dxf_path.rename(backup_base.with_suffix(".bak1"))
+                os.replace(dxf_path, backup_base.with_suffix(".bak1"))
             except Exception:
                 logger.exception(
                     "Failed creating first backup for %s", dxf_path
@@ -223,7 +456,7 @@ class Builder:
     @staticmethod
     def _iter_poly_vertices(
         ar: Iterable[Ar5Data],
-        verticels: list[int],
+        verticels: Sequence[int],
         points: list[No5Coord],
     ) -> Iterable[tuple[Ar5Data, list[tuple[float, float]]]]:
         """Yield vertex lists for each polyline described by AR5/AS5 tables.
@@ -234,13 +467,18 @@ class Builder:
             points: Parsed NO5 coordinates list.
 
         Yields:
-            polyline metadata entry and the lists of ``(x, y)`` pairs for each
-            line that has at least two points.
+            polyline metadata entry and a new list of ``(x, y)`` pairs for
+            each line that has at least two points; callers may modify it.
         """
 
         num_offsets = len(verticels)
         num_points = len(points)
 
+        # Convert every point once; polylines then gather shared tuples by
+        # index instead of reading attributes per vertex.
+        coords = [(float(pt.east), float(pt.north)) for pt in points]
+        gather = coords.__getitem__
+
         for entry in ar:
             start = entry.vertex_offset
             count = entry.vertex_count
@@ -262,19 +500,23 @@ class Builder:
                 continue
 
             end = min(start + count, num_offsets)
-            vertices: list[tuple[float, float]] = []
+            offsets = verticels[start:end]
 
-            # Build vertices by mapping offsets to point indices.
-            for off in verticels[start:end]:
-                if off >= num_points:
-                    logger.warning(
-                        "Offset %d is out of range for %d points",
-                        off,
-                        num_points,
-                    )
-                    continue
-                point = points[off]
-                vertices.append((float(point.east), float(point.north)))
+            # Build vertices by mapping offsets to point indices; the
+            # per-offset check only runs when some offset is out of range.
+            if max(offsets) < num_points:
+                vertices = list(map(gather, offsets))
+            else:
+                vertices = []
+                for off in offsets:
+                    if off >= num_points:
+                        logger.warning(
+                            "Offset %d is out of range for %d points",
+                            off,
+                            num_points,
+                        )
+                        continue
+                    vertices.append(coords[off])
 
             # Only lines with at least two vertices are meaningful in DXF.
             if len(vertices) >= 2:
@@ -303,13 +545,12 @@ class Builder:
         added_layers = set()
 
         # Load DXF template into memory.
-        # Prefer recover.readfile() for robust loading of DXF files.
-        # Local import to appease linters
-        from ezdxf import recover as _recover
-
-        doc, _auditor = _recover.readfile(dxf_template.as_posix())
+        doc, attdef_tags = _load_template(dxf_template)
         msp = doc.modelspace()
 
+        # Extents of what the template already holds; usually little.
+        template_box = bbox.extents(msp, fast=True)
+
         # Insert a block for each point with the NAME attribute set.
         block_exists = self.point_block in doc.blocks
         if not block_exists:
@@ -321,9 +562,7 @@ class Builder:
                 self.point_block,
             )
         else:
-            attributes = set()
-            for attdef in doc.blocks[self.point_block].query("ATTDEF"):
-                attributes.add(attdef.dxf.tag)
+            attributes = attdef_tags.get(self.point_block.upper(), frozenset())
             for a_name in (
                 self.point_name_attrib,
                 self.point_source_attrib,
@@ -345,9 +584,11 @@ class Builder:
         added_layers.update(self.insert_lines(msp))
         added_layers.update(self.insert_texts(msp))
 
-        # Get the layer table
-        for ly in added_layers:
-            doc.layers.add(ly)
+        # Add the layers the template does not have yet (names compare
+        # case-blind), in sorted order so the layer table is reproducible.
+        for ly in sorted(added_layers):
+            if ly not in doc.layers:
+                doc.layers.add(ly)
 
         if self.random_colors:
             self.set_random_colors(doc.layers)
@@ -355,27 +596,105 @@ class Builder:
             self.set_mapsys_colors(doc.layers)
         self.set_line_weights(doc.layers)
 
-        # Zoom to extents to make the content visible by default.
-        zoom.extents(msp)
+        # Zoom to extents to make the content visible by default. The
+        # extents come from the source coordinates, so the (possibly huge)
+        # entity space is not traversed again.
+        box = self._content_extents()
+        if template_box.has_data:
+            box.extend([Vec2(template_box.extmin), Vec2(template_box.extmax)])
+        if box.has_data:
+            extmin, extmax = box.extmin, box.extmax
+            if max(box.size) < ATTRIB_HEIGHT:
+                # Content at a single spot has no size; zoom.window would
+                # write an empty view, so show a small area around it.
+                half = Vec2(ATTRIB_HEIGHT, ATTRIB_HEIGHT) / 2
+                extmin, extmax = box.center - half, box.center + half
+            zoom.window(msp, extmin, extmax)
 
         # Save the result if a path was provided.
         if dxf_path is not None:
-            # Rotate existing DXF backups before overwriting the file.
-            self._rotate_dxf_backups(dxf_path, max_backups=10)
-            doc.saveas(dxf_path.as_posix())
-            if self.open_after_save:
-                # Use getattr to avoid mypy issues on non-Windows platforms
-                startfile = getattr(os, "startfile", None)
-                if callable(startfile):
-                    try:
-                        startfile(dxf_path.as_posix())
-                    except Exception:
-                        logger.exception(
-                            "Failed opening DXF file: %s", dxf_path
-                        )
+            self.save(doc, dxf_path)
 
         return doc
 
+    def to_dxf_async(
+        self, dxf_template: Path, *, dxf_path: Path
+    ) -> tuple[Drawing, "Future[None]"]:
+        """Create a DXF document and save it on a background thread.
+
+        Same as :meth:`to_dxf`, but the document is returned as soon as it is
+        built while :meth:`save` runs on a shared single-thread executor, so
+        saves happen one at a time in submission order. The document must
+        not be modified until the returned future is done.
+
+        Args:
+            dxf_template: Path to the template DXF file to load.
+            dxf_path: Path to save the resulting DXF.
+
+        Returns:
+            The in-memory DXF document instance and the future of the save;
+            its ``result()`` re-raises any save error.
+        """
+        doc = self.to_dxf(dxf_template)
+        return doc, _SAVE_EXECUTOR.submit(self.save, doc, dxf_path)
+
+    def save(self, doc: Drawing, dxf_path: Path) -> None:
+        """Write ``doc`` to ``dxf_path``, keeping backups of the old file.
+
+        Opens the written file afterwards if ``open_after_save`` is set.
+
+        Args:
+            doc: The document to write.
+            dxf_path: The destination DXF path.
+        """
+        # Rotate existing DXF backups before overwriting the file.
+        self._rotate_dxf_backups(dxf_path, max_backups=10)
+
+        # Same as ``doc.saveas`` but with a large write buffer, so big
+        # drawings are written with far fewer system calls.
+        doc.filename = dxf_path.as_posix()
+        with open(
+            dxf_path,
+            "wt",
+            encoding=doc.output_encoding,
+            errors="dxfreplace",
+            buffering=SAVE_BUFFER_SIZE,
+        ) as fp:
+            doc.write(fp)
+        if self.open_after_save:
+            # Use getattr to avoid mypy issues on non-Windows platforms
+            startfile = getattr(os, "startfile", None)
+            if callable(startfile):
+                try:
+                    startfile(dxf_path.as_posix())
+                except Exception:
+                    logger.exception("Failed opening DXF file: %s", dxf_path)
+
+    def _content_extents(self) -> BoundingBox2d:
+        """Bounding box of the points and text insert points.
+
+        Polylines only use points, so they are inside it as well. Block and
+        text sizes are not included.
+
+        Returns:
+            The box; it has no data if there are no points and texts.
+        """
+        box = BoundingBox2d()
+        columns = self.mapsys.points_soa()
+        if len(columns):
+            box.extend(
+                [
+                    (min(columns.east), min(columns.north)),
+                    (max(columns.east), max(columns.north)),
+                ]
+            )
+        t_meta = self.mapsys.t_meta
+        if t_meta:
+            east = list(map(attrgetter("east"), t_meta))
+            north = list(map(attrgetter("north"), t_meta))
+            box.extend([(min(east), min(north)), (max(east), max(north))])
+        return box
+
     def insert_points(self, block_exists: bool, msp: "Layout") -> set[str]:
         """Insert points into the DXF file.
 
@@ -386,45 +705,125 @@ class Builder:
         Returns:
             The set of added layer names.
         """
-        added_layers = set()
-        for pt in self.mapsys.points:
-            insert = (float(pt.east), float(pt.north))
-            if block_exists:
-                ly_name = self.layer_name(
-                    pt.layer,
-                    suffix=(
-                        POINT_SUFFIX if self.segregate_by_object_type else ""
-                    ),
-                )
-                added_layers.add(ly_name)
-                br = msp.add_blockref(
-                    self.point_block,
-                    insert,
-                    dxfattribs={
-                        "xscale": self.block_scale,
-                        "yscale": self.block_scale,
-                        "rotation": BLOCK_ROTATION,
-                        "layer": ly_name,
-                    },
-                )
-                to_set = {}
-                if self.point_name_attrib:
-                    to_set[self.point_name_attrib] = str(pt.pt_nr)
-                if self.point_source_attrib:
-                    to_set[self.point_source_attrib] = BLOCK_SOURCE
-                if self.point_z_attrib:
-                    to_set[self.point_z_attrib] = f"{pt.z:.2f}"
-                if to_set:
-                    br.add_auto_attribs(to_set)
-            else:
+        added_layers: set[str] = set()
+        columns = self.mapsys.points_soa()
+
+        # Format every label up front from the packed columns, so the loop
+        # below only looks values up.
+        pt_strs = list(map(str, columns.pt_nr))
+        inserts = list(zip(columns.east, columns.north))
+
+        if not block_exists:
+            for insert, pt_str in zip(inserts, pt_strs):
                 # Fallback symbol when the block is missing in the template.
                 msp.add_circle(center=insert, radius=0.2)
                 msp.add_text(
-                    str(pt.pt_nr),
+                    pt_str,
                     dxfattribs={"height": ATTRIB_HEIGHT, "insert": insert},
                 )
+            return added_layers
+
+        # One attribute dict per distinct layer instead of one per point;
+        # ezdxf copies the dict it is given, so sharing it is safe.
+        suffix = POINT_SUFFIX if self.segregate_by_object_type else ""
+        base_attribs = {
+            "xscale": self.block_scale,
+            "yscale": self.block_scale,
+            "rotation": BLOCK_ROTATION,
+        }
+        layer_attribs = {}
+        for layer in set(columns.layer):
+            ly_name = self.layer_name(layer, suffix=suffix)
+            added_layers.add(ly_name)
+            layer_attribs[layer] = {**base_attribs, "layer": ly_name}
+        point_attribs = list(map(layer_attribs.__getitem__, columns.layer))
+
+        # Decide once which attributes are filled and where their values
+        # come from; each point then only zips its own values.
+        tags: list[str] = []
+        values: list[Iterable[str]] = []
+        if self.point_name_attrib:
+            tags.append(self.point_name_attrib)
+            values.append(pt_strs)
+        if self.point_source_attrib:
+            tags.append(self.point_source_attrib)
+            values.append(repeat(BLOCK_SOURCE))
+        if self.point_z_attrib:
+            tags.append(self.point_z_attrib)
+            values.append([f"{z:.2f}" for z in columns.z])
+        labels = zip(*values) if tags else repeat(())
+
+        # The first insert is filled by ezdxf from the block's ATTDEFs; as
+        # all inserts share scale and rotation, the others copy its ATTRIBs
+        # shifted to their own insert point.
+        prototypes: list[AttribPrototype] | None = None
+        for insert, attribs, label in zip(inserts, point_attribs, labels):
+            br = msp.add_blockref(self.point_block, insert, dxfattribs=attribs)
+            if not tags:
+                continue
+            if prototypes is None:
+                br.add_auto_attribs(dict(zip(tags, label)))
+                prototypes = self._attrib_prototypes(br, tags)
+                continue
+            if not prototypes:
+                br.add_auto_attribs(dict(zip(tags, label)))
+                continue
+            origin = Vec3(insert)
+            for tag, default, index, d_insert, d_align, extra in prototypes:
+                if d_align is not None:
+                    extra = {**extra, "align_point": origin + d_align}
+                br.add_attrib(
+                    tag,
+                    default if index is None else label[index],
+                    origin + d_insert,
+                    extra,
+                )
         return added_layers
 
+    @staticmethod
+    def _attrib_prototypes(
+        br: "Insert", tags: Sequence[str]
+    ) -> list[AttribPrototype]:
+        """Describe the ATTRIBs of ``br`` relative to its insert point.
+
+        Args:
+            br: A block reference filled by ``add_auto_attribs``.
+            tags: The tags whose text is set per point, in label order.
+
+        Returns:
+            One prototype per ATTRIB, or an empty list if the ATTRIBs can not
+            be copied this way (embedded MTEXT) and every insert must be
+            filled by ezdxf.
+        """
+        origin = Vec3(br.dxf.insert)
+        result: list[AttribPrototype] = []
+        for attrib in br.attribs:
+            if attrib.has_embedded_mtext_entity:
+                return []
+            extra: dict[str, Any] = attrib.dxfattribs(
+                drop={
+                    "handle",
+                    "owner",
+                    "tag",
+                    "text",
+                    "insert",
+                    "align_point",
+                }
+            )
+            align = attrib.dxf.get("align_point")
+            tag = attrib.dxf.tag
+            result.append(
+                (
+                    tag,
+                    attrib.dxf.text,
+                    tags.index(tag) if tag in tags else None,
+                    Vec3(attrib.dxf.insert) - origin,
+                    None if align is None else Vec3(align) - origin,
+                    extra,
+                )
+            )
+        return result
+
     def insert_lines(self, msp: "Layout") -> set[str]:
         """Insert poly-lines into the DXF file.
 
@@ -436,36 +835,45 @@ class Builder:
         """
         added_layers = set()
         ar_list: list[Ar5Data] = self.mapsys.p_meta
-        verticels: list[int] = self.mapsys.v_offsets
+        verticels: Sequence[int] = self.mapsys.v_offsets
         points: list[No5Coord] = self.mapsys.points
+        suffix = LINE_SUFFIX if self.segregate_by_object_type else ""
+
+        # Layer index -> attribute dict shared by all polylines on it.
+        layer_attribs: dict[int, dict[str, str]] = {}
 
         # Generate LWPolylines based on AR5/AS5 mapping to NO5 points.
         for ar, verts in self._iter_poly_vertices(ar_list, verticels, points):
             try:
-                closed = 0
-                if len(verts) >= 2 and verts[0] == verts[-1]:
-                    closed = 1
-                    verts = verts[:-1]
+                if self.simplify_tolerance is not None:
+                    verts = _simplify_vertices(verts, self.simplify_tolerance)
+
+                # A polyline whose vertices all coincide has no segment to
+                # draw; closing it would leave no vertex at all.
+                first = verts[0]
+                if all(v == first for v in verts):
+                    logger.warning(
+                        "Skipping polyline %d: fewer than 2 distinct vertices",
+                        ar.line_id,
+                    )
+                    continue
+
+                # The vertex list is built fresh for this polyline, so the
+                # repeated end point can be dropped in place.
+                closed = verts[0] == verts[-1]
+                if closed:
+                    del verts[-1]
 
                 # Get the layer.
                 ly_index = self.mapsys.get_poly_layer(ar)
-                ly_name = self.layer_name(
-                    ly_index,
-                    suffix=LINE_SUFFIX
-                    if self.segregate_by_object_type
-                    else "",
-                )
-                added_layers.add(ly_name)
+                attribs = layer_attribs.get(ly_index)
+                if attribs is None:
+                    ly_name = self.layer_name(ly_index, suffix=suffix)
+                    added_layers.add(ly_name)
+                    attribs = layer_attribs[ly_index] = {"layer": ly_name}
 
                 # Add the polyline.
-                msp.add_lwpolyline(
-                    verts,
-                    format="xy",
-                    dxfattribs={
-                        "closed": closed,
-                        "layer": ly_name,
-                    },
-                )
+                _add_lwpolyline(msp, verts, closed, attribs)
             except Exception as e:
                 logger.exception(
                     "Failed adding LWPolyline with %d vertices: %s",
@@ -484,25 +892,39 @@ class Builder:
         Returns:
             The set of added layer names.
         """
-        added_layers = set()
+        added_layers: set[str] = set()
+        suffix = TEXT_SUFFIX if self.segregate_by_object_type else ""
+
+        # Layer index -> layer name, built once per distinct layer.
+        layer_names: dict[int, str] = {}
+
+        # Resolve the strings through an offset index built once and convert
+        # the directions in bulk, so the loop below only assembles entities.
+        t_meta = self.mapsys.t_meta
+        offset_to_text = self.mapsys.build_offset_index()
+        strings = list(
+            map(offset_to_text.get, map(attrgetter("offset"), t_meta))
+        )
+        rotations = list(
+            map(math.degrees, map(attrgetter("direction"), t_meta))
+        )
 
-        for text in self.mapsys.t_meta:
-            string = self.mapsys.text_by_offset(text.offset)
+        for text, string, rotation in zip(t_meta, strings, rotations):
             if string is None:
                 logger.warning("Text not found for offset %d", text.offset)
                 continue
 
-            ly_name = self.layer_name(
-                text.layer,
-                suffix=TEXT_SUFFIX if self.segregate_by_object_type else "",
-            )
-            added_layers.add(ly_name)
+            ly_name = layer_names.get(text.layer)
+            if ly_name is None:
+                ly_name = self.layer_name(text.layer, suffix=suffix)
+                layer_names[text.layer] = ly_name
+                added_layers.add(ly_name)
             msp.add_text(
                 string,
                 dxfattribs={
                     "height": text.height,
-                    "insert": (float(text.east), float(text.north)),
-                    "rotation": math.degrees(text.direction),
+                    "insert": (text.east, text.north),
+                    "rotation": rotation,
                     "layer": ly_name,
                 },
             )
@@ -603,20 +1025,22 @@ class Builder:
         Args:
             layers: The layer table.
         """
+        prefix = f"{LAYER_PREFIX}-"
         for layer in layers:
-            if not layer.dxf.name.startswith(f"{LAYER_PREFIX}-"):
+            if not layer.dxf.name.startswith(prefix):
                 continue
 
             parts = layer.dxf.name.split("-")
             src_layer = int(parts[1])
             assert self.mapsys.pr5 is not None
-            if src_layer < 0 or src_layer >= len(self.mapsys.pr5.layers):
+            pr5_layers = self.mapsys.pr5.layers
+            if src_layer < 0 or src_layer >= len(pr5_layers):
                 logger.warning("Invalid source layer index: %d", src_layer)
                 continue
 
             # Source weight is in range 0-255
             layer.dxf.lineweight = self.lineweight_from_mapsys(
-                self.mapsys.pr5.layers[src_layer].weight
+                pr5_layers[src_layer].weight
             )
 
     @staticmethod
@@ -639,17 +1063,4 @@ class Builder:
             )
         if value < 0 or value > 255:
             raise ValueError(f"value must be in [0, 255], got {value}")
-
-        if 0 <= value <= 1:
-            return VALID_DXF_LINEWEIGHTS[1]
-        elif value == 2:
-            return VALID_DXF_LINEWEIGHTS[4]
-        elif value == 3:
-            return VALID_DXF_LINEWEIGHTS[8]
-        else:
-            value -= 4
-            to_split = VALID_DXF_LINEWEIGHTS[9:]
-
-            n = len(to_split)
-            bin_index = (value * n) // 253
-            return to_split[bin_index]
+        return _LINEWEIGHTS[value]
@@ -22,10 +22,12 @@ import struct
 from dataclasses import dataclass
 from typing import List, Tuple
 
+from mapsys.parser.va50 import VA50_SIGNATURE, BytesLike
+
 logger = logging.getLogger(__name__)
 
 
-_AL5_HEADER_STRUCT = struct.Struct("<4s4IB")
+_AL5_HEADER_STRUCT = struct.Struct("<I4IB")
 _AL5_DATA_STRUCT = struct.Struct("<BBB")
 
 
@@ -35,7 +37,7 @@ Int4 = Tuple[int, int, int, int]
 Al5DataList = List["Al5Data"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Al5Header:
     """AL5 file header.
 
@@ -50,7 +52,7 @@ class Al5Header:
     pad: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Al5Data:
     """Single AL5 data entry.
 
@@ -65,7 +67,9 @@ class Al5Data:
     third: int
 
 
-def _parse_al5_header(data: bytes, offset: int = 0) -> Tuple[Al5Header, int]:
+def _parse_al5_header(
+    data: BytesLike, offset: int = 0
+) -> Tuple[Al5Header, int]:
     """Parse the AL5 header starting at the given offset.
 
     Validates the signature.
@@ -89,12 +93,11 @@ def _parse_al5_header(data: bytes, offset: int = 0) -> Tuple[Al5Header, int]:
         raise ValueError("Buffer too small for AL5 header")
 
     # Unpack the header fields from the binary buffer.
-    signature, i1, i2, i3, i4, pad = _AL5_HEADER_STRUCT.unpack_from(
-        data, offset
-    )
+    sig_u32, i1, i2, i3, i4, pad = _AL5_HEADER_STRUCT.unpack_from(data, offset)
+    signature = sig_u32.to_bytes(4, "little")
 
     # Validate the signature for known acceptable values.
-    if signature != b"VA50":
+    if sig_u32 != VA50_SIGNATURE:
         raise ValueError("Invalid AL5 signature: %r" % (signature,))
 
     # Build the strongly-typed header object and advance the offset.
@@ -103,7 +106,7 @@ def _parse_al5_header(data: bytes, offset: int = 0) -> Tuple[Al5Header, int]:
 
 
 def _parse_al5_data_until_eof(
-    data: bytes, offset: int
+    data: BytesLike, offset: int
 ) -> Tuple[Al5DataList, int]:
     """Parse AL5 data records starting at the given offset until EOF.
 
@@ -136,7 +139,7 @@ def _parse_al5_data_until_eof(
     return items, offset
 
 
-def parse_al5(data: bytes) -> Tuple[Al5Header, Al5DataList]:
+def parse_al5(data: BytesLike) -> Tuple[Al5Header, Al5DataList]:
     """Parse an AL5 VA50 file from a bytes buffer.
 
     Args:
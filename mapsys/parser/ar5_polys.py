@@ -32,15 +32,17 @@ import struct
 from dataclasses import dataclass
 from typing import List, Tuple
 
+from mapsys.parser.va50 import VA50_SIGNATURE, BytesLike
+
 logger = logging.getLogger(__name__)
 
 
 # Binary struct formats (little-endian, tightly packed, no implicit padding)
-_AR5_HEADER_STRUCT = struct.Struct("<4s4I")
+_AR5_HEADER_STRUCT = struct.Struct("<I4I")
 _AR5_DATA_STRUCT = struct.Struct("<BIIIIHIBIB")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Ar5Header:
     """AR5 file header.
 
@@ -53,7 +55,7 @@ class Ar5Header:
     int1: Tuple[int, int, int, int]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Ar5Data:
     """One AR5 polyline index entry.
 
@@ -82,7 +84,9 @@ class Ar5Data:
     unk7: int
 
 
-def _parse_ar5_header(data: bytes, offset: int = 0) -> Tuple[Ar5Header, int]:
+def _parse_ar5_header(
+    data: BytesLike, offset: int = 0
+) -> Tuple[Ar5Header, int]:
     """Parse the AR5 header starting at ``offset``.
 
     Args:
@@ -103,10 +107,11 @@ def _parse_ar5_header(data: bytes, offset: int = 0) -> Tuple[Ar5Header, int]:
         raise ValueError("Buffer too small for AR5 header + pad")
 
     # Unpack header fields.
-    signature, i1, i2, i3, i4 = _AR5_HEADER_STRUCT.unpack_from(data, offset)
+    sig_u32, i1, i2, i3, i4 = _AR5_HEADER_STRUCT.unpack_from(data, offset)
+    signature = sig_u32.to_bytes(4, "little")
 
     # Validate signature.
-    if signature != b"VA50":
+    if sig_u32 != VA50_SIGNATURE:
         raise ValueError("Invalid AR5 signature: %r" % (signature,))
 
     # Build header dataclass.
@@ -118,7 +123,7 @@ def _parse_ar5_header(data: bytes, offset: int = 0) -> Tuple[Ar5Header, int]:
 
 
 def _parse_ar5_data_until_eof(
-    data: bytes, offset: int
+    data: BytesLike, offset: int
 ) -> Tuple[List[Ar5Data], int]:
     """Parse AR5 ``Data`` records from ``offset`` until EOF.
 
@@ -177,7 +182,7 @@ def _parse_ar5_data_until_eof(
     return items, offset
 
 
-def parse_ar5(data: bytes) -> Tuple[Ar5Header, List[Ar5Data]]:
+def parse_ar5(data: BytesLike) -> Tuple[Ar5Header, List[Ar5Data]]:
     """Parse an AR5 VA50 file from bytes.
 
     Args:
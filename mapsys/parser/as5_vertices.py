@@ -18,17 +18,25 @@ from __future__ import annotations
 
 import logging
 import struct
+import sys
+from array import array
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import List, Tuple, Union
+
+from mapsys.parser.va50 import VA50_SIGNATURE, BytesLike
 
 logger = logging.getLogger(__name__)
 
 
-_AS5_HEADER_STRUCT = struct.Struct("<4s4IB")
+# Packed offsets: a ``memoryview`` of format ``"I"`` or an ``array("I")``.
+U32Offsets = Union[memoryview, "array[int]"]
+
+
+_AS5_HEADER_STRUCT = struct.Struct("<I4IB")
 _U32_STRUCT = struct.Struct("<I")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class As5Header:
     """AS5 file header.
 
@@ -43,7 +51,9 @@ class As5Header:
     pad: int
 
 
-def _parse_as5_header(data: bytes, offset: int = 0) -> Tuple[As5Header, int]:
+def _parse_as5_header(
+    data: BytesLike, offset: int = 0
+) -> Tuple[As5Header, int]:
     """Parse the AS5 header starting at ``offset``.
 
     Args:
@@ -60,18 +70,17 @@ def _parse_as5_header(data: bytes, offset: int = 0) -> Tuple[As5Header, int]:
     if len(data) - offset < _AS5_HEADER_STRUCT.size:
         raise ValueError("Buffer too small for AS5 header")
 
-    signature, i1, i2, i3, i4, pad = _AS5_HEADER_STRUCT.unpack_from(
-        data, offset
-    )
+    sig_u32, i1, i2, i3, i4, pad = _AS5_HEADER_STRUCT.unpack_from(data, offset)
+    signature = sig_u32.to_bytes(4, "little")
 
-    if signature != b"VA50":
+    if sig_u32 != VA50_SIGNATURE:
         raise ValueError("Invalid AS5 signature: %r" % (signature,))
 
     header = As5Header(signature=signature, int1=(i1, i2, i3, i4), pad=pad)
     return header, offset + _AS5_HEADER_STRUCT.size
 
 
-def _parse_offsets(data: bytes, offset: int) -> Tuple[List[int], int]:
+def _parse_offsets(data: BytesLike, offset: int) -> Tuple[List[int], int]:
     """Parse ``u32`` offsets until EOF, starting at ``offset``.
 
     Args:
@@ -98,7 +107,7 @@ def _parse_offsets(data: bytes, offset: int) -> Tuple[List[int], int]:
     return offsets, offset
 
 
-def parse_as5(data: bytes) -> Tuple[As5Header, List[int]]:
+def parse_as5(data: BytesLike) -> Tuple[As5Header, List[int]]:
     """Parse a VA50/AS5 file from bytes, returning header and offsets list.
 
     Args:
@@ -113,4 +122,46 @@ def parse_as5(data: bytes) -> Tuple[As5Header, List[int]]:
     return header, offsets
 
 
-__all__ = ["As5Header", "parse_as5"]
+def parse_as5_to_array(data: BytesLike) -> Tuple[As5Header, U32Offsets]:
+    """Parse a VA50/AS5 file, returning the offsets as packed ``u32`` values.
+
+    Unlike :func:`parse_as5`, no Python ``int`` is created per offset: each
+    value stays 4 bytes wide. On little-endian hosts the result is a
+    read-only ``memoryview`` over ``data`` (zero-copy, so ``data`` is kept
+    alive as long as the view is); elsewhere it is a byte-swapped
+    ``array("I")`` copy. Both can be indexed, iterated, and written straight
+    to a file with ``f.write(offsets)``.
+
+    Args:
+        data: File content as bytes.
+
+    Returns:
+        Tuple of (``As5Header``, packed 32-bit offsets).
+
+    Raises:
+        ValueError: If the buffer is too small or the signature is invalid.
+    """
+
+    header, offset = _parse_as5_header(data, 0)
+
+    # Only full u32 values are part of the table; log any trailing bytes.
+    count = (len(data) - offset) // _U32_STRUCT.size
+    end = offset + count * _U32_STRUCT.size
+    trailing = len(data) - end
+    if trailing:
+        logger.debug("Trailing %d byte(s) after AS5 offsets", trailing)
+
+    # The file is little-endian, so the bytes can be reinterpreted in place
+    # when the host shares that byte order.
+    raw = memoryview(data).toreadonly()[offset:end]
+    if sys.byteorder == "little":
+        return header, raw.cast("I")
+
+    # Otherwise copy into an array and fix the byte order.
+    values = array("I")
+    values.frombytes(raw)
+    values.byteswap()
+    return header, values
+
+
+__all__ = ["As5Header", "parse_as5", "parse_as5_to_array"]
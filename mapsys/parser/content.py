@@ -14,7 +14,8 @@ Design overview:
 - Each ``process_*`` method parses a specific file type and stores the
   results on the ``Content`` instance.
 - ``Content.create`` collects all non-empty sibling files that share the same
-  stem with ``main_file`` and invokes all processors in a fixed order.
+  stem with ``main_file`` and invokes all processors concurrently; errors are
+  re-raised in a fixed order.
 
 Logging is used throughout to keep the code side-effect free while still
 surfacing diagnostics (missing files, empty files, decoding problems, etc.).
@@ -26,26 +27,228 @@ than raising.
 """
 
 import csv
+import hashlib
 import logging
+import mmap
+import os
+import threading
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from enum import StrEnum
 from functools import wraps
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Sequence
 
 from attrs import define, field
 
 from mapsys.parser.al5_poly_layer import Al5Data, parse_al5
 from mapsys.parser.ar5_polys import Ar5Data, parse_ar5
-from mapsys.parser.as5_vertices import parse_as5
-from mapsys.parser.mdb_support import extract_access_db
-from mapsys.parser.n05_points import No5Coord, parse_no5
-from mapsys.parser.pr5_main import Pr5File, parse_pr5
-from mapsys.parser.te5_text_meta import Te5TextMeta, parse_te5
-from mapsys.parser.ts5_text_store import Ts5Text, parse_ts5
+from mapsys.parser.as5_vertices import parse_as5_to_array
+from mapsys.parser.n05_points import No5Columns, No5Coord, parse_no5
+from mapsys.parser.pickle_cache import load_pickle_cache, store_pickle_cache
+from mapsys.parser.pr5_main import Pr5File, parse_pr5, parse_pr5_path
+from mapsys.parser.te5_text_meta import (
+    Te5Header,
+    Te5TextMeta,
+    parse_te5,
+    parse_te5_path,
+)
+from mapsys.parser.ts5_text_store import (
+    Ts5Header,
+    Ts5Text,
+    parse_ts5_columns,
+    parse_ts5_path,
+)
 
 logger = logging.getLogger(__name__)
 
 
+# Identity of a discovered file set: ``(extension, mtime_ns, size)`` per file.
+FileStamps = tuple[tuple[str, int, int], ...]
+
+# Number of loaded projects kept by ``Content.create``.
+CONTENT_CACHE_SIZE = 8
+
+# Absolute main file path -> stamps of its file set and the loaded content.
+_CONTENT_CACHE: "OrderedDict[str, tuple[FileStamps, Content]]" = OrderedDict()
+_CONTENT_CACHE_LOCK = threading.Lock()
+
+# Format of the files written by ``Content.create`` to ``disk_cache``; bump it
+# whenever the pickled ``Content`` layout changes.
+DISK_CACHE_VERSION = 3
+
+# Buffer types accepted by the binary ``process_*`` handlers.
+BINARY_CONTENT = (bytes, bytearray, mmap.mmap)
+
+# Uppercase file extension -> name of the ``Content`` method that processes
+# it. Filled by ``preprocess`` as the handlers are defined, so the order
+# matches the class body.
+_DISPATCH: dict[str, str] = {}
+
+# File keys whose ``process_*`` handler only documents the format and does not
+# use the content yet. Their files are neither opened nor read; remove a key
+# from this set when its handler starts storing data.
+_NOOP_PROCESSORS = frozenset(
+    {
+        "app",
+        "at5",
+        "crs",
+        "csi",
+        "del",
+        "dts",
+        "ead",
+        "ims",
+        "jlk",
+        "lgn",
+        "lgs",
+        "mdb",
+        "mei",
+        "ns5",
+        "ol5",
+        "prj",
+        "pxt",
+        "qs5",
+        "qt5",
+        "ral",
+        "ref",
+        "thl",
+    }
+)
+
+
+def _advise_sequential(mapped: mmap.mmap) -> None:
+    """Tell the kernel a mapping will be read once, front to back.
+
+    Parsers walk the VA50 tables sequentially, so aggressive read-ahead pays
+    off. The hints are skipped on platforms without ``madvise`` (Windows).
+
+    Args:
+        mapped: The freshly created read-only mapping.
+    """
+    for name in ("MADV_SEQUENTIAL", "MADV_WILLNEED"):
+        advice = getattr(mmap, name, None)
+        if advice is None:
+            continue
+        try:
+            mapped.madvise(advice)
+        except OSError:
+            logger.debug("madvise(%s) not supported", name)
+
+
+def _prefetch(paths: Iterable[Path]) -> None:
+    """Ask the kernel to start reading ``paths`` into the page cache.
+
+    Each file gets a ``POSIX_FADV_WILLNEED`` hint, which returns immediately
+    and lets the kernel issue all reads as one batch. The hints are sent in
+    inode order, which on most file systems follows the on-disk layout of
+    files created together, so rotating and network storage see fewer seeks.
+    Nothing is done on platforms without ``posix_fadvise`` (Windows, macOS).
+
+    Args:
+        paths: Files about to be read.
+    """
+    advise = getattr(os, "posix_fadvise", None)
+    if advise is None:
+        return
+
+    # Open everything first so the files can be ordered by inode.
+    opened: list[tuple[int, int, Path]] = []
+    try:
+        for path in paths:
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except OSError:
+                continue
+            opened.append((os.fstat(fd).st_ino, fd, path))
+
+        opened.sort(key=lambda item: item[0])
+        for _, fd, path in opened:
+            try:
+                advise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                logger.debug("posix_fadvise not supported for %s", path)
+    finally:
+        for _, fd, _ in opened:
+            os.close(fd)
+
+
+def _disk_cache_path(cache_dir: Path, cache_key: str) -> Path:
+    """Return the cache file used for a project.
+
+    Args:
+        cache_dir: Directory holding the cache files.
+        cache_key: Absolute path of the project's main file.
+
+    Returns:
+        A path named after a hash of ``cache_key``.
+    """
+    digest = hashlib.blake2b(cache_key.encode("utf-8"), digest_size=16)
+    return cache_dir / f"{digest.hexdigest()}.mapsys-cache"
+
+
+def _read_exact(f: Any, size: int) -> bytearray:
+    """Read ``size`` bytes from an unbuffered binary file.
+
+    The data lands directly in a pre-sized ``bytearray`` through
+    ``readinto``, without an intermediate buffered-reader copy.
+
+    Args:
+        f: A binary file opened with ``buffering=0``.
+        size: Number of bytes to read.
+
+    Returns:
+        The buffer, truncated if the file ended early.
+    """
+    buf = bytearray(size)
+    view = memoryview(buf)
+    got = 0
+    while got < size:
+        n = f.readinto(view[got:])
+        if not n:
+            break
+        got += n
+    view.release()
+    del buf[got:]
+    return buf
+
+
+def parse_mapsys_bundle(
+    pr5_path: "str | os.PathLike[str]",
+    te5_path: "str | os.PathLike[str]",
+    ts5_path: "str | os.PathLike[str]",
+) -> tuple[
+    Pr5File,
+    tuple[Te5Header, list[Te5TextMeta]],
+    tuple[Ts5Header, list[Ts5Text]],
+]:
+    """Parse a PR5, TE5 and TS5 file concurrently.
+
+    Each file is memory-mapped and parsed on its own thread, so reading one
+    file overlaps with parsing the others. Use :meth:`Content.create` to load
+    a whole project; this is for callers that only need these three files.
+
+    Args:
+        pr5_path: Path of the PR5 file.
+        te5_path: Path of the TE5 file.
+        ts5_path: Path of the TS5 file.
+
+    Returns:
+        The results of :func:`parse_pr5_path`, :func:`parse_te5_path` and
+        :func:`parse_ts5_path`, in that order.
+
+    Throws:
+        Exception: The first error raised by a parser, in argument order.
+    """
+    _prefetch(Path(p) for p in (pr5_path, te5_path, ts5_path))
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        pr5 = pool.submit(parse_pr5_path, pr5_path)
+        te5 = pool.submit(parse_te5_path, te5_path)
+        ts5 = pool.submit(parse_ts5_path, ts5_path)
+    return pr5.result(), te5.result(), ts5.result()
+
+
 class PrepModels(StrEnum):
     """Input modes understood by the ``preprocess`` decorator."""
 
@@ -53,7 +256,6 @@ class PrepModels(StrEnum):
     VA50 = "va50"
     CSV = "csv"
     UNKNOWN = "unknown"
-    MDB = "mdb"
     ASSIGN = "assign"
 
 
@@ -65,12 +267,17 @@ def preprocess(name: str, mode: str) -> Any:
     wrapped ``process_*`` method with the prepared content.
 
     - ``TEXT_LINES``: open as UTF-8 text and pass a list of lines
-    - ``CSV``: open as UTF-8 text and pass a CSV row iterator
+    - ``CSV``: open as UTF-8 text and pass a CSV row iterator over the open
+      file (valid only while the handler runs)
     - ``ASSIGN``: open as UTF-8 text and pass a ``dict`` built from ``k=v``
-      lines
-    - ``VA50``: open as binary and pass raw bytes
-    - ``UNKNOWN``: open as binary and pass raw bytes unchanged
-    - ``MDB``: call ``extract_access_db`` and pass a ``dict`` of tables
+      lines (lines without ``=`` are skipped)
+    - ``VA50``: memory-map the file and pass the read-only ``mmap``
+    - ``UNKNOWN``: memory-map the file and pass the ``mmap`` unchanged
+
+    The wrapper is specialized for ``mode`` once, at decoration time, so no
+    mode comparison happens when a handler runs. Handlers listed in
+    ``_NOOP_PROCESSORS`` are replaced by a stub that does not touch the file
+    system at all.
 
     Args:
         name: Lowercase file key without dot (e.g., ``"no5"``).
@@ -81,78 +288,137 @@ def preprocess(name: str, mode: str) -> Any:
 
     Throws:
         No exception is raised for missing or empty files; these are logged
-        and the wrapped function is not called. For MDB extraction, any
-        exception from the extractor is logged and suppressed as well.
+        and the wrapped function is not called.
     """
 
     def decorator(func: Any) -> Any:
-        @wraps(func)
-        def wrapper(self: "Content", content: Any = None) -> None:
-            logger.debug("Preprocessing %s in %s mode", name, mode)
-            file_path = self.files.get(name.upper())
+        if name in _NOOP_PROCESSORS:
+            # The handler ignores its content; skip all file I/O. It is not
+            # registered in ``_DISPATCH`` either, so ``Content.create`` never
+            # schedules it.
+            @wraps(func)
+            def noop(self: "Content", content: Any = None) -> None:
+                logger.debug("Skipping %s: content is not used", name)
+
+            return noop
+
+        key = name.upper()
+
+        # Register the handler so ``Content.create`` can dispatch by file.
+        _DISPATCH[key] = func.__name__
+
+        def companion(self: "Content") -> Path | None:
+            # Shared prologue: find the file this handler consumes.
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Preprocessing %s in %s mode", name, mode)
+            file_path = self.files.get(key)
             if file_path is None:
                 logger.error("File %s not found", name)
+            return file_path
+
+        def read_lines(file_path: Path) -> list[str] | None:
+            # Iterate the file object directly: its buffered reader splits
+            # lines in C, so the text is scanned only once.
+            with open(file_path, "r", encoding="utf-8") as f:
+                lines = [ln.rstrip("\n") for ln in f]
+            if not lines:
+                logger.error("File %s is empty", name)
+                return None
+            return lines
+
+        def wrap_binary(self: "Content", content: Any = None) -> None:
+            file_path = companion(self)
+            if file_path is None:
                 return
 
-            if mode == PrepModels.MDB:
-                try:
-                    content = extract_access_db(str(file_path))
-                    return func(self, content)
-                except Exception:
-                    logger.exception(
-                        "Failed to extract content from %s", file_path
-                    )
+            # Binary formats are memory-mapped instead of read into a bytes
+            # object; the OS pages data in as the parser walks it. The file
+            # is opened unbuffered since it is either mapped or read at once.
+            with open(file_path, "rb", buffering=0) as f:
+                size = os.fstat(f.fileno()).st_size
+                if size == 0:
+                    logger.error("File %s is empty", name)
                     return
+                try:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (OSError, ValueError):
+                    # Some file systems cannot be mapped; read the file in
+                    # one pass instead.
+                    logger.debug("Cannot map %s; reading it instead", name)
+                    return func(self, _read_exact(f, size))
+            _advise_sequential(mapped)
+
+            # Parsers copy what they need out of the mapping, so it is
+            # released as soon as the handler returns.
+            try:
+                return func(self, mapped)
+            finally:
+                try:
+                    mapped.close()
+                except BufferError:
+                    logger.debug("Mapping of %s is still exported", name)
 
-            text_mode = mode in (
-                PrepModels.TEXT_LINES,
-                PrepModels.CSV,
-                PrepModels.ASSIGN,
-            )
+        def wrap_text_lines(self: "Content", content: Any = None) -> None:
+            file_path = companion(self)
+            if file_path is None:
+                return
+            lines = read_lines(file_path)
+            if lines is None:
+                return
+            return func(self, lines)
 
-            with open(
-                file_path,
-                "r" if text_mode else "rb",
-                encoding="utf-8" if text_mode else None,
-            ) as f:
-                content = f.read()
-            if len(content) == 0:
-                logger.error("File %s is empty", name)
+        def wrap_csv(self: "Content", content: Any = None) -> None:
+            file_path = companion(self)
+            if file_path is None:
                 return
 
-            if mode == PrepModels.TEXT_LINES:
-                content = content.splitlines()
-            elif mode == PrepModels.CSV:
-                content = csv.reader(content.splitlines())
-            elif mode == PrepModels.VA50:
-                # Pass raw bytes to the handler for VA50 formats (e.g., NO5)
-                pass
-            elif mode == PrepModels.UNKNOWN:
-                # Unknown: pass raw bytes and let the handler decide
-                pass
-            elif mode == PrepModels.ASSIGN:
-                result = {}
-                for ln in content.splitlines():
-                    assert "=" in ln, (
-                        f"Line {ln} does not contain an equal sign"
-                    )
-                    key, value = ln.split("=")
-                    result[key] = value
-                content = result
-            else:
-                assert False, f"Unknown mode: {mode}"
+            # Stream rows straight from the file; it stays open until the
+            # handler returns.
+            with open(file_path, "r", encoding="utf-8", newline="") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    logger.error("File %s is empty", name)
+                    return
+                return func(self, csv.reader(f))
 
-            return func(self, content)
+        def wrap_assign(self: "Content", content: Any = None) -> None:
+            file_path = companion(self)
+            if file_path is None:
+                return
 
-        return wrapper
+            # Build the ``key=value`` mapping while reading; one ``partition``
+            # both finds the separator and splits, and lines without an equal
+            # sign are skipped.
+            result: dict[str, str] = {}
+            with open(file_path, "r", encoding="utf-8") as f:
+                for ln in f:
+                    k, sep, value = ln.rstrip("\n").partition("=")
+                    if sep:
+                        result[k] = value
+            if not result:
+                logger.error("File %s is empty", name)
+                return
+            return func(self, result)
+
+        # Pick the specialized wrapper once for this handler.
+        wrappers = {
+            PrepModels.VA50: wrap_binary,
+            PrepModels.UNKNOWN: wrap_binary,
+            PrepModels.TEXT_LINES: wrap_text_lines,
+            PrepModels.CSV: wrap_csv,
+            PrepModels.ASSIGN: wrap_assign,
+        }
+        return wraps(func)(wrappers[PrepModels(mode)])
 
     return decorator
 
 
-@define
+@define(slots=True)
 class Content:
     """Aggregated content parsed from MapSys companion files.
 
+    The class is slotted: every instance attribute, internal caches
+    included, must be declared as an attrs field.
+
     Attributes:
         main_file: The user-selected file used to derive the file stem.
         files: Mapping of uppercase extensions (e.g., ``"NO5"``) to paths of
@@ -161,11 +427,17 @@ class Content:
         texts: Parsed TS5 text entries.
         t_meta: Parsed TE5 text metadata entries.
         p_meta: Parsed AR5 polyline metadata entries.
-        v_offsets: Parsed AS5 vertex offsets list.
+        v_offsets: Parsed AS5 vertex offsets; loaded files store them packed
+            in an ``array("I")`` (4 bytes per offset).
         p_layers: Parsed AL5 per-poly layer records.
         pr5: Parsed PR5 file structure if present, otherwise ``None``.
-        offset_to_text: Internal cache mapping TS5 offsets to strings used by
-            :meth:`text_by_offset`.
+        _text_offsets: Ascending TS5 string offsets used by
+            :meth:`text_by_offset`; built by :meth:`process_ts5`.
+        _text_strings: The strings matching ``_text_offsets``, same order.
+        _layer_lookup: The ``layer`` byte of every AL5 record, in record
+            order; built by :meth:`process_al5`.
+        _points_columns: ``points`` as packed columns; built on first use
+            by :meth:`points_soa`.
     """
 
     main_file: Path
@@ -175,18 +447,23 @@ class Content:
     texts: list["Ts5Text"] = field(factory=list)
     t_meta: list["Te5TextMeta"] = field(factory=list)
     p_meta: list["Ar5Data"] = field(factory=list)
-    v_offsets: list[int] = field(factory=list)
+    v_offsets: Sequence[int] = field(factory=list)
     p_layers: list["Al5Data"] = field(factory=list)
     pr5: "Pr5File | None" = field(default=None)
 
-    offset_to_text: dict[int, str] = field(factory=dict, init=False)
+    _text_offsets: Sequence[int] = field(factory=list, init=False)
+    _text_strings: list[str] = field(factory=list, init=False)
+    _layer_lookup: bytes = field(default=b"", init=False)
+    _points_columns: "No5Columns | None" = field(default=None, init=False)
 
     def text_by_offset(self, offset: int) -> str | None:
         """Return the TS5 string stored at ``offset``.
 
-        Builds a cache on first use from ``self.texts``. Offsets are relative
-        to the beginning of the TS5 string block (i.e., right after the TS5
-        header), matching the values referenced by TE5 metadata.
+        The sorted offset column is built once by :meth:`process_ts5` and
+        searched with ``bisect``; it is only built here for instances whose
+        ``texts`` were assigned directly. Offsets are relative to the
+        beginning of the TS5 string block (i.e., right after the TS5 header),
+        matching the values referenced by TE5 metadata.
 
         Args:
             offset: String-block-relative byte offset.
@@ -194,10 +471,61 @@ class Content:
         Returns:
             The decoded string if present, otherwise ``None``.
         """
-        if not self.offset_to_text:
-            for text in self.texts:
-                self.offset_to_text[text.offset] = text.text
-        return self.offset_to_text.get(offset, None)
+        offsets, strings = self._text_index()
+        i = bisect_left(offsets, offset)
+        if i < len(offsets) and offsets[i] == offset:
+            return strings[i]
+        return None
+
+    def _text_index(self) -> tuple[Sequence[int], list[str]]:
+        """Return the sorted TS5 lookup columns, building them if missing.
+
+        Returns:
+            The ascending offsets and the strings in the same order.
+        """
+        if not self._text_offsets and self.texts:
+            ordered = sorted(self.texts, key=lambda t: t.offset)
+            self._text_offsets = array("I", [t.offset for t in ordered])
+            self._text_strings = [t.text for t in ordered]
+        return self._text_offsets, self._text_strings
+
+    def build_offset_index(self) -> dict[int, str]:
+        """Build a mapping of TS5 offsets to strings.
+
+        The mapping is assembled from the sorted lookup columns on every
+        call, which costs one pass over all strings; build it once for many
+        lookups, or use :meth:`text_by_offset` for individual ones.
+
+        Returns:
+            A new ``dict`` from offset to string.
+        """
+        return dict(zip(*self._text_index()))
+
+    def points_soa(self) -> No5Columns:
+        """Return ``points`` stored column by column.
+
+        The columns are built on the first call and reused afterwards;
+        loading a NO5 file resets them.
+
+        Returns:
+            The points as a ``No5Columns`` structure of arrays.
+        """
+        if self._points_columns is None:
+            self._points_columns = No5Columns.from_records(self.points)
+        return self._points_columns
+
+    def _poly_layer_lookup(self) -> bytes:
+        """Return the AL5 layer table, building it if it is missing.
+
+        Returns:
+            One byte per AL5 record holding its ``layer`` value.
+
+        Throws:
+            ValueError: If a layer value does not fit in a byte.
+        """
+        if not self._layer_lookup and self.p_layers:
+            self._layer_lookup = bytes(a.layer for a in self.p_layers)
+        return self._layer_lookup
 
     def get_poly_layer(self, p_meta: "Ar5Data") -> int:
         """Resolve the display layer for an AR5 polyline record.
@@ -210,27 +538,56 @@ class Content:
             p_meta: One AR5 record.
 
         Returns:
-            Layer index (0..255). Values are asserted to be in range.
+            Layer index (0..255).
         """
-        if p_meta.lay_rec < 0 or p_meta.lay_rec >= len(self.p_layers):
-            return 0
-        result = self.p_layers[p_meta.lay_rec].layer
-        assert 0 <= result <= 255, f"Invalid poly layer index: {result}"
-        return result
+        lookup = self._poly_layer_lookup()
+        idx = p_meta.lay_rec
+        return lookup[idx] if 0 <= idx < len(lookup) else 0
+
+    def get_poly_layers(self, lay_recs: Iterable[int]) -> list[int]:
+        """Resolve the display layers for many AR5 ``lay_rec`` indices.
+
+        Bulk variant of :meth:`get_poly_layer`; out-of-range indices map to
+        ``0``.
+
+        Args:
+            lay_recs: The ``lay_rec`` values of the AR5 records.
+
+        Returns:
+            One layer index (0..255) per input value.
+        """
+        lookup = self._poly_layer_lookup()
+        n = len(lookup)
+        return [lookup[i] if 0 <= i < n else 0 for i in lay_recs]
+
+    def get_poly_layers_bulk(self) -> bytes:
+        """Resolve the display layer of every AR5 record in ``p_meta``.
+
+        Equivalent to calling :meth:`get_poly_layer` for each record, but
+        done in one pass over the ``lay_rec`` column.
+
+        Returns:
+            One byte per AR5 record, in ``p_meta`` order, holding its layer
+            index; out-of-range records map to ``0``.
+        """
+        return bytes(self.get_poly_layers(m.lay_rec for m in self.p_meta))
 
     @preprocess("al5", mode=PrepModels.VA50)
     def process_al5(self, content: Any = None) -> None:
         """AL5: per-poly layer table with 3-byte records.
 
         Args:
-            content: Raw bytes of an AL5 VA50 file.
+            content: Raw bytes or mmap of an AL5 VA50 file.
 
         Returns:
             None. Populates ``self.p_layers``.
         """
-        if isinstance(content, (bytes, bytearray)):
-            _, items = parse_al5(bytes(content))
+        if isinstance(content, BINARY_CONTENT):
+            _, items = parse_al5(content)
             self.p_layers = items
+
+            # Flatten the layer column into bytes for O(1) lookups.
+            self._layer_lookup = bytes(a.layer for a in items)
         else:
             assert False, f"Unknown content type: {type(content).__name__}"
 
@@ -244,13 +601,13 @@ class Content:
         """AR5: polyline table.
 
         Args:
-            content: Raw bytes of an AR5 VA50 file.
+            content: Raw bytes or mmap of an AR5 VA50 file.
 
         Returns:
             None. Populates ``self.p_meta``.
         """
-        if isinstance(content, (bytes, bytearray)):
-            _, self.p_meta = parse_ar5(bytes(content))
+        if isinstance(content, BINARY_CONTENT):
+            _, self.p_meta = parse_ar5(content)
         else:
             assert False, f"Unknown content type: {type(content).__name__}"
 
@@ -260,7 +617,7 @@ class Content:
         stored in the AR table.
 
         #pragma endian little
-        #pragma magic [56 53 35 30] @ 0x00  // "VA50" at offset 0
+        #pragma magic [56 41 35 30] @ 0x00  // "VA50" at offset 0
 
         import std.mem;
 
@@ -278,13 +635,22 @@ class Content:
         VA50File file @ 0x00;
 
         Args:
-            content: Raw bytes of an AS5 VA50/VA50 file.
+            content: Raw bytes or mmap of an AS5 VA50/VA50 file.
 
         Returns:
             None. Populates ``self.v_offsets``.
         """
-        if isinstance(content, (bytes, bytearray)):
-            _, self.v_offsets = parse_as5(bytes(content))
+        if isinstance(content, BINARY_CONTENT):
+            # Copy the packed u32 table out of the mapping in one go instead
+            # of creating a Python int per offset; a byte-swapped array is
+            # already a copy and is kept as is.
+            _, offsets = parse_as5_to_array(content)
+            if isinstance(offsets, array):
+                self.v_offsets = offsets
+            else:
+                packed = array("I")
+                packed.frombytes(offsets.cast("B"))
+                self.v_offsets = packed
         else:
             assert False, f"Unknown content type: {type(content).__name__}"
 
@@ -296,7 +662,7 @@ class Content:
 
         ```
         #pragma endian little
-        #pragma magic [56 53 35 30] @ 0x00  // "VA50" at offset 0
+        #pragma magic [56 41 35 30] @ 0x00  // "VA50" at offset 0
 
         import std.mem;
 
@@ -375,7 +741,7 @@ class Content:
     def process_lgs(self, content: Any = None) -> None:
         pass
 
-    @preprocess("mdb", mode=PrepModels.MDB)
+    @preprocess("mdb", mode=PrepModels.UNKNOWN)
     def process_mdb(self, content: Any = None) -> None:
         pass
 
@@ -388,13 +754,14 @@ class Content:
         """NO5: points table.
 
         Args:
-            content: Raw bytes of a NO5 VA50 file.
+            content: Raw bytes or mmap of a NO5 VA50 file.
 
         Returns:
             None. Populates ``self.points``.
         """
-        if isinstance(content, (bytes, bytearray)):
-            _, self.points = parse_no5(bytes(content))
+        if isinstance(content, BINARY_CONTENT):
+            _, self.points = parse_no5(content)
+            self._points_columns = None
         else:
             assert False, f"Unknown content type: {type(content).__name__}"
 
@@ -417,13 +784,13 @@ class Content:
         """PR5: main project file.
 
         Args:
-            content: Raw bytes of a PR5 file.
+            content: Raw bytes or mmap of a PR5 file.
 
         Returns:
             None. Populates ``self.pr5``.
         """
-        if isinstance(content, (bytes, bytearray)):
-            self.pr5 = parse_pr5(bytes(content))
+        if isinstance(content, BINARY_CONTENT):
+            self.pr5 = parse_pr5(content)
         else:
             assert False, f"Unknown content type: {type(content).__name__}"
 
@@ -458,7 +825,7 @@ class Content:
 
         ```
         #pragma endian little
-        #pragma magic [56 53 35 30] @ 0x00  // "VA50" at offset 0
+        #pragma magic [56 41 35 30] @ 0x00  // "VA50" at offset 0
 
         import std.mem;
 
@@ -513,13 +880,13 @@ class Content:
         """TE5: text metadata without the actual string.
 
         Args:
-            content: Raw bytes of a TE5 VA50 file.
+            content: Raw bytes or mmap of a TE5 VA50 file.
 
         Returns:
             None. Populates ``self.t_meta``.
         """
-        if isinstance(content, (bytes, bytearray)):
-            _, self.t_meta = parse_te5(bytes(content))
+        if isinstance(content, BINARY_CONTENT):
+            _, self.t_meta = parse_te5(content)
         else:
             assert False, f"Unknown content type: {type(content).__name__}"
 
@@ -532,77 +899,164 @@ class Content:
         """TS5: text storage.
 
         Args:
-            content: Raw bytes of a TS5 VA50 file.
+            content: Raw bytes or mmap of a TS5 VA50 file.
 
         Returns:
-            None. Populates ``self.texts``.
+            None. Populates ``self.texts`` and the offset lookup columns.
         """
-        if isinstance(content, (bytes, bytearray)):
-            _, self.texts = parse_ts5(bytes(content))
+        if isinstance(content, BINARY_CONTENT):
+            _, (offsets, strings) = parse_ts5_columns(content)
+            self.texts = list(map(Ts5Text, offsets, strings))
+
+            # Strings are stored back to back, so the offsets column is
+            # already ascending and can be searched with ``bisect`` as is;
+            # packing it takes 4 bytes per entry instead of a dict slot.
+            self._text_offsets = array("I", offsets)
+            self._text_strings = strings
         else:
             assert False, f"Unknown content type: {type(content).__name__}"
 
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all projects remembered by :meth:`create`."""
+        with _CONTENT_CACHE_LOCK:
+            _CONTENT_CACHE.clear()
+
     @classmethod
-    def create(cls, main_file: Path) -> "Content | None":
+    def create(
+        cls,
+        main_file: Path,
+        cached: bool = False,
+        disk_cache: Path | None = None,
+    ) -> "Content | None":
         """Create and populate a ``Content`` instance for ``main_file``.
 
         The function discovers all non-empty files that share the same stem as
         ``main_file`` and stores them in ``files`` keyed by uppercase
-        extension (e.g., ``{"NO5": Path(...)}"). It then calls all
-        ``process_*`` methods to populate the structured fields. Missing files
-        are logged and skipped.
+        extension (e.g., ``{"NO5": Path(...)}"). It then runs, on a thread
+        pool, the registered ``process_*`` method of each discovered file to
+        populate the structured fields.
+
+        With ``cached`` set, the last ``CONTENT_CACHE_SIZE`` projects loaded
+        that way are remembered process-wide. When the same ``main_file`` is
+        requested again and none of its files was added, removed or modified
+        (same modification time and size), the very same instance is returned
+        without reading anything. It is shared with every other caller that
+        asked for it, so it must not be mutated.
+
+        With ``disk_cache`` set, loaded projects are also pickled into that
+        directory and reused by later runs under the same validity rule.
+        Only point it at a directory you trust: cache files are unpickled.
 
         Args:
             main_file: Path to any file in the MapSys set; only its stem is
                 used for discovery.
+            cached: Whether to reuse and remember loaded projects; off by
+                default, so each call returns a new instance.
+            disk_cache: Optional directory for persistent cache files.
 
         Returns:
             A populated :class:`Content` or ``None`` if no sibling files were
             found.
         """
         main_key = main_file.stem.upper()
+        prefix = f"{main_key}."
         collected = {}
-        for file_path in main_file.parent.glob(f"{main_key}.*"):
-            if file_path.is_file():
-                if file_path.stat().st_size == 0:
+        stamps = []
+
+        # A single directory pass; ``DirEntry`` caches the file type and
+        # stat results so each sibling costs at most one extra syscall. The
+        # prefix test is a plain string compare on the upper-cased name, so
+        # it matches the same way on case-sensitive file systems.
+        with os.scandir(main_file.parent) as entries:
+            for entry in entries:
+                # Upper-case the name once; it serves both the prefix test
+                # and the extension key.
+                upper_name = entry.name.upper()
+                if not upper_name.startswith(prefix):
+                    continue
+                if not entry.is_file():
+                    continue
+                file_path = Path(entry.path)
+                st = entry.stat()
+                if st.st_size == 0:
                     logger.debug("Skipping empty file: %s", file_path)
                     continue
-                collected[file_path.suffix[1:].upper()] = file_path
+                ext = upper_name.rpartition(".")[2]
+                collected[ext] = file_path
+                stamps.append((ext, st.st_mtime_ns, st.st_size))
         if len(collected) == 0:
             logger.error("No files found for key: %s", main_key)
             return None
         logger.debug("Found %d files for key: %s", len(collected), main_key)
 
-        result = cls(main_file=main_file, files=collected)
-
-        result.process_al5()
-        result.process_app()
-        result.process_ar5()
-        result.process_as5()
-        result.process_at5()
-        result.process_crs()
-        result.process_csi()
-        result.process_del()
-        result.process_dts()
-        result.process_ead()
-        result.process_ims()
-        result.process_jlk()
-        result.process_lgn()
-        result.process_lgs()
-        result.process_mdb()
-        result.process_mei()
-        result.process_no5()
-        result.process_ns5()
-        result.process_ol5()
-        result.process_pr5()
-        result.process_prj()
-        result.process_pxt()
-        result.process_qs5()
-        result.process_qt5()
-        result.process_ral()
-        result.process_ref()
-        result.process_te5()
-        result.process_thl()
-        result.process_ts5()
+        # Reuse the previous load if the file set is unchanged.
+        cache_key = os.path.abspath(main_file)
+        file_stamps: FileStamps = tuple(sorted(stamps))
+        if cached:
+            with _CONTENT_CACHE_LOCK:
+                hit = _CONTENT_CACHE.get(cache_key)
+                if hit is not None and hit[0] == file_stamps:
+                    _CONTENT_CACHE.move_to_end(cache_key)
+                    logger.debug("Reusing loaded content for %s", main_file)
+                    return hit[1]
+
+        # A previous run may have left a valid cache file.
+        cache_file = None
+        result = None
+        if disk_cache is not None:
+            cache_file = _disk_cache_path(disk_cache, cache_key)
+            result = load_pickle_cache(
+                cache_file, DISK_CACHE_VERSION, file_stamps
+            )
+
+        if result is None:
+            result = cls(main_file=main_file, files=collected)
+            result._process_all()
+            if cache_file is not None:
+                store_pickle_cache(
+                    cache_file, DISK_CACHE_VERSION, file_stamps, result
+                )
+        else:
+            logger.debug(
+                "Loaded content for %s from %s", main_file, cache_file
+            )
 
+        # Remember the result, evicting the least recently used project.
+        if cached:
+            with _CONTENT_CACHE_LOCK:
+                _CONTENT_CACHE[cache_key] = (file_stamps, result)
+                _CONTENT_CACHE.move_to_end(cache_key)
+                while len(_CONTENT_CACHE) > CONTENT_CACHE_SIZE:
+                    _CONTENT_CACHE.popitem(last=False)
         return result
+
+    def _process_all(self) -> None:
+        """Run the registered processor of every discovered file.
+
+        Throws:
+            Exception: The first error raised by a processor, in processing
+                order.
+        """
+        collected = self.files
+
+        # Only files that were found and have a registered processor are
+        # handled; the registry keeps the processors' definition order.
+        found = [ext for ext in _DISPATCH if ext in collected]
+        if not found:
+            return
+
+        # Queue read-ahead for every file up front, so the kernel can fetch
+        # them all in parallel while the first processors start.
+        _prefetch(collected[ext] for ext in found)
+
+        # Each processor reads its own file and writes its own attributes, so
+        # they can run concurrently; file reads and C-level parsing overlap.
+        with ThreadPoolExecutor(max_workers=min(8, len(found))) as pool:
+            futures = [
+                pool.submit(getattr(self, _DISPATCH[ext])) for ext in found
+            ]
+
+        # Surface the first failure in the original processing order.
+        for future in futures:
+            future.result()
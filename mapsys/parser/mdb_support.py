@@ -20,10 +20,15 @@ import logging
 import os
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
 import pyodbc  # type: ignore
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,6 +40,15 @@ logger = logging.getLogger(__name__)
 RowDict = Dict[str, Any]
 TableData = List[RowDict]
 ExtractedDb = Dict[str, TableData]
+ValueConverter = Callable[[Any], Any]
+ColumnConverters = List[Optional[ValueConverter]]
+ColumnSelection = Dict[str, Sequence[str]]
+
+# Number of rows pulled from the driver per ``fetchmany`` call.
+FETCH_BATCH_SIZE = 1000
+
+# Column types reported by the driver that need no conversion at all.
+_IDENTITY_TYPES = (bool, int, float, str)
 
 
 def _convert_value(v: Any) -> Any:
@@ -46,6 +60,23 @@ def _convert_value(v: Any) -> Any:
     - ``Decimal`` -> ``float`` (for simplicity)
     - binary-like (``bytes``, ``bytearray``, ``memoryview``) -> hex string
 
+    The exact type of ``v`` is looked up in ``_VALUE_CONVERTERS`` first, so
+    values the driver returns take a single dict lookup; only subclasses of
+    the handled types fall through to the ``isinstance`` checks.
+
+    Args:
+        v: Input value as returned by the database driver.
+
+    Returns:
+        The converted value suitable for JSON serialization.
+    """
+    conv = _VALUE_CONVERTERS.get(type(v), _convert_subclass)
+    return v if conv is None else conv(v)
+
+
+def _convert_subclass(v: Any) -> Any:
+    """Convert a value whose exact type is not in ``_VALUE_CONVERTERS``.
+
     Args:
         v: Input value as returned by the database driver.
 
@@ -64,7 +95,191 @@ def _convert_value(v: Any) -> Any:
     return v
 
 
-def _extract_with_pyodbc(db_path: str) -> ExtractedDb:
+def _iso_or_none(v: Any) -> Any:
+    """Convert a date/time column value to ISO 8601, keeping ``None``.
+
+    Args:
+        v: A ``date``/``datetime`` value or ``None``.
+
+    Returns:
+        The ISO 8601 string, or ``None`` for SQL NULL.
+    """
+    return None if v is None else v.isoformat()
+
+
+def _float_or_none(v: Any) -> Any:
+    """Convert a ``Decimal`` column value to ``float``, keeping ``None``.
+
+    Args:
+        v: A ``Decimal`` value or ``None``.
+
+    Returns:
+        The float value, or ``None`` for SQL NULL.
+    """
+    return None if v is None else float(v)
+
+
+def _hex_or_none(v: Any) -> Any:
+    """Convert a binary column value to a hex string, keeping ``None``.
+
+    Args:
+        v: A bytes-like value or ``None``.
+
+    Returns:
+        The hex string, or ``None`` for SQL NULL.
+    """
+    return None if v is None else bytes(v).hex()
+
+
+# Exact value type -> converter used by ``_convert_value``; ``None`` marks
+# types that are returned unchanged.
+_VALUE_CONVERTERS: Dict[type, Optional[ValueConverter]] = {
+    datetime: _iso_or_none,
+    date: _iso_or_none,
+    Decimal: _float_or_none,
+    bytes: _hex_or_none,
+    bytearray: _hex_or_none,
+    memoryview: _hex_or_none,
+    type(None): None,
+    **{t: None for t in _IDENTITY_TYPES},
+}
+
+
+def _column_converter(type_code: Any) -> Optional[ValueConverter]:
+    """Pick the converter for a column from its driver type code.
+
+    ``pyodbc`` reports the Python type of each column in the second item of
+    ``cursor.description``. Choosing the converter once per column avoids
+    running the full ``_convert_value`` type dispatch on every cell.
+
+    Args:
+        type_code: The type reported by the driver, or ``None`` if unknown.
+
+    Returns:
+        ``None`` when values can be used as-is, otherwise the converter to
+        apply to every value of the column.
+    """
+    if not isinstance(type_code, type):
+        return _convert_value
+    if issubclass(type_code, (datetime, date)):
+        return _iso_or_none
+    if issubclass(type_code, Decimal):
+        return _float_or_none
+    if issubclass(type_code, (bytes, bytearray, memoryview)):
+        return _hex_or_none
+    if issubclass(type_code, _IDENTITY_TYPES):
+        return None
+    return _convert_value
+
+
+def _column_converters(
+    description: Sequence[Sequence[Any]],
+) -> ColumnConverters:
+    """Build the per-column converters for a result set.
+
+    Args:
+        description: The ``cursor.description`` of the executed query.
+
+    Returns:
+        One entry per column, as returned by ``_column_converter``.
+    """
+    return [
+        _column_converter(d[1] if len(d) > 1 else None) for d in description
+    ]
+
+
+def _fetch_table_rows(cur: Any, columns: List[str]) -> TableData:
+    """Stream the current result set into row dictionaries.
+
+    Rows are pulled in batches of ``FETCH_BATCH_SIZE`` so the driver never
+    materializes the whole table at once. Conversion is done one column at a
+    time with the converter chosen for that column.
+
+    Args:
+        cur: A cursor with an executed ``SELECT`` statement.
+        columns: The column names of the result set.
+
+    Returns:
+        The list of row dictionaries.
+    """
+    converters = _column_converters(cur.description)
+    result: TableData = []
+    while rows := cur.fetchmany(FETCH_BATCH_SIZE):
+        # Transpose the batch into columns and convert each column in one go.
+        cols: List[Sequence[Any]] = []
+        for idx, conv in enumerate(converters):
+            values = [row[idx] for row in rows]
+            cols.append(values if conv is None else list(map(conv, values)))
+
+        # Transpose back into one dictionary per row.
+        result.extend(dict(zip(columns, vals)) for vals in zip(*cols))
+    return result
+
+
+def _list_user_tables(cur: Any) -> List[str]:
+    """List the non-system tables of an open database.
+
+    The ODBC ``tables()`` listing is merged with the ``MSysObjects`` catalog,
+    because some drivers do not report table types reliably via
+    ``tables()``. The catalog query uses only plain comparisons that every
+    driver accepts; ``MSys*`` tables are dropped from both listings here.
+
+    Args:
+        cur: An open ``pyodbc`` cursor.
+
+    Returns:
+        The sorted table names.
+    """
+    names = {
+        row.table_name
+        for row in cur.tables(tableType="TABLE")
+        if not row.table_name.startswith("MSys")
+    }
+
+    try:
+        cur.execute("SELECT name FROM MSysObjects WHERE Type=1 AND Flags=0")
+        names.update(
+            r[0] for r in cur.fetchall() if not r[0].startswith("MSys")
+        )
+    except Exception:
+        # If the catalog query is unsupported, keep whatever we got.
+        logger.debug("MSysObjects fallback not available on this driver")
+
+    return sorted(names)
+
+
+def _quote_identifier(name: str) -> str:
+    """Bracket-quote a table or column name for Access SQL.
+
+    Args:
+        name: The identifier; a ``]`` inside it is doubled.
+
+    Returns:
+        The quoted identifier.
+    """
+    return "[" + name.replace("]", "]]") + "]"
+
+
+def _select_sql(table: str, columns: Optional[Sequence[str]]) -> str:
+    """Build the query that reads ``table``.
+
+    Args:
+        table: Name of the table.
+        columns: Columns to read, or ``None`` for all of them.
+
+    Returns:
+        A ``SELECT`` statement with bracket-quoted identifiers.
+    """
+    source = _quote_identifier(table)
+    if not columns:
+        return f"SELECT * FROM {source}"
+    projection = ", ".join(_quote_identifier(c) for c in columns)
+    return f"SELECT {projection} FROM {source}"
+
+
+def _extract_with_pyodbc(
+    db_path: str, columns: Optional[ColumnSelection] = None
+) -> ExtractedDb:
     """Extract tables using ``pyodbc``.
 
     Tries a small list of common Access ODBC drivers and connects using the
@@ -72,6 +287,8 @@ def _extract_with_pyodbc(db_path: str) -> ExtractedDb:
 
     Args:
         db_path: Path to the ``.mdb``/``.accdb`` file.
+        columns: Optional mapping of table name to the columns to read;
+            tables not listed are read in full.
 
     Returns:
         A mapping of table name to list of row dictionaries.
@@ -110,39 +327,16 @@ def _extract_with_pyodbc(db_path: str) -> ExtractedDb:
         cur = conn.cursor()
 
         # List user tables; avoid MSys* system tables
-        tables: List[str] = []
-        for row in cur.tables(tableType="TABLE"):
-            name = row.table_name
-            if not name.startswith("MSys"):
-                tables.append(name)
-
-        # Also query the MSysObjects fallback and merge results. Some drivers
-        # do not report table types reliably via .tables(), but expose names
-        # through MSysObjects. The union ensures maximal coverage.
-        try:
-            cur.execute(
-                "SELECT name FROM MSysObjects WHERE Type=1 AND Flags=0"
-            )
-            msys_names = [
-                r[0] for r in cur.fetchall() if not r[0].startswith("MSys")
-            ]
-            tables = sorted({*tables, *msys_names})
-        except Exception:
-            # If the fallback query is unsupported, keep whatever we got.
-            logger.debug("MSysObjects fallback not available on this driver")
+        tables = _list_user_tables(cur)
 
+        selection = columns or {}
         for tbl in tables:
             try:
-                cur.execute(f"SELECT * FROM [{tbl}]")
-                columns = [d[0] for d in cur.description]
-                rows = cur.fetchall()
-                data[tbl] = [
-                    {
-                        col: _convert_value(val)
-                        for col, val in zip(columns, row)
-                    }
-                    for row in rows
-                ]
+                # Only the requested columns are read, so large memo and
+                # binary columns can be kept out of the transfer.
+                cur.execute(_select_sql(tbl, selection.get(tbl)))
+                names = [d[0] for d in cur.description]
+                data[tbl] = _fetch_table_rows(cur, names)
             except Exception as e:
                 # Don’t die on one bad table; record the error instead
                 data[f"{tbl}__ERROR"] = [{"error": str(e)}]
@@ -158,7 +352,9 @@ def _extract_with_pyodbc(db_path: str) -> ExtractedDb:
 # -------------------- Public API --------------------
 
 
-def extract_access_db(db_path: str) -> ExtractedDb:
+def extract_access_db(
+    db_path: str, columns: Optional[ColumnSelection] = None
+) -> ExtractedDb:
     """Extract all non-system tables to ``{table: [row dicts]}``.
 
     This is the public API and includes a simple existence check for the
@@ -166,6 +362,8 @@ def extract_access_db(db_path: str) -> ExtractedDb:
 
     Args:
         db_path: Path to the ``.mdb``/``.accdb`` file.
+        columns: Optional mapping of table name to the columns to read;
+            tables not listed are read in full.
 
     Returns:
         A mapping of table name to list of row dictionaries.
@@ -178,12 +376,59 @@ def extract_access_db(db_path: str) -> ExtractedDb:
         raise FileNotFoundError(db_path)
 
     try:
-        return _extract_with_pyodbc(db_path)
+        return _extract_with_pyodbc(db_path, columns)
     except Exception as e:
         logger.warning("pyodbc failed: %s", e)
         raise
 
 
+def _json_default(v: Any) -> Any:
+    """Convert a value the JSON encoder cannot serialize on its own.
+
+    Args:
+        v: The value the encoder rejected.
+
+    Returns:
+        The converted value.
+
+    Throws:
+        TypeError: If ``_convert_value`` leaves the value unchanged.
+    """
+    converted = _convert_value(v)
+    if converted is v:
+        raise TypeError(
+            f"Object of type {type(v).__name__} is not JSON serializable"
+        )
+    return converted
+
+
+def dumps_json(data: ExtractedDb) -> bytes:
+    """Serialize extracted data to indented UTF-8 JSON.
+
+    Uses ``orjson`` when it is installed (the ``fast`` extra) and falls back
+    to the standard library ``json`` module otherwise. Both produce the same
+    two-space indented document.
+
+    Args:
+        data: The result of ``extract_access_db``.
+
+    Returns:
+        The UTF-8 encoded JSON document.
+
+    Throws:
+        TypeError: If ``data`` contains a value neither back end can encode.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            default=_json_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(
+        data, ensure_ascii=False, indent=2, default=_json_default
+    ).encode("utf-8")
+
+
 # -------------------- Example CLI --------------------
 
 
@@ -196,11 +441,11 @@ if __name__ == "__main__":
     args = ap.parse_args()
 
     result = extract_access_db(args.db)
-    js = json.dumps(result, ensure_ascii=False, indent=2)
+    js = dumps_json(result)
 
     if args.out:
-        with open(args.out, "w", encoding="utf-8") as f:
+        with open(args.out, "wb") as f:
             f.write(js)
         print(f"Wrote {args.out}")
     else:
-        print(js)
+        print(js.decode("utf-8"))
@@ -26,22 +26,29 @@ from __future__ import annotations
 
 import logging
 import struct
+from array import array
 from dataclasses import dataclass
-from typing import List, Tuple
+from itertools import starmap
+from operator import attrgetter
+from typing import Any, Iterable, List, Tuple, TypeAlias
+
+from mapsys.parser.va50 import VA50_SIGNATURE, BytesLike
 
 logger = logging.getLogger(__name__)
 
 
 # Composed types
 Int6 = Tuple[int, int, int, int, int, int]
+IntColumn: TypeAlias = "array[int]"
+FloatColumn: TypeAlias = "array[float]"
 
 
 # Binary struct formats (little-endian)
-_HEADER_STRUCT = struct.Struct("<4s6IB")
+_HEADER_STRUCT = struct.Struct("<I6IB")
 _COORD_STRUCT = struct.Struct("<BIBIddfIB")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class No5Header:
     """VA50/NO5 file header.
 
@@ -56,10 +63,13 @@ class No5Header:
     pad1: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class No5Coord:
     """Single coordinate record from a VA50/NO5 file.
 
+    Instances are slotted: a file holds one record per point, so dropping
+    the per-instance ``__dict__`` saves memory and speeds attribute access.
+
     Attributes:
         type: Record type (0 break point, 16 node, 5 special/unknown).
         id_nr: Database ID number.
@@ -84,7 +94,111 @@ class No5Coord:
     connexion: int
 
 
-def _parse_header(data: bytes, offset: int = 0) -> Tuple[No5Header, int]:
+@dataclass(frozen=True, slots=True)
+class No5Columns:
+    """NO5 coordinate records stored column by column (structure of arrays).
+
+    Each attribute is a packed ``array.array`` with one item per record, in
+    file order; column ``i`` of every array describes the same point. This
+    uses a few bytes per value instead of one Python object per record.
+
+    Attributes:
+        type: Record types (``array("B")``).
+        id_nr: Database ID numbers (``array("I")``).
+        layer: Zero-based layer numbers (``array("B")``).
+        pt_nr: User-editable point numbers (``array("I")``).
+        east: X coordinates (``array("d")``).
+        north: Y coordinates (``array("d")``).
+        z: Elevations, kept in single precision like the file
+            (``array("f")``).
+        uniq: Usually unique identifiers (``array("I")``).
+        connexion: Number of lines using each point (``array("B")``).
+    """
+
+    type: IntColumn
+    id_nr: IntColumn
+    layer: IntColumn
+    pt_nr: IntColumn
+    east: FloatColumn
+    north: FloatColumn
+    z: FloatColumn
+    uniq: IntColumn
+    connexion: IntColumn
+
+    def __len__(self) -> int:
+        """Return the number of records."""
+        return len(self.type)
+
+    @classmethod
+    def from_records(cls, records: Iterable[No5Coord]) -> "No5Columns":
+        """Build columns from already parsed ``No5Coord`` records.
+
+        Args:
+            records: The records, in the order the columns should keep.
+
+        Returns:
+            The records as packed columns.
+
+        Throws:
+            OverflowError: If a value does not fit its column type.
+        """
+        return cls(*_pack_columns(map(_RECORD_FIELDS, records)))
+
+    def row(self, index: int) -> No5Coord:
+        """Build the ``No5Coord`` record at ``index``.
+
+        Args:
+            index: Zero-based record index.
+
+        Returns:
+            The record as a ``No5Coord``.
+        """
+        return No5Coord(
+            self.type[index],
+            self.id_nr[index],
+            self.layer[index],
+            self.pt_nr[index],
+            self.east[index],
+            self.north[index],
+            self.z[index],
+            self.uniq[index],
+            self.connexion[index],
+        )
+
+
+# Array type codes of the ``No5Columns`` fields, in record order.
+_COLUMN_TYPECODES = ("B", "I", "B", "I", "d", "d", "f", "I", "B")
+
+# Reads the ``No5Coord`` fields of a record as a tuple, in record order.
+_RECORD_FIELDS = attrgetter(
+    "type",
+    "id_nr",
+    "layer",
+    "pt_nr",
+    "east",
+    "north",
+    "z",
+    "uniq",
+    "connexion",
+)
+
+
+def _pack_columns(rows: Iterable[Tuple[Any, ...]]) -> List[array[Any]]:
+    """Transpose coordinate rows into packed ``No5Columns`` arrays.
+
+    Args:
+        rows: One tuple of field values per record, in record order.
+
+    Returns:
+        One array per field, typed by ``_COLUMN_TYPECODES``.
+    """
+    columns = list(zip(*rows)) or [()] * len(_COLUMN_TYPECODES)
+    return [
+        array(code, column) for code, column in zip(_COLUMN_TYPECODES, columns)
+    ]
+
+
+def _parse_header(data: BytesLike, offset: int = 0) -> Tuple[No5Header, int]:
     """Parse the NO5 header starting at ``offset``.
 
     Args:
@@ -103,12 +217,13 @@ def _parse_header(data: bytes, offset: int = 0) -> Tuple[No5Header, int]:
         raise ValueError("Buffer too small for NO5 header")
 
     # Unpack fields using the predefined struct.
-    signature, i1, i2, i3, i4, i5, i6, pad1 = _HEADER_STRUCT.unpack_from(
+    sig_u32, i1, i2, i3, i4, i5, i6, pad1 = _HEADER_STRUCT.unpack_from(
         data, offset
     )
+    signature = sig_u32.to_bytes(4, "little")
 
     # Validate the signature.
-    if signature != b"VA50":
+    if sig_u32 != VA50_SIGNATURE:
         raise ValueError("Invalid NO5 signature: %r" % (signature,))
 
     # Basic sanity check: a header of all-zero numeric fields is considered
@@ -125,7 +240,7 @@ def _parse_header(data: bytes, offset: int = 0) -> Tuple[No5Header, int]:
     return header, offset + _HEADER_STRUCT.size
 
 
-def _parse_coords(data: bytes, offset: int) -> Tuple[List[No5Coord], int]:
+def _parse_coords(data: BytesLike, offset: int) -> Tuple[List[No5Coord], int]:
     """Parse coordinate records until EOF.
 
     Args:
@@ -136,42 +251,16 @@ def _parse_coords(data: bytes, offset: int) -> Tuple[List[No5Coord], int]:
         Tuple of list of ``No5Coord`` and the final offset (EOF).
     """
 
-    # Prepare container for parsed coordinates.
-    coords: List[No5Coord] = []
-
-    # Iterate while enough bytes remain for one full record.
+    # Only whole records take part; the rest is trailing data.
     size = _COORD_STRUCT.size
     data_len = len(data)
-    while offset + size <= data_len:
-        (
-            type_value,
-            id_nr,
-            layer,
-            pt_nr,
-            east,
-            north,
-            z,
-            uniq,
-            connexion,
-        ) = _COORD_STRUCT.unpack_from(data, offset)
-
-        # Create immutable record and append to results.
-        coords.append(
-            No5Coord(
-                type=type_value,
-                id_nr=id_nr,
-                layer=layer,
-                pt_nr=pt_nr,
-                east=east,
-                north=north,
-                z=z,
-                uniq=uniq,
-                connexion=connexion,
-            )
-        )
+    end = offset + (data_len - offset) // size * size
 
-        # Advance to next record.
-        offset += size
+    # Unpack every record in one C-level pass over a zero-copy view and
+    # build the immutable records from the field tuples.
+    rows = _COORD_STRUCT.iter_unpack(memoryview(data)[offset:end])
+    coords: List[No5Coord] = list(starmap(No5Coord, rows))
+    offset = end
 
     # Warn if trailing bytes exist that don't form a full record.
     trailing = data_len - offset
@@ -181,7 +270,35 @@ def _parse_coords(data: bytes, offset: int) -> Tuple[List[No5Coord], int]:
     return coords, offset
 
 
-def parse_no5(data: bytes) -> Tuple[No5Header, List[No5Coord]]:
+def parse_no5_columns(data: BytesLike) -> Tuple[No5Header, No5Columns]:
+    """Parse a VA50/NO5 file into columns instead of per-record objects.
+
+    Args:
+        data: File content as bytes.
+
+    Returns:
+        Tuple of (``No5Header``, ``No5Columns``).
+
+    Throws:
+        ValueError: If the buffer is too small or the header is invalid.
+    """
+
+    # Parse the header first.
+    header, offset = _parse_header(data, 0)
+
+    # Only whole records take part; log any trailing bytes.
+    size = _COORD_STRUCT.size
+    count = (len(data) - offset) // size
+    end = offset + count * size
+    if len(data) > end:
+        logger.debug("Trailing %d bytes after NO5 coords", len(data) - end)
+
+    # Unpack all records in C and transpose them into packed columns.
+    rows = _COORD_STRUCT.iter_unpack(memoryview(data)[offset:end])
+    return header, No5Columns(*_pack_columns(rows))
+
+
+def parse_no5(data: BytesLike) -> Tuple[No5Header, List[No5Coord]]:
     """Parse a VA50/NO5 file from bytes.
 
     Args:
@@ -201,4 +318,10 @@ def parse_no5(data: bytes) -> Tuple[No5Header, List[No5Coord]]:
     return header, coords
 
 
-__all__ = ["No5Header", "No5Coord", "parse_no5"]
+__all__ = [
+    "No5Header",
+    "No5Coord",
+    "No5Columns",
+    "parse_no5",
+    "parse_no5_columns",
+]
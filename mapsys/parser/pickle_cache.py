@@ -0,0 +1,83 @@
+"""On-disk pickle cache shared by the parsers.
+
+Each cache file holds one ``(version, key, payload)`` tuple. ``version`` is
+bumped by the owner whenever the pickled layout changes and ``key``
+identifies the input the payload was built from; a file whose version or key
+does not match is treated as missing.
+
+Loading a cache file unpickles it, and unpickling can run arbitrary code.
+Only read cache files from a directory you trust.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def load_pickle_cache(path: Path, version: int, key: Any) -> Any | None:
+    """Load the payload of a cache file if it is still valid.
+
+    Args:
+        path: The cache file. Must come from a trusted directory, because it
+            is unpickled.
+        version: The format version the caller expects.
+        key: The key the payload must have been stored with.
+
+    Returns:
+        The cached payload, or ``None`` if the file is missing, unreadable,
+        written by another format version, or stored under another key.
+    """
+    try:
+        with open(path, "rb") as f:
+            cached_version, cached_key, payload = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug("Ignoring unreadable cache %s: %s", path, e)
+        return None
+    if cached_version != version or cached_key != key:
+        return None
+    return payload
+
+
+def store_pickle_cache(
+    path: Path, version: int, key: Any, payload: Any
+) -> None:
+    """Write a cache file atomically.
+
+    The data goes to a temporary file in the same directory first and then
+    replaces the cache file, so readers never see a partial file. Failures
+    are logged and otherwise ignored.
+
+    Args:
+        path: The cache file; its directory is created on demand.
+        version: The format version of ``payload``.
+        key: The key identifying the input ``payload`` was built from.
+        payload: The object to pickle.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(
+                    (version, key, payload),
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except Exception as e:
+        logger.warning("Could not write cache %s: %s", path, e)
+
+
+__all__ = ["load_pickle_cache", "store_pickle_cache"]
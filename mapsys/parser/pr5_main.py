@@ -26,19 +26,37 @@ NUL (0x00) and whitespace. Unknown/opaque byte areas are kept as
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import mmap
+import os
 import struct
 from dataclasses import dataclass
-from typing import List, Tuple
+from functools import lru_cache
+from itertools import starmap
+from pathlib import Path
+from typing import Any, Callable, Iterator, Tuple, TypeVar
+
+from mapsys.parser.pickle_cache import load_pickle_cache, store_pickle_cache
+from mapsys.parser.va50 import BytesLike
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever the parsed dataclasses change shape, so that files written
+# by :func:`parse_pr5_cached` for an older layout are ignored.
+PR5_CACHE_VERSION = 2
+
+
+# Record type produced by a table parser.
+T = TypeVar("T")
+
 
 #
 # Helpers
 #
 
 
+@lru_cache(maxsize=1024)
 def _decode_c_string(buf: bytes) -> str:
     """Decode a fixed-size zero-terminated byte buffer to a Python ``str``.
 
@@ -46,6 +64,10 @@ def _decode_c_string(buf: bytes) -> str:
     that position using Windows-1250. If decoding fails for any reason, it
     falls back to UTF-8 with replacement errors handling.
 
+    Results are memoized by the raw bytes: many layer, after-layer and font
+    names in a file are identical (often all padding), so most calls are
+    cache hits.
+
     Args:
         buf: Raw bytes containing the string and padding NULs.
 
@@ -72,7 +94,7 @@ def _decode_c_string(buf: bytes) -> str:
 #
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FontEntry:
     """Single font table entry.
 
@@ -85,7 +107,7 @@ class FontEntry:
     raw: bytes
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LayerAttribute:
     """Per-layer attribute as described by the ImHex layout.
 
@@ -110,7 +132,7 @@ class LayerAttribute:
     d_y: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Layer:
     """One PR5 layer with title, style and 9 attributes.
 
@@ -128,7 +150,7 @@ class Layer:
     attribs: Tuple[LayerAttribute, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TheNine:
     """Six bytes of unknown data, repeated nine times in the header.
 
@@ -144,7 +166,7 @@ class TheNine:
     b5: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AfterLayers:
     """Record following the 256 layers.
 
@@ -161,7 +183,7 @@ class AfterLayers:
     unk: bytes
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Header:
     """PR5 header.
 
@@ -195,7 +217,7 @@ class Header:
     pad_again: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Pr5File:
     """Entire parsed PR5 file."""
 
@@ -220,15 +242,43 @@ class Pr5File:
 _HEADER_PART1 = struct.Struct("<6sB3B256s256sHHH6B5dB4dH")
 _THE_NINE = struct.Struct("<6B")
 
+# The nine[] header array unpacked with a single call.
+_NINE_BLOCK = struct.Struct("<" + _THE_NINE.format[1:] * 9)
+
 _LAYER_PREFIX = struct.Struct("<4B64s12sBB81s")
-_LAYER_ATTR = struct.Struct("<f3xB3xBBff")
+_LAYER_ATTR = struct.Struct("<f3sB3sBBff")
+
+# A whole layer, the prefix followed by its nine attributes, unpacked with a
+# single call; each attribute contributes ``_LAYER_ATTR_FIELDS`` values.
+_LAYER = struct.Struct(_LAYER_PREFIX.format + _LAYER_ATTR.format[1:] * 9)
+_LAYER_PREFIX_FIELDS = 9
+_LAYER_ATTR_FIELDS = 8
 
 _AFTER_LAYERS = struct.Struct("<I H 64s B 2x B B 24s")
 
 _FONT_ENTRY_RAW = struct.Struct("<13s")  # 12 name + 1 final NUL
-
-
-def _parse_header(data: bytes, offset: int = 0) -> Tuple[Header, int]:
+_FONT_COUNT = 20
+
+# Everything after the after-layers table, unpacked with a single call:
+# some_final_stuff, all_characters, ones, the font entries, the two u16
+# values, two zeros, the mdb buffer and the final zero buffer.
+_PR5_TRAILER = struct.Struct(
+    "<4s256s256s" + _FONT_ENTRY_RAW.format[1:] * _FONT_COUNT + "HH2s256s256s"
+)
+
+# Every block of a PR5 file has a fixed size, so the whole file does too:
+# header, nine[], pad, layers, after-layers and the trailer.
+_PR5_SIZE = (
+    _HEADER_PART1.size
+    + _NINE_BLOCK.size
+    + 1
+    + _LAYER.size * 256
+    + _AFTER_LAYERS.size * 256
+    + _PR5_TRAILER.size
+)
+
+
+def _parse_header(data: BytesLike, offset: int = 0) -> Tuple[Header, int]:
     """Parse the file header.
 
     Args:
@@ -243,7 +293,7 @@ def _parse_header(data: bytes, offset: int = 0) -> Tuple[Header, int]:
         ValueError: If the buffer is too small or the signature is invalid.
     """
 
-    if len(data) - offset < _HEADER_PART1.size + (_THE_NINE.size * 9) + 1:
+    if len(data) - offset < _HEADER_PART1.size + (_NINE_BLOCK.size) + 1:
         raise ValueError("Buffer too small for PR5 header")
 
     (
@@ -278,11 +328,13 @@ def _parse_header(data: bytes, offset: int = 0) -> Tuple[Header, int]:
 
     offset += _HEADER_PART1.size
 
-    nine_list: List[TheNine] = []
-    for _ in range(9):
-        b0, b1, b2, b3, b4, b5 = _THE_NINE.unpack_from(data, offset)
-        nine_list.append(TheNine(b0, b1, b2, b3, b4, b5))
-        offset += _THE_NINE.size
+    nine = tuple(
+        starmap(
+            TheNine,
+            _group_values(_NINE_BLOCK.unpack_from(data, offset), 0, 6),
+        )
+    )
+    offset += _NINE_BLOCK.size
 
     # Single pad byte following the nine[] array
     if offset >= len(data):
@@ -317,22 +369,38 @@ def _parse_header(data: bytes, offset: int = 0) -> Tuple[Header, int]:
         north_min=north_min,
         north_max=north_max,
         two=two,
-        nine=tuple(nine_list),
+        nine=nine,
         pad_again=pad_again,
     )
 
     return header, offset
 
 
-def _parse_layer(data: bytes, offset: int) -> Tuple[Layer, int]:
-    """Parse one ``Layer`` record.
+def _group_values(
+    values: Tuple[Any, ...], start: int, size: int
+) -> Iterator[Tuple[Any, ...]]:
+    """Split ``values[start:]`` into consecutive groups of ``size`` items.
 
     Args:
-        data: Entire file buffer.
-        offset: Offset at which the layer starts.
+        values: A flat tuple from ``struct.unpack_from``.
+        start: Index of the first value to group.
+        size: Number of values per group.
 
     Returns:
-        A tuple of the parsed :class:`Layer` and the new offset.
+        An iterator over the groups.
+    """
+    rest = iter(values[start:])
+    return zip(*([rest] * size))
+
+
+def _layer_from_values(values: Tuple[Any, ...]) -> Layer:
+    """Build one ``Layer`` from its unpacked ``_LAYER`` values.
+
+    Args:
+        values: The flat tuple produced by ``_LAYER``.
+
+    Returns:
+        The parsed :class:`Layer`.
     """
 
     (
@@ -345,42 +413,34 @@ def _parse_layer(data: bytes, offset: int) -> Tuple[Layer, int]:
         color,
         weight,
         content2,
-    ) = _LAYER_PREFIX.unpack_from(data, offset)
-    offset += _LAYER_PREFIX.size
-
-    attribs: List[LayerAttribute] = []
-    for _ in range(9):
-        (
+    ) = values[:_LAYER_PREFIX_FIELDS]
+
+    # The opaque 3-byte blobs are unpacked as ``3s`` fields, so every
+    # attribute comes straight from the single unpack above.
+    attribs = [
+        LayerAttribute(
+            height=height,
+            scale=scale,
+            color=color_attr,
+            content1=content1_blob,
+            content2=content2_blob,
+            content3=content3,
+            d_x=d_x,
+            d_y=d_y,
+        )
+        for (
             height,
+            content1_blob,
             scale,
+            content2_blob,
             color_attr,
             content3,
             d_x,
             d_y,
-        ) = _LAYER_ATTR.unpack_from(data, offset)
-
-        # Note: _LAYER_ATTR uses explicit padding (3x and 3x) to skip the two
-        # opaque 3-byte blobs described by the ImHex script. We recover them
-        # from the raw slice to retain the information.
-        raw = data[offset : offset + _LAYER_ATTR.size]
-        content1_blob = raw[4:7]
-        content2_blob = raw[8:11]
-
-        attribs.append(
-            LayerAttribute(
-                height=height,
-                scale=scale,
-                color=color_attr,
-                content1=bytes(content1_blob),
-                content2=bytes(content2_blob),
-                content3=content3,
-                d_x=d_x,
-                d_y=d_y,
-            )
-        )
-        offset += _LAYER_ATTR.size
+        ) in _group_values(values, _LAYER_PREFIX_FIELDS, _LAYER_ATTR_FIELDS)
+    ]
 
-    layer = Layer(
+    return Layer(
         first_four=(f1, f2, f3, f4),
         title=_decode_c_string(title_b),
         color=color,
@@ -389,18 +449,16 @@ def _parse_layer(data: bytes, offset: int) -> Tuple[Layer, int]:
         content2=content2,
         attribs=tuple(attribs),
     )
-    return layer, offset
 
 
-def _parse_after_layers(data: bytes, offset: int) -> Tuple[AfterLayers, int]:
-    """Parse one ``AfterLayers`` record.
+def _after_layers_from_values(values: Tuple[Any, ...]) -> AfterLayers:
+    """Build one ``AfterLayers`` record from its unpacked values.
 
     Args:
-        data: Entire file buffer.
-        offset: Offset at which the record starts.
+        values: The tuple produced by ``_AFTER_LAYERS``.
 
     Returns:
-        A tuple of the parsed :class:`AfterLayers` and the new offset.
+        The parsed :class:`AfterLayers`.
     """
 
     (
@@ -411,12 +469,11 @@ def _parse_after_layers(data: bytes, offset: int) -> Tuple[AfterLayers, int]:
         has_value_1,
         has_value_2,
         unk,
-    ) = _AFTER_LAYERS.unpack_from(data, offset)
+    ) = values
 
     _ = final_nul  # field present in layout; content absorbed by name decoding
-    offset += _AFTER_LAYERS.size
 
-    rec = AfterLayers(
+    return AfterLayers(
         first_four=first_four,
         zero_two=zero_two,
         name=_decode_c_string(name_b),
@@ -424,26 +481,48 @@ def _parse_after_layers(data: bytes, offset: int) -> Tuple[AfterLayers, int]:
         has_value_2=has_value_2,
         unk=unk,
     )
-    return rec, offset
 
 
-def _parse_font_entry(data: bytes, offset: int) -> Tuple[FontEntry, int]:
-    """Parse a single font table entry.
+def _parse_table(
+    data: memoryview,
+    offset: int,
+    record: struct.Struct,
+    count: int,
+    build: Callable[[Tuple[Any, ...]], T],
+) -> Tuple[Tuple[T, ...], int]:
+    """Parse ``count`` consecutive fixed-size records.
+
+    All records are unpacked by ``iter_unpack`` in one C-level pass over a
+    view of the table. The caller checks the buffer size beforehand.
 
     Args:
-        data: Entire file buffer.
-        offset: Offset at which the entry starts.
+        data: View over the file content.
+        offset: Offset of the first record.
+        record: Layout of one record.
+        count: Number of records.
+        build: Turns the unpacked values of a record into its object.
+
+    Returns:
+        A tuple of the built records and the offset after the table.
+    """
+    end = offset + count * record.size
+    rows = record.iter_unpack(data[offset:end])
+    return tuple(map(build, rows)), end
+
+
+def _font_entry_from_raw(raw13: bytes) -> FontEntry:
+    """Build a font table entry from its 13 raw bytes.
+
+    Args:
+        raw13: The 12-byte name plus the final NUL.
 
     Returns:
-        A tuple of the parsed :class:`FontEntry` and the new offset.
+        The parsed :class:`FontEntry`.
     """
-    (raw13,) = _FONT_ENTRY_RAW.unpack_from(data, offset)
-    offset += _FONT_ENTRY_RAW.size
-    name = _decode_c_string(raw13[:12])
-    return FontEntry(name=name, raw=raw13), offset
+    return FontEntry(name=_decode_c_string(raw13[:12]), raw=raw13)
 
 
-def parse_pr5(data: bytes) -> Pr5File:
+def parse_pr5(data: BytesLike) -> Pr5File:
     """Parse a PR5 file from bytes.
 
     This function orchestrates parsing of the header, layers, after-layers
@@ -460,80 +539,148 @@ def parse_pr5(data: bytes) -> Pr5File:
         or if the header signature is invalid.
     """
 
+    # Parse through a view so slices do not copy; the view is released
+    # before returning, so a file mapping behind it can be closed.
+    with memoryview(data) as view:
+        return _parse_pr5_view(view)
+
+
+def _parse_pr5_view(data: memoryview) -> Pr5File:
+    """Parse a PR5 file from a byte view.
+
+    Slices of ``data`` are views too; only the opaque blocks kept in the
+    result are copied out with ``bytes``.
+
+    Args:
+        data: View over the file content.
+
+    Returns:
+        Fully parsed :class:`Pr5File` instance.
+
+    Throws:
+        ValueError: If the buffer is too small for any of the required blocks
+        or if the header signature is invalid.
+    """
+
     # Header
     header, offset = _parse_header(data, 0)
 
-    # 256 layers
-    layers: List[Layer] = []
-    for _ in range(256):
-        layer, offset = _parse_layer(data, offset)
-        layers.append(layer)
-
-    # 256 AfterLayers
-    after_list: List[AfterLayers] = []
-    for _ in range(256):
-        rec, offset = _parse_after_layers(data, offset)
-        after_list.append(rec)
-
-    # Final blocks
-    if offset + 4 > len(data):
-        raise ValueError("Unexpected EOF reading some_final_stuff")
-    some_final_stuff = data[offset : offset + 4]
-    offset += 4
-
-    if offset + 256 > len(data):
-        raise ValueError("Unexpected EOF reading all_characters")
-    all_characters = data[offset : offset + 256]
-    offset += 256
-
-    if offset + 256 > len(data):
-        raise ValueError("Unexpected EOF reading ones")
-    ones = data[offset : offset + 256]
-    offset += 256
-
-    # 20 font entries
-    fonts: List[FontEntry] = []
-    for _ in range(20):
-        font, offset = _parse_font_entry(data, offset)
-        fonts.append(font)
-
-    # Two u16 values and two zero bytes
-    if offset + 2 * 2 + 2 > len(data):
-        raise ValueError("Unexpected EOF reading trailer values")
-    a_30_value, a_5_value = struct.unpack_from("<HH", data, offset)
-    offset += 4
-    two_zeros = data[offset : offset + 2]
-    offset += 2
-
-    # 256-byte MDB path-like buffer
-    if offset + 256 > len(data):
-        raise ValueError("Unexpected EOF reading mdb buffer")
-    mdb_b = data[offset : offset + 256]
-    offset += 256
-    mdb = _decode_c_string(mdb_b)
-
-    # Final 256 zero bytes
-    if offset + 256 > len(data):
-        raise ValueError("Unexpected EOF reading final zero buffer")
-    empty = data[offset : offset + 256]
-    offset += 256
+    # All remaining blocks have fixed sizes; one check covers them all.
+    if len(data) < _PR5_SIZE:
+        raise ValueError(
+            f"Unexpected EOF: PR5 needs {_PR5_SIZE} bytes, got {len(data)}"
+        )
+
+    # 256 layers, then 256 AfterLayers
+    layers, offset = _parse_table(
+        data, offset, _LAYER, 256, _layer_from_values
+    )
+    after_list, offset = _parse_table(
+        data, offset, _AFTER_LAYERS, 256, _after_layers_from_values
+    )
+
+    # The trailer; the ``s`` fields come out as ``bytes`` already.
+    trailer = _PR5_TRAILER.unpack_from(data, offset)
+    some_final_stuff, all_characters, ones = trailer[:3]
+    fonts = trailer[3 : 3 + _FONT_COUNT]
+    a_30_value, a_5_value, two_zeros, mdb_b, empty = trailer[3 + _FONT_COUNT :]
 
     return Pr5File(
         head=header,
-        layers=tuple(layers),
-        after=tuple(after_list),
+        layers=layers,
+        after=after_list,
         some_final_stuff=some_final_stuff,
         all_characters=all_characters,
         ones=ones,
-        font_names=tuple(fonts),
+        font_names=tuple(map(_font_entry_from_raw, fonts)),
         a_30_value=a_30_value,
         a_5_value=a_5_value,
         two_zeros=two_zeros,
-        mdb=mdb,
+        mdb=_decode_c_string(mdb_b),
         empty=empty,
     )
 
 
+def parse_pr5_path(path: "str | os.PathLike[str]") -> Pr5File:
+    """Parse a PR5 file straight from disk.
+
+    The file is memory-mapped read-only and handed to :func:`parse_pr5`, so it
+    is never copied into a ``bytes`` object; the parsed values do not
+    reference the mapping, which is closed before returning.
+
+    Args:
+        path: Path of the PR5 file.
+
+    Returns:
+        Fully parsed :class:`Pr5File` instance.
+
+    Throws:
+        ValueError: If the file content is invalid.
+    """
+    with open(path, "rb") as f:
+        # Empty files cannot be mapped; let the parser report them.
+        if os.fstat(f.fileno()).st_size == 0:
+            return parse_pr5(b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return parse_pr5(mapped)
+
+
+def _pr5_cache_path(cache_dir: Path, data: BytesLike) -> Path:
+    """Return the cache file for a PR5 file's content.
+
+    Args:
+        cache_dir: Directory holding the cache files.
+        data: The PR5 file content.
+
+    Returns:
+        A path named after a hash of the content and the cache version.
+    """
+    digest = hashlib.blake2b(data, digest_size=16)
+    digest.update(PR5_CACHE_VERSION.to_bytes(4, "little"))
+    return cache_dir / f"{digest.hexdigest()}.pr5-cache"
+
+
+def parse_pr5_cached(
+    path: "str | os.PathLike[str]", cache_dir: "str | os.PathLike[str]"
+) -> Pr5File:
+    """Parse a PR5 file, reusing an earlier result stored in ``cache_dir``.
+
+    The cache is keyed on a hash of the file content, so an edited file is
+    parsed again while an unchanged one (even under another name) is loaded
+    from its pickle. Unreadable cache files are ignored.
+
+    Only point ``cache_dir`` at a directory you trust: cache files are
+    unpickled, and unpickling can run arbitrary code.
+
+    Args:
+        path: Path of the PR5 file.
+        cache_dir: Trusted directory holding the cache files; created on
+            demand.
+
+    Returns:
+        Fully parsed :class:`Pr5File` instance.
+
+    Throws:
+        ValueError: If the file content is invalid.
+    """
+    with open(path, "rb") as f:
+        # Empty files cannot be mapped; let the parser report them.
+        if os.fstat(f.fileno()).st_size == 0:
+            return parse_pr5(b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            cache_path = _pr5_cache_path(Path(cache_dir), mapped)
+            cached = load_pickle_cache(
+                cache_path, PR5_CACHE_VERSION, cache_path.stem
+            )
+            if isinstance(cached, Pr5File):
+                return cached
+
+            pr5 = parse_pr5(mapped)
+
+    store_pickle_cache(cache_path, PR5_CACHE_VERSION, cache_path.stem, pr5)
+    return pr5
+
+
 __all__ = [
     "FontEntry",
     "LayerAttribute",
@@ -543,4 +690,6 @@ __all__ = [
     "Header",
     "Pr5File",
     "parse_pr5",
+    "parse_pr5_path",
+    "parse_pr5_cached",
 ]
@@ -31,9 +31,16 @@ Coord record (repeated until EOF, little-endian):
 from __future__ import annotations
 
 import logging
+import mmap
+import os
 import struct
+from array import array
 from dataclasses import dataclass
-from typing import List, Tuple
+from itertools import compress, starmap
+from operator import and_
+from typing import Any, Iterator, List, Tuple, TypeAlias
+
+from mapsys.parser.va50 import VA50_SIGNATURE, BytesLike
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +48,10 @@ logger = logging.getLogger(__name__)
 #
 # Binary struct formats (little-endian)
 #
-_TE5_HEADER_STRUCT = struct.Struct("<4sB6I")
+_TE5_HEADER_STRUCT = struct.Struct("<IB6I")
+
+# Header bytes after the signature when ``unk`` and all padding are zero.
+_ZERO_HEADER_BODY = bytes(_TE5_HEADER_STRUCT.size - 4)
 
 #
 # Order matches the ImHex Coord struct exactly.
@@ -49,6 +59,13 @@ _TE5_HEADER_STRUCT = struct.Struct("<4sB6I")
 #
 _TE5_COORD_STRUCT = struct.Struct("<BIBBBffddfffIB")
 
+# Byte positions of ``first_zero`` and ``flags`` inside a Coord record.
+_FIRST_ZERO_POS = 0
+_FLAGS_POS = 7
+
+# Truth table keeping records whose ``first_zero`` byte is zero.
+_LIVE_TABLE = bytes([1]) + bytes(255)
+
 
 #
 # Flag constants for the Coord.flags field.
@@ -59,9 +76,11 @@ FLAG_TRUE_TYPE_FONT = 0x20
 
 # Composed types used in data classes
 Te5PadSix = Tuple[int, int, int, int, int, int]
+IntColumn: TypeAlias = "array[int]"
+FloatColumn: TypeAlias = "array[float]"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Te5Header:
     """TE5/VA50 header.
 
@@ -76,10 +95,13 @@ class Te5Header:
     pad: Te5PadSix
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Te5TextMeta:
     """Single TE5 text metadata record.
 
+    Instances are slotted, like the other parsed records, so a file with
+    many texts does not carry one ``__dict__`` per record.
+
     Attributes:
         first_zero: Observed as 0 or 1; potentially marks deleted/missing.
         text_id: Unique text identifier.
@@ -154,7 +176,118 @@ class Te5TextMeta:
         return (self.flags & flag_value) == flag_value
 
 
-def _parse_te5_header(data: bytes, offset: int = 0) -> Tuple[Te5Header, int]:
+@dataclass(frozen=True, slots=True)
+class Te5Columns:
+    """TE5 text metadata stored column by column (structure of arrays).
+
+    Each attribute is a packed ``array.array`` with one item per record, in
+    file order; see :class:`Te5TextMeta` for the meaning of each column.
+    Single-precision fields stay in ``array("f")`` like in the file.
+
+    Attributes:
+        first_zero: Deleted/missing markers (``array("B")``).
+        text_id: Unique text identifiers (``array("I")``).
+        layer: Zero-based layer indices (``array("B")``).
+        font: Zero-based font indices (``array("B")``).
+        flags: Bit flags, see ``FLAG_*`` (``array("B")``).
+        height: Text heights (``array("f")``).
+        direction: Text directions (``array("f")``).
+        east: X coordinates (``array("d")``).
+        north: Y coordinates (``array("d")``).
+        align_east: Alignment offsets along east (``array("f")``).
+        align_north: Alignment offsets along north (``array("f")``).
+        z: Elevations (``array("f")``).
+        offset: Offsets inside the text store (``array("I")``).
+        length: Stored lengths including the NUL (``array("B")``).
+    """
+
+    first_zero: IntColumn
+    text_id: IntColumn
+    layer: IntColumn
+    font: IntColumn
+    flags: IntColumn
+    height: FloatColumn
+    direction: FloatColumn
+    east: FloatColumn
+    north: FloatColumn
+    align_east: FloatColumn
+    align_north: FloatColumn
+    z: FloatColumn
+    offset: IntColumn
+    length: IntColumn
+
+    def __len__(self) -> int:
+        """Return the number of records."""
+        return len(self.text_id)
+
+    def has_flag(self, flag_value: int) -> bytes:
+        """Test ``flag_value`` on every record at once.
+
+        The flags column is mapped through a 256-entry table with
+        ``bytes.translate``, a single C-level pass, instead of calling
+        :meth:`Te5TextMeta.has_flag` per record.
+
+        Args:
+            flag_value: Bit mask to test.
+
+        Returns:
+            One byte per record: 1 if all bits in ``flag_value`` are set,
+            0 otherwise.
+        """
+        flags = self.flags
+        return _byte_column_mask(
+            flags, 0, len(flags), 1, _flag_table(flag_value)
+        )
+
+    def row(self, index: int) -> Te5TextMeta:
+        """Build the ``Te5TextMeta`` record at ``index``.
+
+        Args:
+            index: Zero-based record index.
+
+        Returns:
+            The record as a ``Te5TextMeta``.
+        """
+        return Te5TextMeta(
+            self.first_zero[index],
+            self.text_id[index],
+            self.layer[index],
+            self.font[index],
+            self.flags[index],
+            self.height[index],
+            self.direction[index],
+            self.east[index],
+            self.north[index],
+            self.align_east[index],
+            self.align_north[index],
+            self.z[index],
+            self.offset[index],
+            self.length[index],
+        )
+
+
+# Array type codes of the ``Te5Columns`` fields, in record order.
+_COLUMN_TYPECODES = (
+    "B",
+    "I",
+    "B",
+    "B",
+    "B",
+    "f",
+    "f",
+    "d",
+    "d",
+    "f",
+    "f",
+    "f",
+    "I",
+    "B",
+)
+
+
+def _parse_te5_header(
+    data: BytesLike, offset: int = 0
+) -> Tuple[Te5Header, int]:
     """Parse the TE5 header starting at ``offset``.
 
     Args:
@@ -173,16 +306,21 @@ def _parse_te5_header(data: bytes, offset: int = 0) -> Tuple[Te5Header, int]:
         raise ValueError("Buffer too small for TE5 header")
 
     # Unpack fields using the predefined struct.
-    signature, unk, p1, p2, p3, p4, p5, p6 = _TE5_HEADER_STRUCT.unpack_from(
+    sig_u32, unk, p1, p2, p3, p4, p5, p6 = _TE5_HEADER_STRUCT.unpack_from(
         data, offset
     )
+    signature = sig_u32.to_bytes(4, "little")
 
     # Validate the signature.
-    if signature != b"VA50":
+    if sig_u32 != VA50_SIGNATURE:
         raise ValueError("Invalid TE5 signature: %r" % (signature,))
 
-    # Sanity: all-zero padding with unk=0 is considered invalid header.
-    if unk == 0 and (p1, p2, p3, p4, p5, p6) == (0, 0, 0, 0, 0, 0):
+    # Sanity: all-zero padding with unk=0 is considered invalid header;
+    # a single slice comparison covers all seven fields.
+    if (
+        data[offset + 4 : offset + _TE5_HEADER_STRUCT.size]
+        == _ZERO_HEADER_BODY
+    ):
         raise ValueError("Invalid TE5 header values")
 
     # Build the header dataclass and return with new offset.
@@ -192,65 +330,95 @@ def _parse_te5_header(data: bytes, offset: int = 0) -> Tuple[Te5Header, int]:
     return header, offset + _TE5_HEADER_STRUCT.size
 
 
+def _flag_table(flag_value: int) -> bytes:
+    """Build the truth table of ``flag_value`` for every flags byte.
+
+    Args:
+        flag_value: Bit mask to test.
+
+    Returns:
+        256 bytes; entry ``v`` is 1 if all bits of ``flag_value`` are set
+        in ``v``, 0 otherwise.
+    """
+    return bytes((value & flag_value) == flag_value for value in range(256))
+
+
+def _byte_column_mask(
+    data: BytesLike | IntColumn,
+    start: int,
+    end: int,
+    step: int,
+    table: bytes,
+) -> bytes:
+    """Map one byte of every record through a 256-entry truth table.
+
+    Args:
+        data: Entire file as bytes, or a one-byte-per-item column.
+        start: Position of the byte in the first record.
+        end: End of the record area.
+        step: Record size.
+        table: ``table[v]`` is non-zero for the byte values to keep.
+
+    Returns:
+        One selector byte per record.
+    """
+    with memoryview(data) as view:
+        column = view[start:end:step].tobytes()
+    return column.translate(table)
+
+
 def _parse_text_meta_records(
-    data: bytes, offset: int
+    data: BytesLike,
+    offset: int,
+    include_deleted: bool = True,
+    flag_value: int | None = None,
 ) -> Tuple[List[Te5TextMeta], int]:
     """Parse TE5 Coord records until EOF.
 
     Args:
         data: Entire file as bytes.
         offset: Offset to the first record.
+        include_deleted: Whether records with a non-zero ``first_zero`` are
+            kept.
+        flag_value: If given, only records with all these flag bits set
+            are kept.
 
     Returns:
         Tuple of list of ``Te5TextMeta`` and the final offset (EOF).
     """
 
-    # Prepare container for parsed records.
-    records: List[Te5TextMeta] = []
-
-    # Iterate while enough bytes remain for one full record.
+    # Only whole records take part; the rest is trailing data.
     size = _TE5_COORD_STRUCT.size
     data_len = len(data)
-    while offset + size <= data_len:
-        (
-            first_zero,
-            text_id,
-            layer,
-            font,
-            flags,
-            height,
-            direction,
-            east,
-            north,
-            align_east,
-            align_north,
-            z,
-            rel_offset,
-            length,
-        ) = _TE5_COORD_STRUCT.unpack_from(data, offset)
-
-        # Create immutable record and append to results.
-        records.append(
-            Te5TextMeta(
-                first_zero=first_zero,
-                text_id=text_id,
-                layer=layer,
-                font=font,
-                flags=flags,
-                height=height,
-                direction=direction,
-                east=east,
-                north=north,
-                align_east=align_east,
-                align_north=align_north,
-                z=z,
-                offset=rel_offset,
-                length=length,
+    end = offset + (data_len - offset) // size * size
+
+    # Unpack every record in one C-level pass over a zero-copy view; the
+    # field order of ``Te5TextMeta`` matches the struct layout.
+    rows: Iterator[Tuple[Any, ...]] = _TE5_COORD_STRUCT.iter_unpack(
+        memoryview(data)[offset:end]
+    )
+
+    # Filters test single bytes read straight from the buffer, so rejected
+    # records are dropped by ``compress`` before any object is built.
+    masks: List[bytes] = []
+    if not include_deleted:
+        masks.append(
+            _byte_column_mask(
+                data, offset + _FIRST_ZERO_POS, end, size, _LIVE_TABLE
+            )
+        )
+    if flag_value is not None:
+        masks.append(
+            _byte_column_mask(
+                data, offset + _FLAGS_POS, end, size, _flag_table(flag_value)
             )
         )
+    if masks:
+        keep = masks[0] if len(masks) == 1 else bytes(map(and_, *masks))
+        rows = compress(rows, keep)
 
-        # Advance to next record.
-        offset += size
+    records: List[Te5TextMeta] = list(starmap(Te5TextMeta, rows))
+    offset = end
 
     # Warn if trailing bytes exist that don't form a full record.
     trailing = data_len - offset
@@ -260,11 +428,53 @@ def _parse_text_meta_records(
     return records, offset
 
 
-def parse_te5(data: bytes) -> Tuple[Te5Header, List[Te5TextMeta]]:
+def parse_te5_columns(data: BytesLike) -> Tuple[Te5Header, Te5Columns]:
+    """Parse a TE5/VA50 file into columns instead of per-record objects.
+
+    Args:
+        data: File content as bytes.
+
+    Returns:
+        Tuple of (``Te5Header``, ``Te5Columns``).
+
+    Throws:
+        ValueError: If the buffer is too small or the header is invalid.
+    """
+
+    # Parse the header first.
+    header, offset = _parse_te5_header(data, 0)
+
+    # Only whole records take part; log any trailing bytes.
+    size = _TE5_COORD_STRUCT.size
+    count = (len(data) - offset) // size
+    end = offset + count * size
+    if len(data) > end:
+        logger.debug(
+            "Trailing %d bytes after TE5 text metadata", len(data) - end
+        )
+
+    # Unpack all records in C and transpose them into packed columns.
+    rows = _TE5_COORD_STRUCT.iter_unpack(memoryview(data)[offset:end])
+    columns = zip(*rows) if count else [()] * len(_COLUMN_TYPECODES)
+    packed = [
+        array(code, column) for code, column in zip(_COLUMN_TYPECODES, columns)
+    ]
+    return header, Te5Columns(*packed)
+
+
+def parse_te5(
+    data: BytesLike,
+    include_deleted: bool = True,
+    flag_value: int | None = None,
+) -> Tuple[Te5Header, List[Te5TextMeta]]:
     """Parse a TE5/VA50 text metadata file from bytes.
 
     Args:
         data: File content as bytes.
+        include_deleted: Whether records with a non-zero ``first_zero`` are
+            kept; pass ``False`` to skip them without building objects.
+        flag_value: If given, only records with all these flag bits set
+            are returned.
 
     Returns:
         Tuple of (``Te5Header``, list of ``Te5TextMeta``).
@@ -274,16 +484,47 @@ def parse_te5(data: bytes) -> Tuple[Te5Header, List[Te5TextMeta]]:
     header, offset = _parse_te5_header(data, 0)
 
     # Parse all text metadata records until EOF.
-    records, _ = _parse_text_meta_records(data, offset)
+    records, _ = _parse_text_meta_records(
+        data, offset, include_deleted, flag_value
+    )
 
     # Return structured result.
     return header, records
 
 
+def parse_te5_path(
+    path: "str | os.PathLike[str]",
+) -> Tuple[Te5Header, List[Te5TextMeta]]:
+    """Parse a TE5 file straight from disk.
+
+    The file is memory-mapped read-only and handed to :func:`parse_te5`, so it
+    is never copied into a ``bytes`` object; the parsed values do not
+    reference the mapping, which is closed before returning.
+
+    Args:
+        path: Path of the TE5 file.
+
+    Returns:
+        Tuple of (``Te5Header``, list of ``Te5TextMeta``).
+
+    Throws:
+        ValueError: If the file content is invalid.
+    """
+    with open(path, "rb") as f:
+        # Empty files cannot be mapped; let the parser report them.
+        if os.fstat(f.fileno()).st_size == 0:
+            return parse_te5(b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return parse_te5(mapped)
+
+
 __all__ = [
     "Te5Header",
     "Te5TextMeta",
+    "Te5Columns",
     "FLAG_TEXT_FRAME",
     "FLAG_TRUE_TYPE_FONT",
     "parse_te5",
+    "parse_te5_columns",
+    "parse_te5_path",
 ]
@@ -18,19 +18,26 @@ starts (i.e. offset 0 corresponds to the first string after the header).
 from __future__ import annotations
 
 import logging
+import mmap
+import os
 import struct
 from dataclasses import dataclass
+from itertools import accumulate
 from typing import List, Tuple
 
+from mapsys.parser.va50 import VA50_SIGNATURE, BytesLike
+
 logger = logging.getLogger(__name__)
 
 
-_TS5_HEADER_STRUCT = struct.Struct("<4s4IB")
+_TS5_HEADER_STRUCT = struct.Struct("<I4IB")
+
 # Composed types used in data classes
 Ts5IntQuad = Tuple[int, int, int, int]
+Ts5Columns = Tuple[List[int], List[str]]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Ts5Header:
     """TS5 file header.
 
@@ -45,7 +52,7 @@ class Ts5Header:
     pad: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Ts5Text:
     """A single text entry extracted from a TS5 file.
 
@@ -58,7 +65,9 @@ class Ts5Text:
     text: str
 
 
-def _parse_ts5_header(data: bytes, offset: int = 0) -> Tuple[Ts5Header, int]:
+def _parse_ts5_header(
+    data: BytesLike, offset: int = 0
+) -> Tuple[Ts5Header, int]:
     """Parse the TS5 header starting at ``offset``.
 
     Args:
@@ -75,64 +84,100 @@ def _parse_ts5_header(data: bytes, offset: int = 0) -> Tuple[Ts5Header, int]:
     if len(data) - offset < _TS5_HEADER_STRUCT.size:
         raise ValueError("Buffer too small for TS5 header")
 
-    signature, i1, i2, i3, i4, pad = _TS5_HEADER_STRUCT.unpack_from(
-        data, offset
-    )
-    if signature != b"VA50":
+    sig_u32, i1, i2, i3, i4, pad = _TS5_HEADER_STRUCT.unpack_from(data, offset)
+    signature = sig_u32.to_bytes(4, "little")
+    if sig_u32 != VA50_SIGNATURE:
         raise ValueError("Invalid TS5 signature: %r" % (signature,))
 
     header = Ts5Header(signature=signature, int1=(i1, i2, i3, i4), pad=pad)
     return header, offset + _TS5_HEADER_STRUCT.size
 
 
-def _parse_cstrings_until_eof(
-    data: bytes, offset: int
-) -> Tuple[List[Ts5Text], int]:
-    """Parse null-terminated strings until EOF.
+def _decode_cstring(raw: bytes, start: int) -> str:
+    """Decode one TS5 string.
+
+    Args:
+        raw: The string bytes without the NUL terminator.
+        start: Absolute offset of the string, used in log messages.
+
+    Returns:
+        The Windows-1250 text, or the UTF-8 text with replacement characters
+        when the bytes are not valid Windows-1250.
+    """
+    try:
+        return raw.decode("windows-1250")
+    except UnicodeDecodeError:
+        logger.debug(
+            "Invalid Windows-1250 sequence in TS5 at %d; using UTF-8 repl",
+            start,
+        )
+        return raw.decode("utf-8", errors="replace")
+
+
+def _parse_cstring_columns(
+    data: BytesLike, offset: int
+) -> Tuple[Ts5Columns, int]:
+    """Parse null-terminated strings until EOF into parallel columns.
 
     For each string, record its starting offset relative to the string block
     and decode using Windows-1250 by default. If decoding fails, fall back to
     UTF-8 with replacement for invalid sequences.
+
+    Args:
+        data: Entire file as bytes.
+        offset: Offset of the first string (start of the string block).
+
+    Returns:
+        A tuple ``((offsets, texts), end_offset)`` where ``offsets[i]`` is
+        the block-relative start of ``texts[i]``.
     """
-    original_o = offset
-    texts: List[Ts5Text] = []
     end = len(data)
 
-    while offset < end:
+    # Slicing a memoryview yields another view, which has no decode or
+    # split; the block is copied once so every buffer type behaves alike.
+    block = bytes(data[offset:end])
+
+    # Windows-1250 is a single-byte encoding, so the whole block decodes in
+    # one codec call and character positions equal byte positions.
+    try:
+        texts = block.decode("windows-1250").split("\x00")
+        lengths = list(map(len, texts))
+    except UnicodeDecodeError:
+        # Some string is not valid Windows-1250; split the bytes and decode
+        # each string on its own so only that one falls back to UTF-8.
+        parts = block.split(b"\x00")
+        lengths = list(map(len, parts))
+        texts = []
         start = offset
+        for raw in parts:
+            texts.append(_decode_cstring(raw, start))
+            start += len(raw) + 1
 
-        # Find NUL terminator; if not found, consume the rest as last string.
-        try:
-            nul_index = data.index(0, start, end)
-            raw = data[start:nul_index]
-            offset = nul_index + 1
-        except ValueError:
-            raw = data[start:end]
-            offset = end
+    # A terminated last string leaves an empty tail, which is not a string
+    # of its own.
+    if not lengths[-1]:
+        texts.pop()
+        lengths.pop()
 
-        # Decode as Windows-1250 (common for these files). Empty strings ok.
-        try:
-            text = raw.decode("windows-1250")
-        except UnicodeDecodeError:
-            logger.debug(
-                "Invalid Windows-1250 sequence in TS5 at %d; using UTF-8 repl",
-                start,
-            )
-            text = raw.decode("utf-8", errors="replace")
+    # Each string starts right after the previous one and its terminator.
+    offsets = list(accumulate((n + 1 for n in lengths), initial=0))
+    del offsets[-1]
 
-        texts.append(Ts5Text(offset=start - original_o, text=text))
+    offset = end
+    return (offsets, texts), offset
 
-    return texts, offset
 
+def parse_ts5_columns(data: BytesLike) -> Tuple[Ts5Header, Ts5Columns]:
+    """Parse a VA50/TS5 file into parallel offset and text columns.
 
-def parse_ts5(data: bytes) -> Tuple[Ts5Header, List[Ts5Text]]:
-    """Parse a VA50/TS5 file from bytes.
+    This is the column-oriented counterpart of :func:`parse_ts5`; building
+    an offset lookup from it is a plain ``dict(zip(offsets, texts))``.
 
     Args:
         data: File content as bytes.
 
     Returns:
-        Tuple of (``Ts5Header``, list of ``Ts5Text``).
+        Tuple of (``Ts5Header``, ``(offsets, texts)``).
 
     Raises:
         ValueError: If the header is invalid or the buffer is too small.
@@ -146,8 +191,57 @@ def parse_ts5(data: bytes) -> Tuple[Ts5Header, List[Ts5Text]]:
     if header.int1 == (0, 0, 0, 0) and header.pad == 0 and len(data) == offset:
         raise ValueError("Invalid TS5 header values")
 
-    texts, _ = _parse_cstrings_until_eof(data, offset)
-    return header, texts
+    columns, _ = _parse_cstring_columns(data, offset)
+    return header, columns
+
 
+def parse_ts5(data: BytesLike) -> Tuple[Ts5Header, List[Ts5Text]]:
+    """Parse a VA50/TS5 file from bytes.
 
-__all__ = ["Ts5Header", "Ts5Text", "parse_ts5"]
+    Args:
+        data: File content as bytes.
+
+    Returns:
+        Tuple of (``Ts5Header``, list of ``Ts5Text``).
+
+    Raises:
+        ValueError: If the header is invalid or the buffer is too small.
+    """
+
+    header, (offsets, texts) = parse_ts5_columns(data)
+    return header, list(map(Ts5Text, offsets, texts))
+
+
+def parse_ts5_path(
+    path: "str | os.PathLike[str]",
+) -> Tuple[Ts5Header, List[Ts5Text]]:
+    """Parse a TS5 file straight from disk.
+
+    The file is memory-mapped read-only and handed to :func:`parse_ts5`, so it
+    is never copied into a ``bytes`` object; the parsed values do not
+    reference the mapping, which is closed before returning.
+
+    Args:
+        path: Path of the TS5 file.
+
+    Returns:
+        Tuple of (``Ts5Header``, list of ``Ts5Text``).
+
+    Raises:
+        ValueError: If the file content is invalid.
+    """
+    with open(path, "rb") as f:
+        # Empty files cannot be mapped; let the parser report them.
+        if os.fstat(f.fileno()).st_size == 0:
+            return parse_ts5(b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return parse_ts5(mapped)
+
+
+__all__ = [
+    "Ts5Header",
+    "Ts5Text",
+    "parse_ts5",
+    "parse_ts5_columns",
+    "parse_ts5_path",
+]
@@ -0,0 +1,20 @@
+"""Definitions shared by the VA50 table parsers.
+
+Every MapSys table file (AL5, AR5, AS5, NO5, TE5, TS5) starts with a
+b"VA50" signature.
+"""
+
+from __future__ import annotations
+
+import mmap
+from typing import Union
+
+# Buffers the parsers accept: plain bytes, a read-only file mapping or a
+# view over either.
+BytesLike = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+# The b"VA50" signature read as a little-endian u32, compared as one integer.
+VA50_SIGNATURE = int.from_bytes(b"VA50", "little")
+
+
+__all__ = ["BytesLike", "VA50_SIGNATURE"]
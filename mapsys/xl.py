@@ -23,21 +23,36 @@ from __future__ import annotations
 import dataclasses
 import datetime
 import logging
-from collections.abc import Iterable
+import warnings
+from collections.abc import Iterable, Sequence
 from dataclasses import is_dataclass
+from functools import lru_cache
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, Callable, cast
 
 from openpyxl import Workbook
+from openpyxl.cell import Cell, WriteOnlyCell
 from openpyxl.utils import get_column_letter
-from openpyxl.worksheet.table import Table, TableStyleInfo
+from openpyxl.worksheet.table import Table, TableColumn, TableStyleInfo
 from openpyxl.worksheet.worksheet import Worksheet
 
 if TYPE_CHECKING:  # import only for type checking to avoid runtime deps
+    from openpyxl.worksheet._write_only import WriteOnlyWorksheet
+
     from mapsys.parser.content import Content as _Content
 
 logger = logging.getLogger(__name__)
 
+# Returns the field values of a row object as a tuple.
+RowGetter = Callable[[Any], tuple[Any, ...]]
+
+# Exact types written to a cell unchanged (``bytes`` is hex-encoded).
+_PLAIN_TYPES = frozenset({type(None), bool, int, float, str})
+
+# Exact types of the values ``_is_primitive`` accepts.
+_PRIMITIVE_TYPES = _PLAIN_TYPES | {bytes}
+
 
 #
 # Utilities
@@ -50,7 +65,45 @@ def _is_primitive(value: Any) -> bool:
     Known primitives include: None, bool, int, float, str, bytes.
     """
 
-    return value is None or isinstance(value, (bool, int, float, str, bytes))
+    # Exact types first; subclasses (e.g. enums) take the slower check.
+    return type(value) in _PRIMITIVE_TYPES or isinstance(
+        value, (bool, int, float, str, bytes)
+    )
+
+
+def _cell_value(value: Any) -> Any:
+    """Return primitive ``value`` as written to a cell (bytes as hex)."""
+
+    return value.hex() if isinstance(value, bytes) else value
+
+
+def _text_width(value: Any) -> int:
+    """Return the number of characters ``value`` shows in a cell."""
+
+    return len(str(value)) if value is not None else 0
+
+
+@lru_cache(maxsize=None)
+def _dataclass_schema(cls: type) -> tuple[tuple[str, ...], RowGetter]:
+    """Return the field names of dataclass ``cls`` and a getter for them.
+
+    ``dataclasses.fields`` is slow and the schema is the same for every row
+    of a table, so it is computed once per type.
+
+    Args:
+        cls: A dataclass type.
+
+    Returns:
+        The field names in definition order and a callable returning the
+        field values of an instance as a tuple, in the same order.
+    """
+    names = tuple(field.name for field in dataclasses.fields(cls))
+    if len(names) == 1:
+        name = names[0]
+        return names, lambda obj: (getattr(obj, name),)
+    if not names:
+        return names, lambda obj: ()
+    return names, attrgetter(*names)
 
 
 def _flatten_value(prefix: str, value: Any, out: dict[str, Any]) -> None:
@@ -63,20 +116,20 @@ def _flatten_value(prefix: str, value: Any, out: dict[str, Any]) -> None:
     - Unknown objects: store their string representation.
     """
 
-    # Guard: primitives
-    if _is_primitive(value):
-        if isinstance(value, bytes):
-            out[prefix] = value.hex()
-        else:
-            out[prefix] = value
+    # Guard: primitives, dispatched on the exact type first
+    kind = type(value)
+    if kind in _PLAIN_TYPES:
+        out[prefix] = value
+        return
+    if kind is bytes or _is_primitive(value):
+        out[prefix] = _cell_value(value)
         return
 
     # Dataclass
     if is_dataclass(value):
-        for field in dataclasses.fields(value):
-            _flatten_value(
-                f"{prefix}_{field.name}", getattr(value, field.name), out
-            )
+        names, getter = _dataclass_schema(cast(type, type(value)))
+        for name, item in zip(names, getter(value)):
+            _flatten_value(f"{prefix}_{name}", item, out)
         return
 
     # Mapping-like (skip to avoid spreading arbitrary dicts; stringify)
@@ -105,18 +158,24 @@ def _row_dict_from_obj(index: int, obj: Any) -> dict[str, Any]:
     row: dict[str, Any] = {"idx": index}
 
     # Primitive at top-level: store under a generic 'value' column.
+    if type(obj) in _PLAIN_TYPES:
+        row["value"] = obj
+        return row
     if _is_primitive(obj):
-        if isinstance(obj, bytes):
-            row["value"] = obj.hex()
-        else:
-            row["value"] = obj
+        row["value"] = _cell_value(obj)
         return row
 
     # Decide object kind
     if is_dataclass(obj):
-        for field in dataclasses.fields(obj):
-            value = getattr(obj, field.name)
-            _flatten_value(field.name, value, row)
+        names, getter = _dataclass_schema(cast(type, type(obj)))
+        values = getter(obj)
+
+        # Rows of plain scalars (the large tables) need no flattening.
+        if all(type(v) in _PLAIN_TYPES for v in values):
+            row.update(zip(names, values))
+            return row
+        for name, value in zip(names, values):
+            _flatten_value(name, value, row)
     elif isinstance(obj, dict):
         for key, value in obj.items():
             _flatten_value(str(key), value, row)
@@ -177,6 +236,124 @@ def _order_columns(title: str, discovered_columns: list[str]) -> list[str]:
     return result
 
 
+@dataclasses.dataclass
+class _SheetRows:
+    """The rows of one worksheet, collected before the sheet is written.
+
+    Write-only worksheets emit the column widths ahead of the first row, so
+    everything is gathered first.
+
+    Attributes:
+        columns: The ordered column names.
+        rows: The cell values of each row, in column order.
+        float_columns: The names of the columns holding at least one float.
+        widths: The widest text of each column, header included.
+    """
+
+    columns: list[str]
+    rows: list[Sequence[Any]]
+    float_columns: set[str]
+    widths: list[int]
+
+
+def _flattened_rows(title: str, objects: list[Any]) -> _SheetRows:
+    """Collect the rows of ``objects`` through flattened row dicts.
+
+    Args:
+        title: The worksheet title, used for column ordering.
+        objects: The rows to write.
+
+    Returns:
+        The collected rows.
+    """
+
+    # Build flattened rows
+    dicts = [_row_dict_from_obj(i, obj) for i, obj in enumerate(objects)]
+
+    # Column discovery followed by ordering policy
+    columns: list[str] = sorted({k for row in dicts for k in row.keys()})
+    if not columns:
+        columns = ["idx"]
+    columns = _order_columns(title, columns)
+
+    # Row values, tracking the widest text per column
+    rows: list[Sequence[Any]] = []
+    widths = list(map(len, columns))
+    for row in dicts:
+        values = [row.get(col, None) for col in columns]
+        rows.append(values)
+        widths = list(map(max, widths, map(_text_width, values)))
+
+    # Heuristic: if any value in column is a float, set number format
+    float_columns = {
+        name
+        for name in columns
+        if any(isinstance(r.get(name), float) for r in dicts)
+    }
+    return _SheetRows(columns, rows, float_columns, widths)
+
+
+def _plain_rows(title: str, objects: list[Any]) -> _SheetRows | None:
+    """Collect rows of one dataclass type with plain scalar fields.
+
+    Values go straight from the cached field getter into tuples in column
+    order, without building a dict per row. A column is a float column
+    once any row holds a float in it, as in :func:`_flattened_rows`; columns
+    already known to be float are not checked again.
+
+    Args:
+        title: The worksheet title, used for column ordering.
+        objects: The rows to write.
+
+    Returns:
+        The collected rows, or None when ``objects`` is not a list of plain
+        rows of a single dataclass type.
+    """
+    if not objects:
+        return None
+    cls = type(objects[0])
+    if not is_dataclass(cls):
+        return None
+    names, getter = _dataclass_schema(cls)
+    if not names or "idx" in names:
+        return None
+
+    # Map the ordered columns onto positions in ``(idx, *values)``.
+    positions = {name: i for i, name in enumerate(("idx",) + names)}
+    columns = _order_columns(title, sorted(positions))
+    order = itemgetter(*(positions[name] for name in columns))
+    widths = list(map(len, columns))
+
+    # Positions of the columns that have not held a float yet.
+    float_columns: set[str] = set()
+    pending = list(range(len(names)))
+
+    rows: list[Sequence[Any]] = []
+    for index, obj in enumerate(objects):
+        if type(obj) is not cls:
+            return None
+        values = getter(obj)
+        if not all(type(v) in _PLAIN_TYPES for v in values):
+            return None
+        if pending:
+            found = [i for i in pending if type(values[i]) is float]
+            if found:
+                float_columns.update(names[i] for i in found)
+                pending = [i for i in pending if i not in found]
+        row = order((index,) + values)
+        rows.append(row)
+        widths = list(map(max, widths, map(_text_width, row)))
+    return _SheetRows(columns, rows, float_columns, widths)
+
+
+def _float_cell(ws: WriteOnlyWorksheet, value: Any) -> Cell:
+    """Return a cell holding ``value`` with the 3-decimal number format."""
+
+    cell = WriteOnlyCell(ws, value)
+    cell.number_format = "0.000"
+    return cell
+
+
 def _write_table_sheet(
     wb: Workbook,
     title: str,
@@ -187,81 +364,92 @@ def _write_table_sheet(
     The function infers columns from the union of keys across all rows to
     guarantee a stable schema and writes values row by row. Numeric types are
     written as numbers; strings as text. Floats receive a 3-decimal format.
+    Tables of flat dataclass rows are collected without intermediate dicts.
+    ``wb`` must be a write-only workbook; rows are streamed to its file.
     """
 
+    sheet = _plain_rows(title, objects) or _flattened_rows(title, objects)
     ws = wb.create_sheet(title)
 
-    # Build flattened rows
-    rows = [_row_dict_from_obj(i, obj) for i, obj in enumerate(objects)]
-
-    # Column discovery followed by ordering policy
-    columns: list[str] = sorted({k for row in rows for k in row.keys()})
-    if not columns:
-        columns = ["idx"]
-    columns = _order_columns(title, columns)
+    # Widths are written ahead of the rows in write-only mode.
+    _set_column_widths(ws, sheet.widths)
+    ws.append(sheet.columns)
 
-    # Write header
-    ws.append(columns)
+    # Write data; float cells carry the 3-decimal number format
+    float_idx = [
+        i
+        for i, name in enumerate(sheet.columns)
+        if name in sheet.float_columns
+    ]
+    for row in sheet.rows:
+        if float_idx:
+            row = list(row)
+            for i in float_idx:
+                if row[i] is not None:
+                    row[i] = _float_cell(ws, row[i])
+        ws.append(row)
+
+    # Create Excel Table covering the header and data rows
+    last_col = get_column_letter(len(sheet.columns))
+    ref = f"A1:{last_col}{len(sheet.rows) + 1}"
+    table = Table(
+        displayName=f"Tbl_{title}",
+        ref=ref,
+        tableColumns=[
+            TableColumn(id=i, name=name)
+            for i, name in enumerate(sheet.columns, start=1)
+        ],
+    )
+    table.tableStyleInfo = TableStyleInfo(
+        name="TableStyleMedium2",
+        showFirstColumn=False,
+        showLastColumn=False,
+        showRowStripes=True,
+        showColumnStripes=False,
+    )
 
-    # Write data
-    for row in rows:
-        ws.append([row.get(col, None) for col in columns])
-
-    # Apply number formats for floats
-    for col_idx, col_name in enumerate(columns, start=1):
-        # Heuristic: if any value in column is a float, set number format
-        is_float = any(isinstance(r.get(col_name), float) for r in rows)
-        if is_float:
-            for cell in ws.iter_cols(
-                min_col=col_idx, max_col=col_idx, min_row=2
-            ):
-                for c in cell:
-                    c.number_format = "0.000"
-
-    # Create Excel Table covering the data region if any rows
-    last_row = ws.max_row
-    last_col = ws.max_column
-    if last_row >= 1 and last_col >= 1:
-        ref = f"A1:{get_column_letter(last_col)}{last_row}"
-        table = Table(displayName=f"Tbl_{title}", ref=ref)
-        table.tableStyleInfo = TableStyleInfo(
-            name="TableStyleMedium2",
-            showFirstColumn=False,
-            showLastColumn=False,
-            showRowStripes=True,
-            showColumnStripes=False,
-        )
+    # openpyxl warns about every write-only table; its columns are set.
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", "In write-only mode", UserWarning)
         ws.add_table(table)
 
 
-def _append_headers_section(
-    ws: Worksheet,
-    title: str,
-    rows: list[tuple[str, Any]],
+def _write_headers_sheet(
+    wb: Workbook,
+    groups: list[tuple[str, list[tuple[str, Any]]]],
 ) -> None:
-    """Append a titled section to the headers sheet.
+    """Create the ``Headers`` worksheet from titled key/value sections.
 
-    Writes a title row, then key/value pairs, then an empty row.
-    Values of bytes are written as hex strings. Floats use 3 decimals.
+    The sheet starts with an empty row. Each section is a title row, then
+    key/value pairs, then an empty row. Values of bytes are written as hex
+    strings. Floats use 3 decimals.
+
+    Args:
+        wb: The write-only workbook.
+        groups: The sections, as returned by
+            :func:`_headers_rows_from_content`.
     """
 
-    start_row = (ws.max_row + 1) if ws.max_row else 1
-    ws.cell(row=start_row, column=1, value=title)
-    for key, value in rows:
-        start_row += 1
-        v = value
-        if isinstance(v, bytes):
-            v = v.hex()
-        ws.cell(row=start_row, column=1, value=key)
-        cell = ws.cell(
-            row=start_row,
-            column=2,
-            value=v,
-        )
-        if isinstance(v, float):
-            cell.number_format = "0.000"
-    # Empty line separator
-    ws.cell(row=start_row + 1, column=1, value=None)
+    rows: list[list[Any]] = [[]]
+    for title, pairs in groups:
+        rows.append([title])
+        for key, value in pairs:
+            if isinstance(value, bytes):
+                value = value.hex()
+            rows.append([key, value])
+        rows.append([])
+
+    widths = [0, 0]
+    for row in rows:
+        for i, value in enumerate(row):
+            widths[i] = max(widths[i], _text_width(value))
+
+    ws = wb.create_sheet("Headers")
+    _set_column_widths(ws, widths[: max(map(len, rows))])
+    for row in rows:
+        if len(row) == 2 and isinstance(row[1], float):
+            row[1] = _float_cell(ws, row[1])
+        ws.append(row)
 
 
 def _headers_rows_from_content(
@@ -352,26 +540,39 @@ def _headers_rows_from_content(
     return groups
 
 
+def _set_column_widths(ws: Worksheet, widths: list[int]) -> None:
+    """Size the columns of ``ws`` from the widest text of each column.
+
+    Args:
+        ws: The worksheet to size.
+        widths: The widest text, in characters, of each column in order.
+    """
+
+    for col_idx, max_length in enumerate(widths, start=1):
+        col_letter = get_column_letter(col_idx)
+        ws.column_dimensions[col_letter].width = min(
+            60, max(8, max_length + 2)
+        )
+
+
 def _auto_size_columns(ws: Worksheet) -> None:
     """Auto-size columns based on content width (simple heuristic)."""
 
     # Use column indices to avoid issues with merged cells in header row.
     max_col = int(ws.max_column or 0)
     max_row = int(ws.max_row or 0)
+    widths = []
     for col_idx in range(1, max_col + 1):
         max_length = 0
         for cells in ws.iter_cols(
             min_col=col_idx, max_col=col_idx, min_row=1, max_row=max_row
         ):
             for cell in cells:
-                value = cell.value
-                length = len(str(value)) if value is not None else 0
+                length = _text_width(cell.value)
                 if length > max_length:
                     max_length = length
-        col_letter = get_column_letter(col_idx)
-        ws.column_dimensions[col_letter].width = min(
-            60, max(8, max_length + 2)
-        )
+        widths.append(max_length)
+    _set_column_widths(ws, widths)
 
 
 #
@@ -388,11 +589,8 @@ def export_to_xlsx(content: Any, xlsx_path: Path) -> None:
     if TYPE_CHECKING:
         assert isinstance(content, _Content)
 
-    wb = Workbook()
-    # Remove default sheet to keep only named ones
-    default = wb.active
-    default_ws: Worksheet = cast(Worksheet, default)
-    wb.remove(default_ws)
+    # Write-only: rows are streamed to disk instead of kept as cells
+    wb = Workbook(write_only=True)
 
     # Data sheets: one per table
     _write_table_sheet(wb, "NO5_points", list(content.points))
@@ -410,13 +608,7 @@ def export_to_xlsx(content: Any, xlsx_path: Path) -> None:
         _write_table_sheet(wb, "PR5_fonts", list(pr5.font_names))
 
     # Headers sheet
-    ws_headers = wb.create_sheet("Headers")
-    for title, rows in _headers_rows_from_content(content):
-        _append_headers_section(ws_headers, title, rows)
-
-    # Auto-size all sheets
-    for sheet in wb.worksheets:
-        _auto_size_columns(sheet)
+    _write_headers_sheet(wb, _headers_rows_from_content(content))
 
     # Save file
     wb.save(xlsx_path.as_posix())
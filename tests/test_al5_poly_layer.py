@@ -10,6 +10,10 @@ import pytest
 
 from mapsys.parser.al5_poly_layer import Al5Data, Al5Header, parse_al5
 
+# Header: 4s, 4x u32, u8; data records: 3 bytes each.
+_HDR = struct.Struct("<4s4IB")
+_REC = struct.Struct("<BBB")
+
 
 def _build_al5_bytes(
     *,
@@ -21,20 +25,8 @@ def _build_al5_bytes(
 ) -> bytes:
     """Construct a minimal AL5 file as bytes for tests."""
 
-    # Header: 4s, 4x u32, u8
-    header = struct.pack(
-        "<4s4IB",
-        signature,
-        header_ints[0],
-        header_ints[1],
-        header_ints[2],
-        header_ints[3],
-        pad,
-    )
-
-    # Data records: 3 bytes each
-    rec_fmt = struct.Struct("<BBB")
-    rec_bytes = b"".join(rec_fmt.pack(*r) for r in records)
+    header = _HDR.pack(signature, *header_ints, pad)
+    rec_bytes = b"".join(_REC.pack(*r) for r in records)
 
     return header + rec_bytes + trailing
 
@@ -81,14 +73,16 @@ class TestParseData:
         messages = "\n".join(r.getMessage() for r in caplog.records)
         assert "Trailing 1 byte(s) after AL5 data table" in messages
 
-    def test_parse_al5_invalid_signature_raises(self) -> None:
-        data = _build_al5_bytes(signature=b"ABCD")
-        with pytest.raises(ValueError):
-            parse_al5(data)
-
-    def test_parse_al5_short_header_raises(self) -> None:
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            pytest.param(_build_al5_bytes(signature=b"ABCD"), id="signature"),
+            pytest.param(b"\x00\x01\x02", id="short-header"),
+        ],
+    )
+    def test_parse_al5_rejects(self, payload: bytes) -> None:
         with pytest.raises(ValueError):
-            parse_al5(b"\x00\x01\x02")
+            parse_al5(payload)
 
 
 # End of file
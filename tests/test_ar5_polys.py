@@ -8,17 +8,20 @@ import pytest
 
 from mapsys.parser.ar5_polys import Ar5Data, Ar5Header, parse_ar5
 
+# Header: signature + 4x u32 (no header pad byte in parser)
+_HDR = struct.Struct("<4s4I")
+
+# Data records follow parser struct: <BIIIIHIBIB
+_REC = struct.Struct("<BIIIIHIBIB")
+
 
 def _build_ar5_bytes(records: list[tuple[int, ...]]) -> bytes:
-    # Header: signature + 4x u32 (no header pad byte in parser)
-    header = struct.pack("<4s4I", b"VA50", 1, 2, 3, 4)
+    header = _HDR.pack(b"VA50", 1, 2, 3, 4)
 
     # File-level 9-byte pad
     pad9 = b"\x00" * 9
 
-    # Data records follow parser struct: <BIIIIHIBIB
-    rec_fmt = struct.Struct("<BIIIIHIBIB")
-    rec_bytes = b"".join(rec_fmt.pack(*r) for r in records)
+    rec_bytes = b"".join(_REC.pack(*r) for r in records)
 
     return header + pad9 + rec_bytes
 
@@ -75,14 +78,16 @@ def test_parse_ar5_with_two_records() -> None:
     ) == r2
 
 
-def test_invalid_signature_raises() -> None:
-    # Build header with bad signature, keep enough bytes for header+pad
-    header = struct.pack("<4s4I", b"BAD!", 1, 2, 3, 4)
-    data = header + (b"\x00" * 9)
-    with pytest.raises(ValueError):
-        parse_ar5(data)
-
-
-def test_buffer_too_small_raises() -> None:
+@pytest.mark.parametrize(
+    "payload",
+    [
+        # Bad signature, but enough bytes for header and pad
+        pytest.param(
+            _HDR.pack(b"BAD!", 1, 2, 3, 4) + b"\x00" * 9, id="signature"
+        ),
+        pytest.param(b"\x00\x01\x02", id="too-small"),
+    ],
+)
+def test_parse_ar5_rejects(payload: bytes) -> None:
     with pytest.raises(ValueError):
-        parse_ar5(b"\x00\x01\x02")
+        parse_ar5(payload)
@@ -4,20 +4,25 @@ from __future__ import annotations
 
 import struct
 
+import pytest
+
 from mapsys.parser.as5_vertices import (
     As5Header,
     parse_as5,
+    parse_as5_to_array,
 )
 
+# Header: <4s4IB  -> signature, 4x u32, pad u8
+_HDR = struct.Struct("<4s4IB")
+
 
 def _build_as5_bytes(
     offset_values: list[int], signature: bytes = b"VA50"
 ) -> bytes:
-    # Header: <4s4IB  -> signature, 4x u32, pad u8
-    header = struct.pack("<4s4IB", signature, 1, 2, 3, 4, 0)
+    header = _HDR.pack(signature, 1, 2, 3, 4, 0)
 
-    # Offsets: sequence of u32
-    offsets_blob = b"".join(struct.pack("<I", v) for v in offset_values)
+    # Offsets: sequence of u32, packed in one call
+    offsets_blob = struct.pack(f"<{len(offset_values)}I", *offset_values)
     return header + offsets_blob
 
 
@@ -54,10 +59,18 @@ def test_parse_as5_accepts_VA50_signature() -> None:
 
 def test_parse_as5_rejects_invalid_signature() -> None:
     data = _build_as5_bytes(offset_values=[1], signature=b"BAD!")
-    try:
+    with pytest.raises(ValueError, match="Invalid AS5 signature"):
         parse_as5(data)
-    except ValueError as exc:
-        assert "Invalid AS5 signature" in str(exc)
-    else:
-        assert False, "Expected ValueError for invalid signature"
-    # End of file
+
+
+def test_parse_as5_to_array_matches_list_parser() -> None:
+    values = [0, 1, 0xDEADBEEF, 42]
+    data = _build_as5_bytes(offset_values=values) + b"\x01\x02"
+
+    header, offsets = parse_as5_to_array(data)
+
+    assert header.signature == b"VA50"
+    assert len(offsets) == len(values)
+    assert list(offsets) == values
+    assert offsets[2] == 0xDEADBEEF
+    assert bytes(offsets) == struct.pack("<4I", *values)
@@ -7,17 +7,34 @@ The tests build minimal binary buffers for AL5, AR5 and TS5 to verify that
 
 from __future__ import annotations
 
+import os
 import struct
+import threading
+from array import array
 from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
 
-from mapsys.parser.content import Content
+import pytest
+
+import mapsys.parser.content as content_mod
+from mapsys.parser.content import Content, PrepModels, preprocess
+from mapsys.parser.ts5_text_store import Ts5Text
+
+# AL5/AS5/TS5 header: signature, 4x u32, pad u8; AR5 has no pad byte.
+_HDR_PAD = struct.Struct("<4s4IB")
+_AR5_HDR = struct.Struct("<4s4I")
+
+# AL5 and AR5 data records.
+_AL5_REC = struct.Struct("<BBB")
+_AR5_REC = struct.Struct("<BIIIIHIBIB")
 
 
 def _build_al5(layer_values: list[tuple[int, int, int]]) -> bytes:
     """Create a minimal AL5 file with the given 3-byte records."""
 
-    header = struct.pack("<4s4IB", b"VA50", 0, 0, 0, 0, 0)
-    data = b"".join(struct.pack("<BBB", a, b, c) for a, b, c in layer_values)
+    header = _HDR_PAD.pack(b"VA50", 0, 0, 0, 0, 0)
+    data = b"".join(_AL5_REC.pack(*r) for r in layer_values)
     return header + data
 
 
@@ -29,10 +46,9 @@ def _build_ar5(
 ) -> bytes:
     """Create a minimal AR5 file with a single data record."""
 
-    header = struct.pack("<4s4I", b"VA50", 0, 0, 0, 0)
+    header = _AR5_HDR.pack(b"VA50", 0, 0, 0, 0)
     pad9 = b"\x00" * 9
-    record = struct.pack(
-        "<BIIIIHIBIB",
+    record = _AR5_REC.pack(
         0,  # unk8
         1,  # line_id
         2,  # line_nr
@@ -50,16 +66,16 @@ def _build_ar5(
 def _build_ts5(strings: list[str]) -> tuple[bytes, list[int]]:
     """Create a minimal TS5 file and report each string's start offset."""
 
-    header = struct.pack("<4s4IB", b"VA50", 0, 0, 0, 0, 0)
+    header = _HDR_PAD.pack(b"VA50", 0, 0, 0, 0, 0)
     offsets: list[int] = []
-    block = b""
+    parts: list[bytes] = []
     current = 0
     for s in strings:
         offsets.append(current)
         raw = s.encode("windows-1250") + b"\x00"
-        block += raw
+        parts.append(raw)
         current += len(raw)
-    return header + block, offsets
+    return header + b"".join(parts), offsets
 
 
 class TestContent:
@@ -82,10 +98,265 @@ class TestContent:
         assert len(content.p_layers) == 2
         assert len(content.p_meta) == 1
         assert content.get_poly_layer(content.p_meta[0]) == 7
+        assert content.get_poly_layers([0, 1, 2, -1]) == [5, 7, 0, 0]
+        assert content.get_poly_layers_bulk() == bytes([7])
 
-        # Verify text_by_offset builds the cache and returns expected values.
+        # The offset lookup is ready right after loading.
+        assert content.build_offset_index() == {0: "hello", 6: "world"}
+
+        # Verify text_by_offset returns expected values.
         assert content.text_by_offset(0) == "hello"
         # Second string starts after "hello\x00" (6 bytes from block start).
         assert content.text_by_offset(6) == "world"
         # Unknown offset returns None.
         assert content.text_by_offset(9999) is None
+
+    def test_binary_files_are_memory_mapped(self, tmp_path: Path) -> None:
+        # AS5 offsets table with three values; AL5 left empty on purpose.
+        header = _HDR_PAD.pack(b"VA50", 0, 0, 0, 0, 0)
+        as5_path = tmp_path / "MAIN.AS5"
+        as5_path.write_bytes(header + struct.pack("<3I", 4, 8, 12))
+        (tmp_path / "MAIN.AL5").write_bytes(b"")
+
+        content = Content.create(as5_path)
+        assert content is not None
+
+        # Parsed values outlive the (already closed) mapping.
+        assert list(content.v_offsets) == [4, 8, 12]
+        assert isinstance(content.v_offsets, array)
+        assert content.v_offsets.typecode == "I"
+        assert content.p_layers == []
+
+    def test_processor_errors_are_raised(self, tmp_path: Path) -> None:
+        # A valid AL5 next to a corrupt AR5; the AR5 error must surface.
+        (tmp_path / "MAIN.AL5").write_bytes(_build_al5([(1, 0, 0)]))
+        bad = b"XXXX" + _build_ar5(lay_rec=0)[4:]
+        (tmp_path / "MAIN.AR5").write_bytes(bad)
+
+        with pytest.raises(ValueError, match="Invalid AR5 signature"):
+            Content.create(tmp_path / "MAIN.AL5")
+
+
+def _run_preprocess(path: Path, mode: PrepModels) -> Any:
+    """Run ``preprocess`` for ``path`` and return what the handler got."""
+
+    received: list[Any] = []
+
+    @preprocess("txt", mode=mode)
+    def handler(self: Any, content: Any = None) -> None:
+        received.append(content)
+
+    handler(SimpleNamespace(files={"TXT": path}))
+    return received[0] if received else None
+
+
+def test_preprocess_text_lines_and_assign(tmp_path: Path) -> None:
+    path = tmp_path / "MAIN.TXT"
+    path.write_text("a=1\r\nno equal sign\nurl=x=y\n", encoding="utf-8")
+
+    assert _run_preprocess(path, PrepModels.TEXT_LINES) == [
+        "a=1",
+        "no equal sign",
+        "url=x=y",
+    ]
+    assert _run_preprocess(path, PrepModels.ASSIGN) == {"a": "1", "url": "x=y"}
+
+    path.write_text("", encoding="utf-8")
+    assert _run_preprocess(path, PrepModels.TEXT_LINES) is None
+
+
+def test_preprocess_csv_streams_rows(tmp_path: Path) -> None:
+    path = tmp_path / "MAIN.TXT"
+    path.write_text('2,Krassovsky,"6378245,000"\n1,Stereo\n', encoding="utf-8")
+
+    rows: list[list[str]] = []
+
+    @preprocess("txt", mode=PrepModels.CSV)
+    def handler(self: Any, content: Any = None) -> None:
+        rows.extend(content)
+
+    handler(SimpleNamespace(files={"TXT": path}))
+    assert rows == [["2", "Krassovsky", "6378245,000"], ["1", "Stereo"]]
+
+
+def test_noop_processors_skip_io(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def fail(*args: Any, **kwargs: Any) -> Any:
+        raise AssertionError("no-op processors must not read files")
+
+    monkeypatch.setattr(content_mod, "open", fail, raising=False)
+
+    content = Content(
+        main_file=tmp_path / "MAIN.PR5",
+        files={"MDB": tmp_path / "MAIN.MDB", "CRS": tmp_path / "MAIN.CRS"},
+    )
+    content.process_mdb()
+    content.process_crs()
+
+
+def test_create_matches_stem_case_insensitively(tmp_path: Path) -> None:
+    # Lower-case names are found from an upper-case entry point.
+    (tmp_path / "main.al5").write_bytes(_build_al5([(3, 0, 0)]))
+    (tmp_path / "OTHER.AL5").write_bytes(_build_al5([(9, 0, 0)]))
+
+    content = Content.create(tmp_path / "MAIN.PR5")
+    assert content is not None
+    assert set(content.files) == {"AL5"}
+    assert [a.layer for a in content.p_layers] == [3]
+
+
+def test_create_dispatches_only_registered_files(tmp_path: Path) -> None:
+    # Only a file whose processor ignores its content is present.
+    crs = tmp_path / "MAIN.CRS"
+    crs.write_text("2018-02-09 Stereografic 1970\n", encoding="utf-8")
+
+    content = Content.create(crs)
+    assert content is not None
+    assert content.files == {"CRS": crs}
+    assert content.points == []
+
+
+def test_binary_fallback_when_mmap_fails(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def no_mmap(*args: Any, **kwargs: Any) -> Any:
+        raise OSError("cannot map")
+
+    monkeypatch.setattr(content_mod.mmap, "mmap", no_mmap)
+
+    path = tmp_path / "MAIN.AL5"
+    path.write_bytes(_build_al5([(4, 0, 0), (6, 1, 1)]))
+
+    content = Content.create(path)
+    assert content is not None
+    assert [a.layer for a in content.p_layers] == [4, 6]
+
+
+def test_content_is_slotted(tmp_path: Path) -> None:
+    content = Content(main_file=tmp_path / "MAIN.PR5", files={})
+    assert not hasattr(content, "__dict__")
+    assert "_layer_lookup" in Content.__slots__
+
+
+def test_prefetch_ignores_missing_files(tmp_path: Path) -> None:
+    present = tmp_path / "MAIN.AL5"
+    present.write_bytes(b"data")
+    content_mod._prefetch([present, tmp_path / "MISSING.AL5"])
+
+
+def test_create_reuses_unchanged_project(tmp_path: Path) -> None:
+    path = tmp_path / "MAIN.AL5"
+    path.write_bytes(_build_al5([(1, 0, 0)]))
+
+    # Loads are only shared when asked for.
+    first = Content.create(path, cached=True)
+    assert Content.create(path, cached=True) is first
+    assert Content.create(path) is not first
+
+    # A modified file invalidates the cached load.
+    path.write_bytes(_build_al5([(2, 0, 0), (3, 0, 0)]))
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    second = Content.create(path, cached=True)
+    assert second is not first
+    assert second is not None
+    assert [a.layer for a in second.p_layers] == [2, 3]
+
+    Content.clear_cache()
+    assert Content.create(path, cached=True) is not second
+
+
+def test_prefetch_advises_in_inode_order(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    if not hasattr(os, "posix_fadvise"):
+        pytest.skip("posix_fadvise is not available")
+
+    paths = [tmp_path / f"MAIN.{ext}" for ext in ("AL5", "AS5", "NO5")]
+    for path in paths:
+        path.write_bytes(b"data")
+
+    advised: list[int] = []
+
+    def record(fd: int, offset: int, length: int, advice: int) -> None:
+        advised.append(os.fstat(fd).st_ino)
+
+    monkeypatch.setattr(content_mod.os, "posix_fadvise", record)
+    content_mod._prefetch(reversed(paths))
+
+    assert advised == sorted(p.stat().st_ino for p in paths)
+
+
+def test_text_by_offset_from_assigned_texts(tmp_path: Path) -> None:
+    content = Content(main_file=tmp_path / "MAIN.PR5", files={})
+    content.texts = [Ts5Text(12, "c"), Ts5Text(0, "a"), Ts5Text(4, "b")]
+
+    # The lookup columns are sorted, whatever the order of ``texts``.
+    assert content.text_by_offset(4) == "b"
+    assert content.text_by_offset(12) == "c"
+    assert content.text_by_offset(5) is None
+    assert content.text_by_offset(99) is None
+    assert content.build_offset_index() == {0: "a", 4: "b", 12: "c"}
+
+
+def test_create_uses_disk_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "MAIN.AL5"
+    path.write_bytes(_build_al5([(1, 0, 0)]))
+    cache_dir = tmp_path / "cache"
+
+    first = Content.create(path, cached=False, disk_cache=cache_dir)
+    assert first is not None
+    assert len(list(cache_dir.glob("*.mapsys-cache"))) == 1
+
+    # A later run loads the pickled project without parsing anything.
+    def fail(self: Content) -> None:
+        raise AssertionError("cached project must not be re-parsed")
+
+    with monkeypatch.context() as m:
+        m.setattr(Content, "_process_all", fail)
+        second = Content.create(path, cached=False, disk_cache=cache_dir)
+    assert second is not None
+    assert second is not first
+    assert [a.layer for a in second.p_layers] == [1]
+    assert second.get_poly_layers([0]) == [1]
+
+    # A modified file invalidates the cache file.
+    path.write_bytes(_build_al5([(2, 0, 0), (3, 0, 0)]))
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    third = Content.create(path, cached=False, disk_cache=cache_dir)
+    assert third is not None
+    assert [a.layer for a in third.p_layers] == [2, 3]
+
+
+def test_parse_mapsys_bundle_runs_parsers_on_workers(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    seen: list[str] = []
+
+    def fake(kind: str) -> Any:
+        def parse(path: Path) -> tuple[str, str]:
+            seen.append(threading.current_thread().name)
+            return kind, Path(path).name
+
+        return parse
+
+    for kind in ("pr5", "te5", "ts5"):
+        monkeypatch.setattr(content_mod, f"parse_{kind}_path", fake(kind))
+
+    result = content_mod.parse_mapsys_bundle(
+        tmp_path / "A.PR5", tmp_path / "A.TE5", tmp_path / "A.TS5"
+    )
+    assert result == (("pr5", "A.PR5"), ("te5", "A.TE5"), ("ts5", "A.TS5"))
+    assert threading.current_thread().name not in seen
+
+    # Parser errors propagate to the caller
+    def broken(path: Path) -> None:
+        raise ValueError("bad te5")
+
+    monkeypatch.setattr(content_mod, "parse_te5_path", broken)
+    with pytest.raises(ValueError, match="bad te5"):
+        content_mod.parse_mapsys_bundle("a", "b", "c")
@@ -13,10 +13,8 @@ from mapsys.dxf.dxf_colors import (
     set_layer_color_from_index,
 )
 
-
-def _rgb_to_truecolor(rgb: tuple[int, int, int]) -> int:
-    r, g, b = rgb
-    return (r << 16) + (g << 8) + b
+# True Color value of every palette index, computed once.
+_TRUECOLOR = [(r << 16) | (g << 8) | b for r, g, b in PALETTE_256]
 
 
 class _DummyDXF:
@@ -60,7 +58,7 @@ class TestSetTrueColorHelpers:
 
         assert returned_rgb == expected_rgb
         assert isinstance(layer.dxf.true_color, int)
-        assert layer.dxf.true_color == _rgb_to_truecolor(expected_rgb)
+        assert layer.dxf.true_color == _TRUECOLOR[index]
 
     def test_set_entity_color_from_index_applies_true_color(self) -> None:
         entity = _DummyEntity()
@@ -71,7 +69,14 @@ class TestSetTrueColorHelpers:
 
         assert returned_rgb == expected_rgb
         assert isinstance(entity.dxf.true_color, int)
-        assert entity.dxf.true_color == _rgb_to_truecolor(expected_rgb)
+        assert entity.dxf.true_color == _TRUECOLOR[index]
+
+    def test_setters_cover_the_whole_palette(self) -> None:
+        layer = _DummyLayer()
+        layer_any: Any = layer
+        for idx, true_color in enumerate(_TRUECOLOR):
+            set_layer_color_from_index(layer_any, idx)
+            assert layer.dxf.true_color == true_color
 
     @pytest.mark.parametrize("bad_index", [-5, len(PALETTE_256)])
     def test_setters_raise_for_invalid_index(self, bad_index: int) -> None:
@@ -33,6 +33,7 @@ class FakeCursor:
         self._tables_rows = tables_rows
         self._raise_on = raise_on or set()
         self._last_sql: str | None = None
+        self._pending: list[tuple[Any, ...]] = []
         self.description: Sequence[Sequence[Any]] | None = None
 
     # noqa: N803 - keep param name consistent with pyodbc API
@@ -61,6 +62,7 @@ class FakeCursor:
 
             # Set a minimal description; only d[0] is used by the code
             rows = self._tables_rows.get(table, [])
+            self._pending = list(rows)
             if rows:
                 num_cols = len(rows[0])
                 self.description = [(f"col{i}",) for i in range(num_cols)]
@@ -83,6 +85,30 @@ class FakeCursor:
 
         raise AssertionError(f"Unexpected SQL for fetchall: {self._last_sql}")
 
+    def fetchmany(self, size: int) -> list[Any]:
+        assert self._last_sql is not None
+        batch, self._pending = self._pending[:size], self._pending[size:]
+        return batch
+
+
+class TypedFakeCursor(FakeCursor):
+    """Cursor that reports ``pyodbc``-style column types in description."""
+
+    def __init__(
+        self,
+        tables_rows: dict[str, list[tuple[Any, ...]]],
+        types: Sequence[type],
+    ) -> None:
+        super().__init__(tables_rows)
+        self._types = types
+
+    def execute(self, sql: str) -> None:
+        super().execute(sql)
+        if sql.startswith("SELECT * FROM ["):
+            self.description = [
+                (f"col{i}", t) for i, t in enumerate(self._types)
+            ]
+
 
 class FakeConnection:
     def __init__(self, cursor: FakeCursor) -> None:
@@ -125,6 +151,74 @@ def test_convert_value_covers_datetime_decimal_and_bytes() -> None:
     assert ms._convert_value(bs) == "01ab"
 
 
+def test_convert_value_handles_subclasses_and_plain_values() -> None:
+    class MyDecimal(Decimal):
+        pass
+
+    class MyBytes(bytes):
+        pass
+
+    # Subclasses miss the exact-type table and take the isinstance path
+    assert ms._convert_value(MyDecimal("2.5")) == pytest.approx(2.5)
+    assert ms._convert_value(MyBytes(b"\xff")) == "ff"
+    # Plain values are returned unchanged
+    for v in (None, True, 7, 1.5, "x"):
+        assert ms._convert_value(v) is v
+
+
+def test_column_converter_picks_per_type() -> None:
+    assert ms._column_converter(int) is None
+    assert ms._column_converter(str) is None
+    assert ms._column_converter(datetime) is ms._iso_or_none
+    assert ms._column_converter(Decimal) is ms._float_or_none
+    assert ms._column_converter(bytearray) is ms._hex_or_none
+    # Unknown type codes fall back to the generic converter
+    assert ms._column_converter(None) is ms._convert_value
+
+
+def test_extract_access_db_typed_columns_in_batches(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Any
+) -> None:
+    rows: dict[str, list[tuple[Any, ...]]] = {
+        "Users": [
+            (i, date(2024, 1, 2), Decimal("1.5"), b"\x01", None)
+            for i in range(5)
+        ]
+        + [(5, None, None, None, "x")],
+    }
+    fake_cursor = TypedFakeCursor(
+        rows, [int, date, Decimal, bytearray, object]
+    )
+    fake_conn = FakeConnection(fake_cursor)
+
+    def fake_connect(conn_str: str, autocommit: bool) -> FakeConnection:  # noqa: ARG001
+        return fake_conn
+
+    monkeypatch.setattr(ms, "pyodbc", SimpleNamespace(connect=fake_connect))
+    monkeypatch.setattr(ms, "FETCH_BATCH_SIZE", 4)
+
+    db_path = tmp_path / "typed.mdb"
+    db_path.write_text("dummy")
+
+    data = ms.extract_access_db(str(db_path))
+    users = data["Users"]
+    assert len(users) == 6
+    assert users[0] == {
+        "col0": 0,
+        "col1": "2024-01-02",
+        "col2": 1.5,
+        "col3": "01",
+        "col4": None,
+    }
+    assert users[5] == {
+        "col0": 5,
+        "col1": None,
+        "col2": None,
+        "col3": None,
+        "col4": "x",
+    }
+
+
 def test_extract_access_db_file_not_found(tmp_path: Any) -> None:
     missing = tmp_path / "nope.mdb"
     with pytest.raises(FileNotFoundError):
@@ -182,6 +276,87 @@ def test_extract_access_db_fallback_table_enumeration(
     assert set(data.keys()) == {"Users", "Orders"}
 
 
+def test_extract_access_db_lists_tables_without_catalog(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Any
+) -> None:
+    class NoCatalogCursor(FakeCursor):
+        def execute(self, sql: str) -> None:
+            if "MSysObjects" in sql:
+                raise RuntimeError("no read permission on MSysObjects")
+            super().execute(sql)
+
+    fake_cursor = NoCatalogCursor({"Users": [(1, "Alice")]})
+    fake_conn = FakeConnection(fake_cursor)
+
+    def fake_connect(conn_str: str, autocommit: bool) -> FakeConnection:  # noqa: ARG001
+        return fake_conn
+
+    monkeypatch.setattr(ms, "pyodbc", SimpleNamespace(connect=fake_connect))
+
+    db_path = tmp_path / "nocat.mdb"
+    db_path.write_text("dummy")
+
+    # The ODBC listing is used and its system tables are dropped
+    data = ms.extract_access_db(str(db_path))
+    assert set(data.keys()) == {"Users"}
+
+
+def test_list_user_tables_uses_portable_catalog_query() -> None:
+    executed: list[str] = []
+
+    class RecordingCursor(FakeCursor):
+        def execute(self, sql: str) -> None:
+            executed.append(sql)
+            super().execute(sql)
+
+    # "Orders" is only in the catalog; "MSysX" is dropped client-side
+    assert ms._list_user_tables(RecordingCursor({})) == ["Orders", "Users"]
+    catalog = [sql for sql in executed if "MSysObjects" in sql]
+    assert len(catalog) == 1
+    assert "Left(" not in catalog[0]
+
+
+def test_extract_access_db_projects_requested_columns(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Any
+) -> None:
+    executed: list[str] = []
+
+    class ProjectingCursor(FakeCursor):
+        def execute(self, sql: str) -> None:
+            executed.append(sql)
+            if sql.startswith("SELECT [id], [name] FROM [Users]"):
+                sql = "SELECT * FROM [Users]"
+            super().execute(sql)
+
+    fake_cursor = ProjectingCursor(
+        {"Users": [(1, "Alice")], "Orders": [(10,)]}
+    )
+    fake_conn = FakeConnection(fake_cursor)
+
+    def fake_connect(conn_str: str, autocommit: bool) -> FakeConnection:  # noqa: ARG001
+        return fake_conn
+
+    monkeypatch.setattr(ms, "pyodbc", SimpleNamespace(connect=fake_connect))
+
+    db_path = tmp_path / "proj.mdb"
+    db_path.write_text("dummy")
+
+    data = ms.extract_access_db(
+        str(db_path), columns={"Users": ["id", "name"]}
+    )
+    assert "SELECT [id], [name] FROM [Users]" in executed
+    assert "SELECT * FROM [Orders]" in executed
+    assert data["Orders"] == [{"col0": 10}]
+
+
+def test_select_sql_escapes_closing_brackets() -> None:
+    assert ms._select_sql("Odd]Table", None) == "SELECT * FROM [Odd]]Table]"
+    assert (
+        ms._select_sql("Users", ["a]b", "name"])
+        == "SELECT [a]]b], [name] FROM [Users]"
+    )
+
+
 def test_extract_access_db_records_per_table_errors(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Any
 ) -> None:
@@ -219,3 +394,36 @@ def test_extract_access_db_all_drivers_fail(
 
     with pytest.raises(RuntimeError):
         ms.extract_access_db(str(db_path))
+
+
+def test_dumps_json_matches_stdlib_fallback(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    data: ms.ExtractedDb = {
+        "Users": [{"id": 1, "name": "Șerban", "when": date(2024, 1, 2)}],
+    }
+    expected = (
+        '{\n  "Users": [\n    {\n      "id": 1,\n      "name": "Șerban",\n'
+        '      "when": "2024-01-02"\n    }\n  ]\n}'
+    ).encode("utf-8")
+
+    # Whatever backend is installed produces the same document
+    assert ms.dumps_json(data) == expected
+
+    # The stdlib fallback is used when orjson is not available
+    monkeypatch.setattr(ms, "orjson", None)
+    assert ms.dumps_json(data) == expected
+
+
+def test_dumps_json_rejects_unknown_values(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    data: ms.ExtractedDb = {"Users": [{"id": 1, "blob": object()}]}
+
+    # Both backends fail the same way on a value neither can encode
+    with pytest.raises(TypeError):
+        ms.dumps_json(data)
+
+    monkeypatch.setattr(ms, "orjson", None)
+    with pytest.raises(TypeError):
+        ms.dumps_json(data)
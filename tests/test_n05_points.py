@@ -7,11 +7,19 @@ import struct
 import pytest
 
 from mapsys.parser.n05_points import (
+    No5Columns,
     No5Coord,
     No5Header,
     parse_no5,
+    parse_no5_columns,
 )
 
+# Header: signature, 6x u32, pad u8
+_HDR = struct.Struct("<4s6IB")
+
+# Coord records: <BIBIddfIB
+_REC = struct.Struct("<BIBIddfIB")
+
 
 def _build_no5_bytes(
     records: list[
@@ -28,12 +36,8 @@ def _build_no5_bytes(
         ]
     ],
 ) -> bytes:
-    # Header: signature, 6x u32, pad u8
-    header = struct.pack("<4s6IB", b"VA50", 1, 2, 3, 4, 5, 6, 0)
-
-    # Coord records: <BIBIddfIB
-    rec_fmt = struct.Struct("<BIBIddfIB")
-    rec_bytes = b"".join(rec_fmt.pack(*r) for r in records)
+    header = _HDR.pack(b"VA50", 1, 2, 3, 4, 5, 6, 0)
+    rec_bytes = b"".join(_REC.pack(*r) for r in records)
 
     return header + rec_bytes
 
@@ -106,14 +110,48 @@ def test_parse_no5_with_two_records() -> None:
     ) == r2
 
 
-def test_parse_no5_invalid_signature_raises() -> None:
-    # Corrupt the signature to "VA50"
-    bad_header = struct.pack("<4s6IB", b"VA50", 0, 0, 0, 0, 0, 0, 0)
+@pytest.mark.parametrize(
+    "payload",
+    [
+        # An all-zero header is treated as a corrupt file
+        pytest.param(
+            _HDR.pack(b"VA50", 0, 0, 0, 0, 0, 0, 0), id="header-only"
+        ),
+        # Less than header size
+        pytest.param(b"VS", id="too-small"),
+    ],
+)
+def test_parse_no5_rejects(payload: bytes) -> None:
     with pytest.raises(ValueError):
-        parse_no5(bad_header)
+        parse_no5(payload)
 
 
-def test_parse_no5_buffer_too_small_header() -> None:
-    # Less than header size
-    with pytest.raises(ValueError):
-        parse_no5(b"VS")
+def test_parse_no5_rejects_vs50_signature() -> None:
+    # Only "VA50" is accepted; "VS50" (a look-alike) is rejected
+    data = b"VS50" + _build_no5_bytes(records=[])[4:]
+    with pytest.raises(ValueError, match="Invalid NO5 signature"):
+        parse_no5(data)
+
+
+def test_parse_no5_columns_match_records() -> None:
+    records = [
+        (16, 1001, 2, 10, 123.5, 456.25, 7.75, 9999, 1),
+        (0, 1002, 3, 11, -1.0, 0.0, 0.5, 10000, 0),
+    ]
+    data = _build_no5_bytes(records=records) + b"\x00\x01"
+
+    _, items = parse_no5(data)
+    header, cols = parse_no5_columns(data)
+
+    assert header.int1 == (1, 2, 3, 4, 5, 6)
+    assert len(cols) == 2
+    assert list(cols.east) == [123.5, -1.0]
+    assert list(cols.id_nr) == [1001, 1002]
+    assert [cols.row(i) for i in range(len(cols))] == items
+
+    _, empty = parse_no5_columns(_build_no5_bytes(records=[]))
+    assert len(empty) == 0
+
+    # Columns built from parsed records equal the directly parsed ones
+    assert No5Columns.from_records(items) == cols
+    assert len(No5Columns.from_records([])) == 0
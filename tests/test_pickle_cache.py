@@ -0,0 +1,35 @@
+"""Tests for the shared on-disk pickle cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from mapsys.parser.pickle_cache import load_pickle_cache, store_pickle_cache
+
+
+def test_pickle_cache_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "sub" / "entry.cache"
+    store_pickle_cache(path, 1, ("key", 2), {"a": [1, 2]})
+
+    assert load_pickle_cache(path, 1, ("key", 2)) == {"a": [1, 2]}
+
+    # No temporary files are left next to the cache file
+    assert list(path.parent.iterdir()) == [path]
+
+
+def test_pickle_cache_rejects_other_version_or_key(tmp_path: Path) -> None:
+    path = tmp_path / "entry.cache"
+    store_pickle_cache(path, 1, "key", "payload")
+
+    assert load_pickle_cache(path, 2, "key") is None
+    assert load_pickle_cache(path, 1, "other") is None
+
+
+def test_pickle_cache_ignores_missing_and_corrupt_files(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "entry.cache"
+    assert load_pickle_cache(path, 1, "key") is None
+
+    path.write_bytes(b"not a pickle")
+    assert load_pickle_cache(path, 1, "key") is None
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import mmap
 import struct
+from functools import lru_cache
+from pathlib import Path
 
 import pytest
 
@@ -13,26 +16,37 @@ from mapsys.parser.pr5_main import (
     Layer,
     LayerAttribute,
     Pr5File,
+    TheNine,
     _decode_c_string,
     parse_pr5,
+    parse_pr5_cached,
+    parse_pr5_path,
 )
 
+# Record layouts, compiled once for every builder call.
+_HEADER = struct.Struct("<6sB3B256s256sHHH6B5dB4dH")
+_NINE = struct.Struct("<6B")
+_LAYER_PREFIX = struct.Struct("<4B64s12sBB81s")
+_LAYER_ATTR = struct.Struct("<f3xB3xBBff")
+_AFTER_LAYER = struct.Struct("<I H 64s B 2x B B 24s")
+_FONT = struct.Struct("<13s")
+
 
 def _pack_c_string(text: str, size: int) -> bytes:
-    b = text.encode("windows-1250", errors="replace") + b"\x00"
-    return b + (b"\x00" * (size - len(b)))
+    # The terminator and padding are all NULs, added by one ljust call.
+    raw = text.encode("windows-1250", errors="replace")
+    return raw.ljust(size, b"\x00")
 
 
 def _build_header_bytes(
     *,
     signature: bytes = b"MapSys",
 ) -> bytes:
-    header_struct = struct.Struct("<6sB3B256s256sHHH6B5dB4dH")
     file_path = _pack_c_string("C:/mapsys/file.pr5", 256)
     dir_path = _pack_c_string("C:/mapsys", 256)
 
     # Integers and doubles are filled with simple values.
-    payload = header_struct.pack(
+    payload = _HEADER.pack(
         signature,
         0,  # zero
         1,
@@ -62,70 +76,64 @@ def _build_header_bytes(
         2,
     )
 
-    nine_struct = struct.Struct("<6B")
-    nine = b"".join(nine_struct.pack(1, 2, 3, 4, 5, 6) for _ in range(9))
+    nine = b"".join(_NINE.pack(*range(i * 6, i * 6 + 6)) for i in range(9))
     pad = b"\x00"
     return payload + nine + pad
 
 
 def _build_layer_bytes(i: int) -> bytes:
-    prefix = struct.Struct("<4B64s12sBB81s")
-    attr = struct.Struct("<f3xB3xBBff")
-
     title = _pack_c_string(f"Layer {i}", 64)
     content1 = b"\x00" * 12
     content2 = b"\x00" * 81
 
-    rec = prefix.pack(1, 2, 3, 4, title, content1, 7, 2, content2)
+    rec = [_LAYER_PREFIX.pack(1, 2, 3, 4, title, content1, 7, 2, content2)]
 
     # Nine attributes with distinct content3 and small floats.
-    for j in range(9):
-        rec += attr.pack(1.0 + j, 5, 8, j, 0.25 * j, 0.5 * j)
-    return rec
+    rec.extend(
+        _LAYER_ATTR.pack(1.0 + j, 5, 8, j, 0.25 * j, 0.5 * j) for j in range(9)
+    )
+    return b"".join(rec)
 
 
 def _build_after_layers_bytes(i: int) -> bytes:
-    al = struct.Struct("<I H 64s B 2x B B 24s")
     name = _pack_c_string(f"AL{i}", 64)
-    return al.pack(1234, 0, name, 0, 1, 0, b"\x00" * 24)
+    return _AFTER_LAYER.pack(1234, 0, name, 0, 1, 0, b"\x00" * 24)
 
 
 def _build_font_entry_bytes(i: int) -> bytes:
     # 12-char name plus final NUL (total 13 bytes)
     name = f"F{i:02d}".encode("ascii") + b"\x00" * 10 + b"\x00"
-    font = struct.Struct("<13s")
-    return font.pack(name)
+    return _FONT.pack(name)
 
 
+# The blob is immutable and has no inputs, so every test shares one copy.
+@lru_cache(maxsize=None)
 def _build_pr5_bytes() -> bytes:
-    data = _build_header_bytes()
+    parts = [_build_header_bytes()]
 
     # 256 layers
-    for i in range(256):
-        data += _build_layer_bytes(i)
+    parts.extend(map(_build_layer_bytes, range(256)))
 
     # 256 after-layers
-    for i in range(256):
-        data += _build_after_layers_bytes(i)
+    parts.extend(map(_build_after_layers_bytes, range(256)))
 
     # Final blocks
-    data += b"\xaa\xbb\xcc\xdd"  # some_final_stuff (4 bytes)
-    data += b"\x00" * 256  # all_characters
-    data += b"\x01" * 256  # ones
+    parts.append(b"\xaa\xbb\xcc\xdd")  # some_final_stuff (4 bytes)
+    parts.append(b"\x00" * 256)  # all_characters
+    parts.append(b"\x01" * 256)  # ones
 
     # 20 font entries
-    for i in range(20):
-        data += _build_font_entry_bytes(i)
+    parts.extend(map(_build_font_entry_bytes, range(20)))
 
     # Two u16 values and two zero bytes
-    data += struct.pack("<HH", 30, 5)
-    data += b"\x00\x00"
+    parts.append(struct.pack("<HH", 30, 5))
+    parts.append(b"\x00\x00")
 
     # mdb buffer and final zeros
-    data += _pack_c_string("C:/db/sample.mdb", 256)
-    data += b"\x00" * 256
+    parts.append(_pack_c_string("C:/db/sample.mdb", 256))
+    parts.append(b"\x00" * 256)
 
-    return data
+    return b"".join(parts)
 
 
 def test_decode_c_string_basic_and_truncation() -> None:
@@ -156,6 +164,8 @@ def test_parse_pr5_end_to_end_minimal_valid() -> None:
     assert isinstance(h, Header)
     assert h.signature == b"MapSys"
     assert h.nine and len(h.nine) == 9
+    assert h.nine[0] == TheNine(0, 1, 2, 3, 4, 5)
+    assert h.nine[8] == TheNine(48, 49, 50, 51, 52, 53)
 
     # Layers
     assert len(pr5.layers) == 256
@@ -180,3 +190,96 @@ def test_parse_pr5_end_to_end_minimal_valid() -> None:
     assert pr5.a_5_value == 5
     assert pr5.mdb.endswith("sample.mdb")
     assert len(pr5.empty) == 256
+
+
+def test_parse_pr5_from_mapping_keeps_no_views(tmp_path: Path) -> None:
+    path = tmp_path / "MAIN.PR5"
+    path.write_bytes(_build_pr5_bytes())
+
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        pr5 = parse_pr5(mapped)
+
+        # Closing fails if the parser left a view over the mapping.
+        mapped.close()
+
+    assert type(pr5.some_final_stuff) is bytes
+    assert type(pr5.layers[0].attribs[0].content1) is bytes
+    assert pr5.mdb.endswith("sample.mdb")
+
+
+def test_parse_pr5_layer_attributes_and_blobs() -> None:
+    blob = bytearray(_build_pr5_bytes())
+
+    # Fill the opaque blobs of layer 0, attribute 1 (after the 163-byte
+    # prefix and one 21-byte attribute).
+    header_size = len(_build_header_bytes())
+    attr_at = header_size + 163 + 21
+    blob[attr_at + 4 : attr_at + 7] = b"abc"
+    blob[attr_at + 8 : attr_at + 11] = b"xyz"
+
+    pr5 = parse_pr5(bytes(blob))
+    attribs = pr5.layers[0].attribs
+    assert [a.content3 for a in attribs] == list(range(9))
+    assert [a.d_y for a in attribs] == [0.5 * j for j in range(9)]
+    assert attribs[1].content1 == b"abc"
+    assert attribs[1].content2 == b"xyz"
+    assert attribs[0].content1 == b"\x00\x00\x00"
+    assert pr5.layers[1].title == "Layer 1"
+
+
+def test_parse_pr5_truncated_file_raises_value_error() -> None:
+    blob = _build_pr5_bytes()
+    cut = len(_build_header_bytes()) + 100 * 352
+    with pytest.raises(ValueError, match="PR5 needs"):
+        parse_pr5(blob[:cut])
+
+
+def test_parse_pr5_truncated_trailer_raises_value_error() -> None:
+    blob = _build_pr5_bytes()
+    with pytest.raises(ValueError, match="PR5 needs"):
+        parse_pr5(blob[:-1])
+
+
+def test_decode_c_string_memoizes_repeated_names() -> None:
+    _decode_c_string.cache_clear()
+    padding = b"\x00" * 64
+
+    assert _decode_c_string(padding) == ""
+    assert _decode_c_string(padding) == ""
+    assert _decode_c_string.cache_info().hits == 1
+
+
+def test_parse_pr5_path_matches_bytes(tmp_path: Path) -> None:
+    blob = _build_pr5_bytes()
+    path = tmp_path / "MAIN.PR5"
+    path.write_bytes(blob)
+
+    assert parse_pr5_path(path) == parse_pr5(blob)
+
+
+def test_parse_pr5_cached_reuses_result(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import mapsys.parser.pr5_main as pr5_main
+
+    blob = _build_pr5_bytes()
+    path = tmp_path / "MAIN.PR5"
+    path.write_bytes(blob)
+    cache_dir = tmp_path / "cache"
+
+    first = parse_pr5_cached(path, cache_dir)
+    assert first == parse_pr5(blob)
+    assert len(list(cache_dir.glob("*.pr5-cache"))) == 1
+
+    # A second call is served from the cache without parsing
+    def fail(data: object) -> None:
+        raise AssertionError("parsed again")
+
+    monkeypatch.setattr(pr5_main, "parse_pr5", fail)
+    assert parse_pr5_cached(path, cache_dir) == first
+
+    # Changed content misses the cache
+    path.write_bytes(blob[:-1] + b"\x01")
+    with pytest.raises(AssertionError, match="parsed again"):
+        parse_pr5_cached(path, cache_dir)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import struct
+from pathlib import Path
 from typing import List, Tuple
 
 import pytest
@@ -13,16 +14,18 @@ from mapsys.parser.te5_text_meta import (
     Te5Header,
     Te5TextMeta,
     parse_te5,
+    parse_te5_columns,
+    parse_te5_path,
 )
 
+# Header: signature, unk u8, 6 x u32; the record mirrors the module.
+_HDR = struct.Struct("<4sB6I")
+_REC = struct.Struct("<BIBBBffddfffIB")
 
-def _build_te5_bytes(records: List[Tuple]) -> bytes:
-    # Header: signature, unk u8, 6 x u32
-    header = struct.pack("<4sB6I", b"VA50", 7, 1, 2, 3, 4, 5, 6)
 
-    # Coord record struct mirrors module: <BIBBBffddfffIB
-    rec_fmt = struct.Struct("<BIBBBffddfffIB")
-    body = b"".join(rec_fmt.pack(*r) for r in records)
+def _build_te5_bytes(records: List[Tuple]) -> bytes:
+    header = _HDR.pack(b"VA50", 7, 1, 2, 3, 4, 5, 6)
+    body = b"".join(_REC.pack(*r) for r in records)
     return header + body
 
 
@@ -116,11 +119,80 @@ def test_parse_te5_with_two_records_and_helpers() -> None:
 
 def test_te5_invalid_signature_raises() -> None:
     # Build with wrong signature but valid header length
-    bad_header = struct.pack("<4sB6I", b"VA50", 0, 0, 0, 0, 0, 0, 0)
+    bad_header = _HDR.pack(b"VA50", 0, 0, 0, 0, 0, 0, 0)
     with pytest.raises(ValueError):
         parse_te5(bad_header)
 
 
+def test_te5_all_zero_header_raises() -> None:
+    data = b"VA50" + bytes(25)
+    with pytest.raises(ValueError, match="header values"):
+        parse_te5(data)
+
+    # Any non-zero field makes the header acceptable
+    header, _ = parse_te5(b"VA50" + bytes(24) + b"\x01")
+    assert header.pad == (0, 0, 0, 0, 0, 1 << 24)
+
+
 def test_te5_buffer_too_small_header_raises() -> None:
     with pytest.raises(ValueError):
         parse_te5(b"\x00\x01")
+
+
+def test_parse_te5_columns_match_records() -> None:
+    r1 = (0, 1001, 1, 2, 0x22, 2.5, 0.0, 123.0, 456.0, 1.0, 2.0, 3.0, 10, 6)
+    r2 = (1, 1002, 0, 0, 0, 1.25, 90.0, -1.0, 0.0, 0.0, 0.0, 0.0, 0, 1)
+    data = _build_te5_bytes(records=[r1, r2]) + b"\x00"
+
+    _, items = parse_te5(data)
+    header, cols = parse_te5_columns(data)
+
+    assert header.pad == (1, 2, 3, 4, 5, 6)
+    assert len(cols) == 2
+    assert list(cols.text_id) == [1001, 1002]
+    assert list(cols.east) == [123.0, -1.0]
+    assert [cols.row(i) for i in range(len(cols))] == items
+
+    # Flag tests over the whole column match the per-record helper
+    for flag in (FLAG_TEXT_FRAME, FLAG_TRUE_TYPE_FONT, 0x22):
+        assert list(cols.has_flag(flag)) == [m.has_flag(flag) for m in items]
+
+    # No records gives empty columns
+    _, empty = parse_te5_columns(_build_te5_bytes(records=[]))
+    assert len(empty) == 0
+
+
+def test_parse_te5_ignores_partial_trailing_record() -> None:
+    r1 = (0, 7, 1, 0, 0, 1.0, 0.0, 5.0, 6.0, 0.0, 0.0, 0.0, 0, 2)
+    data = _build_te5_bytes(records=[r1])
+
+    # A cut-off second record is dropped
+    _, items = parse_te5(data + data[-20:])
+    assert [m.text_id for m in items] == [7]
+
+
+def test_parse_te5_filters_deleted_and_flags() -> None:
+    live = (0, 1, 1, 0, 0x22, 1.0, 0.0, 5.0, 6.0, 0.0, 0.0, 0.0, 0, 2)
+    gone = (1, 2, 1, 0, 0x22, 1.0, 0.0, 5.0, 6.0, 0.0, 0.0, 0.0, 0, 2)
+    plain = (0, 3, 1, 0, 0x02, 1.0, 0.0, 5.0, 6.0, 0.0, 0.0, 0.0, 0, 2)
+    data = _build_te5_bytes(records=[live, gone, plain]) + b"\x00"
+    _, everything = parse_te5(data)
+
+    # Filtering keeps the same objects a post-hoc filter would
+    _, items = parse_te5(data, include_deleted=False)
+    assert items == [m for m in everything if m.first_zero == 0]
+    _, items = parse_te5(data, flag_value=0x20)
+    assert items == [m for m in everything if m.has_flag(0x20)]
+    _, items = parse_te5(data, include_deleted=False, flag_value=0x02)
+    assert [m.text_id for m in items] == [1, 3]
+    _, items = parse_te5(data, include_deleted=False, flag_value=0x20)
+    assert [m.text_id for m in items] == [1]
+
+
+def test_parse_te5_path_matches_bytes(tmp_path: Path) -> None:
+    r1 = (0, 7, 1, 0, 0, 1.0, 0.0, 5.0, 6.0, 0.0, 0.0, 0.0, 0, 2)
+    data = _build_te5_bytes(records=[r1])
+    path = tmp_path / "MAIN.TE5"
+    path.write_bytes(data)
+
+    assert parse_te5_path(path) == parse_te5(data)
@@ -1,12 +1,20 @@
+import dataclasses
 import math
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List
 
 import pytest
 
-from mapsys.dxf.to_dxf import Builder
+from mapsys.dxf.to_dxf import (
+    ATTRIB_HEIGHT,
+    Builder,
+    _add_lwpolyline,
+    _simplify_vertices,
+)
 from mapsys.parser.ar5_polys import Ar5Data
-from mapsys.parser.n05_points import No5Coord
+from mapsys.parser.n05_points import No5Columns, No5Coord
 from mapsys.parser.te5_text_meta import Te5TextMeta
 from mapsys.parser.ts5_text_store import Ts5Text
 
@@ -132,6 +140,12 @@ class DummyMapsys:
 
         self.pr5 = PR5()
 
+    def points_soa(self) -> No5Columns:
+        return No5Columns.from_records(self.points)
+
+    def build_offset_index(self) -> Dict[int, str]:
+        return dict(self.offset_to_text)
+
     def text_by_offset(self, offset: int) -> str | None:
         return self.offset_to_text.get(offset)
 
@@ -140,7 +154,8 @@ class DummyMapsys:
         return self.p_layers[p_meta.lay_rec].layer
 
 
-def _make_minimal_template(tmp_path: Path) -> Path:
+@lru_cache(maxsize=None)
+def _minimal_template_bytes() -> bytes:
     # Create a minimal DXF template containing a POINT block with NAME,SOURCE,Z
     import ezdxf
 
@@ -149,8 +164,17 @@ def _make_minimal_template(tmp_path: Path) -> Path:
     blk.add_attdef("NAME", insert=(0, 0), height=0.2)
     blk.add_attdef("SOURCE", insert=(0, 0), height=0.2)
     blk.add_attdef("Z", insert=(0, 0), height=0.2)
+
+    # Saved once per session; every test gets its own copy of the bytes.
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "template.dxf"
+        doc.saveas(path.as_posix())
+        return path.read_bytes()
+
+
+def _make_minimal_template(tmp_path: Path) -> Path:
     path = tmp_path / "template.dxf"
-    doc.saveas(path.as_posix())
+    path.write_bytes(_minimal_template_bytes())
     return path
 
 
@@ -186,6 +210,154 @@ def test_builder_convert_creates_entities_and_layers(tmp_path: Path) -> None:
     )
 
 
+def test_builder_adds_missing_layers_in_sorted_order(tmp_path: Path) -> None:
+    import ezdxf
+
+    # The template already holds one of the layers, in another case
+    template = _make_minimal_template(tmp_path)
+    doc = ezdxf.readfile(template)
+    doc.layers.add("mapsys-1-roads-points", color=3)
+    doc.saveas(template.as_posix())
+
+    out = Builder.convert(DummyMapsys(), template)  # type: ignore[arg-type]
+    names = [ly.dxf.name for ly in out.layers]
+    assert "MapSys-1-Roads-points" not in names
+    added = names[names.index("mapsys-1-roads-points") + 1 :]
+    assert added == [
+        "MapSys-1-Roads-lines",
+        "MapSys-2-Text-points",
+        "MapSys-2-Text-text",
+    ]
+
+
+def test_builder_sets_point_attribs_and_closes_rings(tmp_path: Path) -> None:
+    mapsys = DummyMapsys()
+    ring = dataclasses.replace(mapsys.p_meta[0], vertex_count=4)
+    mapsys.p_meta = [mapsys.p_meta[0], ring]
+    mapsys.v_offsets = [0, 1, 2, 0]
+    template = _make_minimal_template(tmp_path)
+
+    doc = Builder.convert(mapsys, template)  # type: ignore[arg-type]
+    msp = doc.modelspace()
+
+    inserts = list(msp.query("INSERT"))
+    assert [i.dxf.layer for i in inserts] == [
+        "MapSys-1-Roads-points",
+        "MapSys-1-Roads-points",
+        "MapSys-2-Text-points",
+    ]
+    first = {a.dxf.tag: a.dxf.text for a in inserts[0].attribs}
+    assert first == {"NAME": "101", "SOURCE": "MapSys", "Z": "1.50"}
+
+    # A polyline ending on its first vertex is closed, not repeated
+    lines = list(msp.query("LWPOLYLINE"))
+    assert [(line.closed, len(line)) for line in lines] == [
+        (False, 2),
+        (True, 3),
+    ]
+    assert {line.dxf.layer for line in lines} == {"MapSys-1-Roads-lines"}
+
+
+def test_copied_point_attribs_match_ezdxf_autofill(tmp_path: Path) -> None:
+    import ezdxf
+    from ezdxf.enums import TextEntityAlignment
+
+    # Template with a shifted base point and an aligned attribute
+    doc = ezdxf.new(setup=True)
+    blk = doc.blocks.new("POINT", base_point=(0.5, 0.25))
+    blk.add_attdef("NAME", insert=(0, 0), height=0.2)
+    src = blk.add_attdef("SOURCE", insert=(1, 0), height=0.2)
+    src.set_placement((1, 0), align=TextEntityAlignment.MIDDLE_CENTER)
+    blk.add_attdef("Z", insert=(0, 1), height=0.2)
+    blk.add_attdef("EXTRA", insert=(0, 2), height=0.2)
+    template = tmp_path / "template.dxf"
+    doc.saveas(template.as_posix())
+
+    out = Builder.convert(
+        DummyMapsys(),  # type: ignore[arg-type]
+        template,
+        block_scale=2.0,
+    )
+    msp = out.modelspace()
+
+    def snapshot(br: Any) -> list[dict[str, Any]]:
+        return [a.dxfattribs(drop={"handle", "owner"}) for a in br.attribs]
+
+    for br in list(msp.query("INSERT")):
+        values = {a.dxf.tag: a.dxf.text for a in br.attribs}
+        ref = msp.add_blockref(
+            "POINT", br.dxf.insert, dxfattribs=br.dxfattribs(drop={"handle"})
+        )
+        ref.add_auto_attribs(values)
+        assert snapshot(br) == snapshot(ref)
+
+
+def test_template_is_parsed_once_per_version(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import os
+
+    from ezdxf import recover
+
+    from mapsys.dxf import to_dxf
+
+    template = _make_minimal_template(tmp_path)
+    to_dxf._template_snapshot.cache_clear()
+    calls: list[str] = []
+    real_readfile = recover.readfile
+
+    def counting_readfile(path: str) -> Any:
+        calls.append(path)
+        return real_readfile(path)
+
+    monkeypatch.setattr(recover, "readfile", counting_readfile)
+
+    # Every export gets its own copy of the parsed template
+    first = Builder.convert(DummyMapsys(), template)  # type: ignore[arg-type]
+    second = Builder.convert(DummyMapsys(), template)  # type: ignore[arg-type]
+    assert len(calls) == 1
+    assert first is not second
+    assert len(second.modelspace()) == len(first.modelspace()) == 5
+
+    # Touching the template parses it again
+    st = template.stat()
+    os.utime(template, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    Builder.convert(DummyMapsys(), template)  # type: ignore[arg-type]
+    assert len(calls) == 2
+
+
+def test_to_dxf_async_saves_in_background(tmp_path: Path) -> None:
+    template = _make_minimal_template(tmp_path)
+    out = tmp_path / "out.dxf"
+    out.write_text("old")
+    builder = Builder(DummyMapsys())  # type: ignore[arg-type]
+
+    doc, future = builder.to_dxf_async(template, dxf_path=out)
+    assert future.result(timeout=30) is None
+
+    # The saved file holds the returned document; the old one is a backup
+    assert len(doc.modelspace()) == 5
+    assert "LWPOLYLINE" in out.read_text()
+    assert (tmp_path / "out.bak1").read_text() == "old"
+
+
+def test_insert_texts_converts_direction_and_skips_missing(
+    tmp_path: Path,
+) -> None:
+    mapsys = DummyMapsys()
+    orphan = dataclasses.replace(mapsys.t_meta[0], offset=99)
+    mapsys.t_meta = [mapsys.t_meta[0], orphan]
+    template = _make_minimal_template(tmp_path)
+
+    doc = Builder.convert(mapsys, template)  # type: ignore[arg-type]
+    texts = [t for t in doc.modelspace().query("TEXT")]
+
+    assert len(texts) == 1
+    assert texts[0].dxf.text == "TXT"
+    assert texts[0].dxf.rotation == pytest.approx(90.0)
+    assert texts[0].dxf.layer == "MapSys-2-Text-text"
+
+
 def test_layer_name_includes_title_when_available(tmp_path: Path) -> None:
     mapsys = DummyMapsys()
     _ = _make_minimal_template(tmp_path)
@@ -236,6 +408,58 @@ def test_lineweight_from_mapsys_type_error() -> None:
         Builder.lineweight_from_mapsys("3")  # type: ignore[arg-type]
 
 
+def test_lineweight_table_bins_weights_evenly() -> None:
+    from ezdxf.lldxf.const import VALID_DXF_LINEWEIGHTS
+
+    weights = [Builder.lineweight_from_mapsys(v) for v in range(256)]
+    assert weights == sorted(weights)
+    assert weights[4] == VALID_DXF_LINEWEIGHTS[9]
+    assert weights[255] == VALID_DXF_LINEWEIGHTS[-1]
+
+    # Every lineweight past the fixed steps gets a bin of similar size
+    sizes = [weights[4:].count(lw) for lw in VALID_DXF_LINEWEIGHTS[9:]]
+    assert max(sizes) - min(sizes) <= 2
+
+
+@pytest.mark.parametrize("closed", [False, True])
+def test_add_lwpolyline_matches_ezdxf(closed: bool) -> None:
+    import ezdxf
+    from ezdxf.lldxf.const import DXFVersionError
+
+    msp = ezdxf.new("R2010").modelspace()
+    verts = [(0.0, 0.0), (1.5, 2.0), (3.0, -1.0)]
+    attribs = {"layer": "L1"}
+    line = _add_lwpolyline(msp, verts, closed, attribs)
+    ref = msp.add_lwpolyline(
+        verts, format="xy", close=closed, dxfattribs=attribs
+    )
+
+    assert attribs == {"layer": "L1"}
+    assert line.closed is closed
+    assert list(line.get_points()) == list(ref.get_points())
+    drop = {"handle"}
+    assert line.dxfattribs(drop=drop) == ref.dxfattribs(drop=drop)
+
+    with pytest.raises(DXFVersionError):
+        _add_lwpolyline(ezdxf.new("R12").modelspace(), verts, closed, {})
+
+
+def test_iter_poly_vertices_skips_out_of_range_offsets() -> None:
+    mapsys = DummyMapsys()
+    entry = mapsys.p_meta[0]
+    wide = dataclasses.replace(entry, vertex_count=4)
+
+    # In-range offsets map straight to point coordinates
+    result = list(Builder._iter_poly_vertices([entry], [0, 2], mapsys.points))
+    assert result == [(entry, [(0.0, 0.0), (0.0, 1.0)])]
+
+    # Offsets past the points table are dropped, the rest are kept
+    result = list(
+        Builder._iter_poly_vertices([wide], [1, 9, 2, 0], mapsys.points)
+    )
+    assert result == [(wide, [(1.0, 0.0), (0.0, 1.0), (0.0, 0.0)])]
+
+
 def test_rotate_dxf_backups(tmp_path: Path) -> None:
     target = tmp_path / "out.dxf"
     # Create three generations
@@ -250,3 +474,131 @@ def test_rotate_dxf_backups(tmp_path: Path) -> None:
     assert (tmp_path / "out.bak1").exists()
     assert (tmp_path / "out.bak2").exists()
     assert (tmp_path / "out.bak3").exists()
+
+
+def test_rotate_dxf_backups_shifts_only_existing(tmp_path: Path) -> None:
+    target = tmp_path / "out.dxf"
+    target.write_text("new")
+    (tmp_path / "out.bak1").write_text("b1")
+    (tmp_path / "out.bak3").write_text("b3")
+    (tmp_path / "out.bak03").write_text("other")
+    (tmp_path / "out.bak4").write_text("oldest")
+
+    Builder._rotate_dxf_backups(target, max_backups=4)
+
+    assert not target.exists()
+    assert (tmp_path / "out.bak1").read_text() == "new"
+    assert (tmp_path / "out.bak2").read_text() == "b1"
+    assert not (tmp_path / "out.bak3").exists()
+    assert (tmp_path / "out.bak4").read_text() == "b3"
+    assert (tmp_path / "out.bak03").read_text() == "other"
+
+
+@pytest.mark.parametrize("dxfversion", ["R2000", "R2018"])
+def test_save_matches_ezdxf_saveas(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, dxfversion: str
+) -> None:
+    import ezdxf
+
+    # Pin the timestamps and GUIDs ezdxf rewrites on every save
+    monkeypatch.setattr(
+        ezdxf.options, "write_fixed_meta_data_for_testing", True
+    )
+    doc = ezdxf.new(dxfversion)
+    doc.modelspace().add_text("Žuta čaša")
+    builder = Builder(DummyMapsys())  # type: ignore[arg-type]
+
+    ours = tmp_path / "ours.dxf"
+    builder.save(doc, ours)
+    reference = tmp_path / "reference.dxf"
+    doc.saveas(reference)
+
+    ours_lines = ours.read_bytes().splitlines()
+    assert ours_lines == reference.read_bytes().splitlines()
+    text = "Žuta čaša".encode(doc.output_encoding, errors="dxfreplace")
+    assert text in ours_lines
+
+
+def test_simplify_vertices(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    # Duplicates and collinear points go, corners stay
+    line = [(0.0, 0.0), (0.0, 0.0), (1.0, 0.0), (2.0, 0.01), (2.0, 2.0)]
+    assert _simplify_vertices(line, 0.1) == [
+        (0.0, 0.0),
+        (2.0, 0.01),
+        (2.0, 2.0),
+    ]
+    assert _simplify_vertices(line, 0.0) == line[1:]
+
+    # Closed rings stay closed and are not collapsed
+    ring = [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0), (0.0, 0.0)]
+    assert _simplify_vertices(ring, 0.1) == ring
+    assert _simplify_vertices(ring, 10.0) == ring
+
+    # A polyline on a single spot collapses to one vertex
+    assert _simplify_vertices([(1.0, 1.0)] * 3, 0.1) == [(1.0, 1.0)]
+
+    # Builder applies the tolerance to exported polylines
+    mapsys = DummyMapsys()
+    mapsys.p_meta = [dataclasses.replace(mapsys.p_meta[0], vertex_count=3)]
+    mapsys.v_offsets = [0, 0, 1]
+    builder = Builder(mapsys, simplify_tolerance=0.0)  # type: ignore[arg-type]
+    msp = builder.to_dxf(_make_minimal_template(tmp_path)).modelspace()
+    assert [line.dxf.count for line in msp.query("LWPOLYLINE")] == [2]
+
+    # ...and skips polylines that collapse to a single vertex
+    mapsys.v_offsets = [0, 0, 0]
+    with caplog.at_level("WARNING"):
+        msp = builder.to_dxf(_make_minimal_template(tmp_path)).modelspace()
+    assert len(msp.query("LWPOLYLINE")) == 0
+    assert "fewer than 2 distinct vertices" in caplog.text
+
+
+def test_missing_point_attdef_is_reported(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    import ezdxf
+
+    doc = ezdxf.new(setup=True)
+    doc.blocks.new("Point").add_attdef("NAME", insert=(0, 0), height=0.2)
+    template = tmp_path / "template.dxf"
+    doc.saveas(template.as_posix())
+
+    with caplog.at_level("WARNING", logger="mapsys.dxf.to_dxf"):
+        Builder.convert(DummyMapsys(), template)  # type: ignore[arg-type]
+
+    missing = {r.args[0] for r in caplog.records if isinstance(r.args, tuple)}
+    assert missing == {"SOURCE", "Z"}
+
+
+def test_zoom_uses_content_coordinates(tmp_path: Path) -> None:
+    mapsys = DummyMapsys()
+    mapsys.t_meta = [dataclasses.replace(mapsys.t_meta[0], east=3.0)]
+    doc = Builder.convert(
+        mapsys,  # type: ignore[arg-type]
+        _make_minimal_template(tmp_path),
+    )
+
+    # Points span (0, 0)-(1, 1) and the text moves the right edge to 3
+    vport = doc.viewports.get_config("*Active")[0]
+    assert (vport.dxf.center.x, vport.dxf.center.y) == (1.5, 0.5)
+    assert vport.dxf.height == pytest.approx(1.5)
+
+
+def test_zoom_pads_content_at_a_single_spot(tmp_path: Path) -> None:
+    mapsys = DummyMapsys()
+    mapsys.points = mapsys.points[:1]
+    mapsys.p_meta = []
+    mapsys.t_meta = [
+        dataclasses.replace(mapsys.t_meta[0], east=0.0, north=0.0)
+    ]
+    doc = Builder.convert(
+        mapsys,  # type: ignore[arg-type]
+        _make_minimal_template(tmp_path),
+    )
+
+    # A point and a text at the origin still give a visible view
+    vport = doc.viewports.get_config("*Active")[0]
+    assert (vport.dxf.center.x, vport.dxf.center.y) == (0.0, 0.0)
+    assert vport.dxf.height == pytest.approx(ATTRIB_HEIGHT)
@@ -3,16 +3,24 @@
 from __future__ import annotations
 
 import struct
+from pathlib import Path
 from typing import List
 
 import pytest
 
-from mapsys.parser.ts5_text_store import Ts5Header, parse_ts5
+from mapsys.parser.ts5_text_store import (
+    Ts5Header,
+    parse_ts5,
+    parse_ts5_columns,
+    parse_ts5_path,
+)
+
+# Header: signature, 4x u32, pad u8
+_HDR = struct.Struct("<4s4IB")
 
 
 def _build_ts5_bytes(strings: List[bytes]) -> bytes:
-    # Header: signature, 4x u32, pad u8
-    header = struct.pack("<4s4IB", b"VA50", 1, 2, 3, 4, 0)
+    header = _HDR.pack(b"VA50", 1, 2, 3, 4, 0)
 
     # Payload: NUL-terminated byte strings
     payload = b"".join(s + b"\x00" for s in strings)
@@ -48,7 +56,7 @@ def test_parse_ts5_with_strings_and_offsets() -> None:
 
 def test_parse_ts5_invalid_signature_raises() -> None:
     # Build a header with an invalid signature and no payload
-    bad_header = struct.pack("<4s4IB", b"VA50", 0, 0, 0, 0, 0)
+    bad_header = _HDR.pack(b"VA50", 0, 0, 0, 0, 0)
     with pytest.raises(ValueError):
         parse_ts5(bad_header)
 
@@ -57,3 +65,37 @@ def test_parse_ts5_too_small_buffer_raises() -> None:
     # Smaller than the header size
     with pytest.raises(ValueError):
         parse_ts5(b"\x00\x01")
+
+
+def test_parse_ts5_columns_match_records() -> None:
+    data = _build_ts5_bytes([b"Alpha", b"", "Ţară".encode("windows-1250")])
+
+    _, texts = parse_ts5(data)
+    _, (offsets, strings) = parse_ts5_columns(data)
+
+    assert offsets == [t.offset for t in texts]
+    assert strings == [t.text for t in texts]
+
+
+def test_parse_ts5_unterminated_tail_and_bad_bytes() -> None:
+    # The last string has no NUL; the first is not valid Windows-1250
+    data = _build_ts5_bytes([b"a\x81b"]) + b"tail"
+
+    _, (offsets, strings) = parse_ts5_columns(data)
+    assert offsets == [0, 4]
+    assert strings == ["a\ufffdb", "tail"]
+
+
+def test_parse_ts5_path_reads_mapped_file(tmp_path: Path) -> None:
+    path = tmp_path / "MAIN.TS5"
+    path.write_bytes(_build_ts5_bytes([b"one", b"two"]))
+
+    header, texts = parse_ts5_path(path)
+    assert header.int1 == (1, 2, 3, 4)
+    assert [(t.offset, t.text) for t in texts] == [(0, "one"), (4, "two")]
+
+    # Empty files are reported by the parser, not by mmap
+    empty = tmp_path / "EMPTY.TS5"
+    empty.write_bytes(b"")
+    with pytest.raises(ValueError):
+        parse_ts5_path(empty)
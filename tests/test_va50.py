@@ -0,0 +1,99 @@
+"""Checks shared by all VA50 table parsers."""
+
+from __future__ import annotations
+
+import dataclasses
+import inspect
+from types import ModuleType
+from typing import Any, Callable
+
+import pytest
+
+from mapsys.parser import (
+    al5_poly_layer,
+    ar5_polys,
+    as5_vertices,
+    n05_points,
+    pr5_main,
+    te5_text_meta,
+    ts5_text_store,
+)
+from tests.test_al5_poly_layer import _build_al5_bytes
+from tests.test_ar5_polys import _build_ar5_bytes
+from tests.test_as5_vertices import _build_as5_bytes
+from tests.test_n05_points import _build_no5_bytes
+from tests.test_te5_text_meta import _build_te5_bytes
+from tests.test_ts5_text_store import _build_ts5_bytes
+
+_PARSER_MODULES = [
+    al5_poly_layer,
+    ar5_polys,
+    as5_vertices,
+    n05_points,
+    pr5_main,
+    te5_text_meta,
+    ts5_text_store,
+]
+
+
+@pytest.mark.parametrize(
+    ("parse", "data"),
+    [
+        pytest.param(
+            al5_poly_layer.parse_al5,
+            _build_al5_bytes(records=[(1, 4, 0)]),
+            id="al5",
+        ),
+        pytest.param(
+            ar5_polys.parse_ar5,
+            _build_ar5_bytes(records=[(0, 10, 20, 0, 100, 7, 111, 2, 222, 1)]),
+            id="ar5",
+        ),
+        pytest.param(
+            as5_vertices.parse_as5,
+            _build_as5_bytes(offset_values=[0, 4, 8]),
+            id="as5",
+        ),
+        pytest.param(
+            n05_points.parse_no5,
+            _build_no5_bytes(
+                records=[(16, 1001, 2, 10, 123.5, 456.25, 7.75, 9999, 1)]
+            ),
+            id="no5",
+        ),
+        pytest.param(
+            te5_text_meta.parse_te5,
+            _build_te5_bytes(
+                records=[
+                    (0, 7, 1, 0, 0, 1.0, 0.0, 5.0, 6.0, 0.0, 0.0, 0.0, 0, 2)
+                ]
+            ),
+            id="te5",
+        ),
+        pytest.param(
+            ts5_text_store.parse_ts5,
+            _build_ts5_bytes([b"hello", b"", b"world"]),
+            id="ts5",
+        ),
+    ],
+)
+def test_parsers_accept_memoryview_slices(
+    parse: Callable[[Any], Any], data: bytes
+) -> None:
+    # A view into a larger buffer parses without copying the payload out
+    view = memoryview(bytearray(b"junk" + data))[4:]
+    assert parse(view) == parse(data)
+
+
+@pytest.mark.parametrize(
+    "module", _PARSER_MODULES, ids=lambda m: m.__name__.rsplit(".", 1)[-1]
+)
+def test_parsed_records_are_slotted(module: ModuleType) -> None:
+    records = [
+        cls
+        for _, cls in inspect.getmembers(module, inspect.isclass)
+        if dataclasses.is_dataclass(cls) and cls.__module__ == module.__name__
+    ]
+    assert records
+    for cls in records:
+        assert "__slots__" in cls.__dict__, cls.__name__
@@ -7,9 +7,11 @@ formatting (notably the 3-decimal format for floats).
 
 from __future__ import annotations
 
+from dataclasses import dataclass, fields
+from enum import IntEnum
 from pathlib import Path
 
-from openpyxl import load_workbook
+from openpyxl import Workbook, load_workbook
 
 from mapsys.parser.al5_poly_layer import Al5Data
 from mapsys.parser.ar5_polys import Ar5Data
@@ -17,7 +19,15 @@ from mapsys.parser.content import Content
 from mapsys.parser.n05_points import No5Coord
 from mapsys.parser.te5_text_meta import Te5TextMeta
 from mapsys.parser.ts5_text_store import Ts5Text
-from mapsys.xl import export_to_xlsx, write_dxf_report, write_xlsx_report
+from mapsys.xl import (
+    _flattened_rows,
+    _plain_rows,
+    _row_dict_from_obj,
+    _write_table_sheet,
+    export_to_xlsx,
+    write_dxf_report,
+    write_xlsx_report,
+)
 
 
 def _make_min_content(tmp_path: Path) -> Content:
@@ -129,6 +139,107 @@ def test_export_to_xlsx_creates_expected_sheets_and_columns(
     assert "count" in flat
 
 
+def test_row_dict_from_obj_flattens_nested_and_flat_rows() -> None:
+    @dataclass
+    class Inner:
+        a: int
+        b: bytes
+
+    @dataclass
+    class Outer:
+        name: str
+        inner: Inner
+        pad: tuple[int, ...]
+
+    # Flat rows take the direct path and keep field order
+    coord = No5Coord(16, 1, 2, 3, 1.5, 2.5, 0.25, 9, 0)
+    row = _row_dict_from_obj(4, coord)
+    assert list(row) == ["idx"] + [f.name for f in fields(No5Coord)]
+    assert row["east"] == 1.5
+
+    # Primitive rows, including bytes and int subclasses
+    class Kind(IntEnum):
+        A = 3
+
+    assert _row_dict_from_obj(1, 7) == {"idx": 1, "value": 7}
+    assert _row_dict_from_obj(2, b"\xab") == {"idx": 2, "value": "ab"}
+    assert _row_dict_from_obj(3, Kind.A) == {"idx": 3, "value": Kind.A}
+
+    # Nested values are still flattened
+    row = _row_dict_from_obj(0, Outer("x", Inner(1, b"\x0f"), (7, 8)))
+    assert row == {
+        "idx": 0,
+        "name": "x",
+        "inner_a": 1,
+        "inner_b": "0f",
+        "pad_0": 7,
+        "pad_1": 8,
+    }
+
+
+def test_write_table_sheet_streams_like_flattened_rows(
+    tmp_path: Path,
+) -> None:
+    @dataclass
+    class Pair:
+        left: int
+        right: tuple[int, int]
+
+    points = [
+        No5Coord(16, 1, 2, 3, 1.5, 2.5, 0.25, 9, 0),
+        No5Coord(16, 2, 4, 3, -1.0, 512345.6789012, 7.75, 10, 1),
+    ]
+
+    # Plain rows are collected exactly like the dict-based rows
+    plain = _plain_rows("NO5_points", points)
+    assert plain is not None
+    flat = _flattened_rows("NO5_points", points)
+    assert plain.columns == flat.columns
+    assert list(map(list, plain.rows)) == flat.rows
+    assert plain.float_columns == flat.float_columns == {"east", "north", "z"}
+    assert plain.widths == flat.widths
+    assert _plain_rows("pairs", [Pair(1, (2, 3))]) is None
+
+    wb = Workbook(write_only=True)
+    _write_table_sheet(wb, "NO5_points", points)
+    _write_table_sheet(wb, "pairs", [Pair(1, (2, 3))])
+    out = tmp_path / "tables.xlsx"
+    wb.save(out)
+
+    loaded = load_workbook(out)
+    assert loaded.sheetnames == ["NO5_points", "pairs"]
+    ws = loaded["NO5_points"]
+    assert list(ws.values)[0][:4] == ("idx", "pt_nr", "north", "east")
+    assert list(ws.values)[2][:4] == (1, 3, 512345.6789012, -1.0)
+    assert [c.number_format for c in ws["D"][1:]] == ["0.000", "0.000"]
+    assert ws["B2"].number_format == "General"
+    assert ws.column_dimensions["C"].width == 16
+    assert ws.tables["Tbl_NO5_points"].ref == "A1:J3"
+    columns = ws.tables["Tbl_NO5_points"].tableColumns
+    assert [c.name for c in columns] == plain.columns
+
+    # Nested rows are flattened
+    assert list(loaded["pairs"].values) == [
+        ("idx", "left", "right_0", "right_1"),
+        (0, 1, 2, 3),
+    ]
+
+
+def test_plain_rows_detect_floats_after_the_first_row() -> None:
+    @dataclass
+    class Point:
+        east: float
+        z: int | float | None
+
+    # ``z`` holds an int first, then None, then a float
+    points = [Point(1.0, 2), Point(1.5, None), Point(2.0, 2.5)]
+
+    plain = _plain_rows("points", points)
+    assert plain is not None
+    flat = _flattened_rows("points", points)
+    assert plain.float_columns == flat.float_columns == {"east", "z"}
+
+
 class TestWriteDxfReport:
     """Tests for write_dxf_report."""
 